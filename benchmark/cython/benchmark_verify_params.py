@@ -18,9 +18,8 @@ def test_cython():
 
 
 vm = VM(None)
-vm.loose_pos = [0, 0]
 
-args_list = [Arg(Int(-1, -1, 0))]
+args_list = [Arg(Int(0))]
 params_list = [Param('x', 'int')]
 
 python_time = test_python()
@@ -31,7 +31,7 @@ class Benchmarker:
             if isinstance(arg, VM):
                 arg_str.append('VM(None)')
             elif isinstance(arg, Int):
-                arg_str.append(f'Int({arg.line}, {arg.column}, {arg.value})')
+                arg_str.append(f'Int({arg.value})')
             else:
                 arg_str.append(arg.__str__())
         
@@ -69,9 +69,8 @@ def benchmark() -> None:
     )
     
     vm = VM(None)
-    vm.loose_pos = [0, 0]
     
-    args = [Arg(Int(0, 0, 5000))]
+    args = [Arg(Int(5000))]
     params = [Param('x', 'int')]
     
     benchmarker.benchmark(vm, args, params)
@@ -20,23 +20,40 @@ from pathlib import Path
 
 from sapling.constants import __version__
 from sapling.parser import parse
+from sapling.optimizer import optimize
 from sapling.codes import Code
+from sapling.cache import get_code
 from sapling.lexer import lex
 from sapling.vm import VM
+from sapling.py_compiler import generate_module
+from sapling.compiler import compile_code, disassemble_all
 
 
 @dataclass(slots=True)
 class Configuration:
     src: str | None
     compile_to_file: bool
+    engine: str = 'bytecode'
+    emit_py: bool = False
+    inline: bool = True
+    dump: bool = False
+    cache: bool = True
 
 
 def get_file_bytecode(fp: Path, config: Configuration) -> Code:
     src = fp.read_text('utf-8')
-    
-    tokens = lex(src)
-    
-    bytecode = parse(tokens)
+
+    if config.dump:
+        # The inlined calls are only known when the file is optimized, so it isn't cached
+        inlined = []
+        bytecode = optimize(parse(lex(src)), config.inline, inlined)
+
+        for name, line, column in inlined:
+            print(f'Inlined call of {name} at {line}:{column}')
+
+        print(disassemble_all(compile_code(bytecode)))
+    else:
+        bytecode = get_code(fp, src, config.inline, config.cache)
     
     if config.compile_to_file:
         fp.with_suffix('.sapped').write_bytes(dumps(bytecode, HIGHEST_PROTOCOL))
@@ -46,9 +63,9 @@ def get_file_bytecode(fp: Path, config: Configuration) -> Code:
 
 def get_bytecode(fp: Path, config: Configuration) -> Code:
     if fp.suffix == '.sapped':
-        return loads(fp.read_bytes())
+        bytecode = loads(fp.read_bytes())
     elif fp.suffix == '.sap':
-        return get_file_bytecode(fp, config)
+        bytecode = get_file_bytecode(fp, config)
     elif not fp.exists():
         print(f'File \'{fp}\' not found')
         sys_exit(1)
@@ -56,9 +73,14 @@ def get_bytecode(fp: Path, config: Configuration) -> Code:
         print(f'Expected file suffix .sap or .sapped, not {fp.suffix}')
         sys_exit(1)
 
+    if config.emit_py:
+        fp.with_suffix('.py').write_text(generate_module(bytecode, fp.stem), 'utf-8')
+
+    return bytecode
+
 
 def run_vm(bc: Code, config: Configuration) -> None:
-    vm = VM(config.src)
+    vm = VM(config.src, engine=config.engine, cache=config.cache, inline=config.inline)
     vm.run(bc)
 
 
@@ -78,12 +100,16 @@ def main(arguments: Namespace) -> None:
         sys_exit(0)
 
     if not arguments.file.is_file():
-        config = Configuration(None, arguments.compile)
+        src = None
+    elif arguments.file.suffix == '.sapped':
+        src = arguments.file.read_bytes()
     else:
-        if arguments.file.suffix == '.sapped':
-            config = Configuration(arguments.file.read_bytes(), arguments.compile)
-        else:
-            config = Configuration(arguments.file.read_text(), arguments.compile)
+        src = arguments.file.read_text()
+
+    config = Configuration(
+        src, arguments.compile, arguments.engine, arguments.emit_py, not arguments.no_inline,
+        arguments.dump, not arguments.no_cache
+    )
 
     start_time = perf_counter()
 
@@ -111,6 +137,16 @@ if __name__ == '__main__':
                             help='Print the version number and exit')
     arg_parser.add_argument('-r', '--recursive', action='store_true',
                             help='For running directories: recursively loop through the files in a directory')
+    arg_parser.add_argument('-e', '--engine', choices=VM.engines, default='bytecode',
+                            help='The engine used to execute the code')
+    arg_parser.add_argument('--emit-py', action='store_true',
+                            help='Write the code translated to a Python module next to the file')
+    arg_parser.add_argument('--no-inline', action='store_true',
+                            help='Don\'t inline the calls of small functions')
+    arg_parser.add_argument('--dump', action='store_true',
+                            help='Print the calls inlined and the disassembled bytecode')
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help='Don\'t read or write the parsed code of files in __sapcache__')
     # arg_parser.add_argument('-atests', '--run-all-tests', action='store_true',
     #                         help='Run anything possible, will take a very long time')
 
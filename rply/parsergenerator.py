@@ -147,7 +147,7 @@ class ParserGenerator(object):
                 return False
         return True
 
-    def build(self):
+    def build_grammar(self):
         g = Grammar(self.tokens)
 
         for level, (assoc, terms) in enumerate(self.precedence, 1):
@@ -158,6 +158,10 @@ class ParserGenerator(object):
             g.add_production(prod_name, syms, func, precedence)
 
         g.set_start()
+        return g
+
+    def build(self):
+        g = self.build_grammar()
 
         for unused_term in g.unused_terminals():
             warnings.warn(
@@ -0,0 +1,141 @@
+"""
+cache.py
+--------
+
+The cache of the parsed code of files, kept in a __sapcache__ directory next to them like Python's
+__pycache__. An entry is named after its file, whether calls were inlined and a hash of the
+source, the Sapling version and the source of the modules making the code, so an unchanged file
+is loaded from its entry without being lexed, parsed or optimized, and a change to any of them
+misses the cache. Entries are written to
+a temporary file which then replaces the entry, so a run never reads a half written one, and the
+older entries of the file made with the same inlining are removed, a file keeps an entry with
+calls inlined and one without.
+
+The cache is only a speedup: a directory that can't be written to or an entry that can't be read
+is treated as a miss.
+"""
+
+from pickle import dumps, loads, HIGHEST_PROTOCOL, PicklingError
+from functools import cache
+from tempfile import mkstemp
+from hashlib import sha256
+from pathlib import Path
+from os import replace
+
+from sapling.constants import __version__
+from sapling.optimizer import optimize
+from sapling.parser import parse
+from sapling.lexer import lex
+from sapling.codes import Code
+
+
+CACHE_DIR = '__sapcache__'
+ENTRY_SUFFIX = '.sapped'
+
+# The modules the code in an entry is made by, changing any of them changes the code a file gives
+MAKERS = (
+    'constants', 'lexer', 'parsetable', 'parser', 'codes', 'opcodes', 'objects', 'resolver',
+    'optimizer'
+)
+
+
+@cache
+def makers_digest() -> str:
+    """Hashes the source of the modules making the code, a module without its source (in a
+    frozen build) only changes with the version"""
+
+    digest = sha256()
+    for name in MAKERS:
+        try:
+            digest.update((Path(__file__).parent / f'{name}.py').read_bytes())
+        except OSError:
+            digest.update(name.encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+def entry_path(fp: Path, src: str, inline: bool) -> Path:
+    """Gets the path of the entry of a file
+
+    Args:
+        fp (Path): The path of the file
+        src (str): The source code of the file
+        inline (bool): Whether calls of small functions are inlined
+
+    Returns:
+        Path: The path, in the cache directory next to the file
+    """
+
+    key = sha256(f'{__version__}\0{makers_digest()}\0{src}'.encode('utf-8')).hexdigest()[:16]
+    mode = 'inline' if inline else 'noinline'
+    return fp.parent / CACHE_DIR / f'{fp.stem}.{mode}.{key}{ENTRY_SUFFIX}'
+
+
+def load_entry(path: Path) -> Code | None:
+    """Loads an entry, None if there isn't one or it's broken"""
+
+    try:
+        code = loads(path.read_bytes())
+    except Exception:
+        # Unpickling a broken entry can raise nearly anything
+        return None
+
+    return code if isinstance(code, Code) else None
+
+
+def remove_stale(path: Path) -> None:
+    """Removes the entries of the file of an entry made with the same inlining from other
+    sources or by other versions"""
+
+    stem, mode, _, _ = path.name.rsplit('.', 3)
+    for entry in path.parent.glob(f'*{ENTRY_SUFFIX}'):
+        if entry != path and entry.name.rsplit('.', 3)[:2] == [stem, mode]:
+            entry.unlink(missing_ok=True)
+
+
+def store_entry(path: Path, code: Code) -> None:
+    """Writes an entry, replacing the stale ones of its file"""
+
+    try:
+        data = dumps(code, HIGHEST_PROTOCOL)
+    except (PicklingError, TypeError, AttributeError):
+        return
+
+    temp = None
+    try:
+        path.parent.mkdir(exist_ok=True)
+        fd, temp = mkstemp(ENTRY_SUFFIX + '.tmp', path.name, path.parent)
+        with open(fd, 'wb') as f:
+            f.write(data)
+
+        replace(temp, path)
+        remove_stale(path)
+    except OSError:
+        if temp is not None:
+            Path(temp).unlink(missing_ok=True)
+
+
+def get_code(fp: Path, src: str, inline: bool = True, use_cache: bool = True) -> Code:
+    """Gets the optimized code of a file, from the cache if the file hasn't changed since it was
+    stored
+
+    Args:
+        fp (Path): The path of the file
+        src (str): The source code of the file
+        inline (bool, optional): Whether calls of small functions are inlined. Defaults to True.
+        use_cache (bool, optional): Whether the cache is read and written. Defaults to True.
+
+    Returns:
+        Code: The optimized code
+    """
+
+    if not use_cache:
+        return optimize(parse(lex(src)), inline)
+
+    path = entry_path(fp, src, inline)
+    code = load_entry(path)
+    if code is None:
+        code = optimize(parse(lex(src)), inline)
+        store_entry(path, code)
+
+    return code
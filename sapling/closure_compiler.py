@@ -0,0 +1,372 @@
+"""
+closure_compiler.py
+-------------------
+
+Compiles the bytecode tree produced by the parser into pre-bound Python closures.
+Every node becomes a closure taking the VM, its children are already compiled and its
+handler is chosen at compile time, so running a body is just calling a list of closures.
+Closures give ints, floats, strings and bools as raw Python values, they are boxed when they
+leave the compiled code (see sapling.objects.box).
+
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable
+
+import sapling.codes as codes
+from sapling.error import SError, STypeError, SNameError
+from sapling.vmutils import Arg, Returned, operator_error
+from sapling.objects import (
+    Array, Dictionary, Var, box, unbox, truthy, iterate, resolve_operator, attribute_getter
+)
+from sapling.optimizer import to_value
+from sapling.resolver import Scope, FAST, GLOBAL, resolve_module, resolve_function
+
+
+@dataclass(slots=True)
+class ClosureBody:
+    """A block of code compiled into closures"""
+
+    name: str
+    stmts: tuple[Callable] = field(default=())
+    result: Callable | None = field(default=None)
+    varnames: tuple[str] = field(default=())  # The local variables stored in slots
+    positions: dict[Callable, tuple[int, int]] = field(default_factory=dict)  # The line table
+
+    # Whether the block is the body of a function or a module, which a nested return ends
+    outermost: bool = field(default=False)
+
+    def __call__(self, vm):
+        # The arguments stored in slots are moved out of the locals of the frame
+        if self.varnames:
+            frame = vm.frame
+            frame.fast = [frame.locals.pop(name, None) for name in self.varnames]
+
+        stmt = None
+        try:
+            for stmt in self.stmts:
+                stmt(vm)
+
+            if self.result is not None:
+                stmt = self.result
+                return box(stmt(vm))
+        except SError as error:
+            # The position of an error is only looked up from the line table when one is raised
+            if error.pos is None and stmt is not None:
+                error.pos = self.positions[stmt]
+
+            raise
+        except Returned as returned:
+            if not self.outermost:
+                raise
+
+            return returned.value
+
+
+def compile_block(name: str, stmts, mode: str, scope: Scope | None) -> ClosureBody:
+    """Compiles a list of statements
+
+    Args:
+        name (str): The name of the block
+        stmts (list): The statements
+        mode (str): 'module', 'function' or 'body' (the body of an if/while/repeat)
+        scope (Scope | None): The scope of the names in the block, None if they're not resolved
+
+    Returns:
+        ClosureBody: The compiled block
+    """
+
+    compiled = []
+    positions = {}
+    outermost = mode != 'body'
+    for stmt in stmts:
+        if not isinstance(stmt, codes.Return):
+            compiled.append(compile_stmt(stmt, scope))
+            positions[compiled[-1]] = (stmt.line, stmt.column)
+            continue
+
+        value = compile_expr(stmt.value, scope)
+        if outermost:
+            positions[value] = (stmt.line, stmt.column)
+            return ClosureBody(name, tuple(compiled), value, positions=positions, outermost=True)
+
+        # A nested return ends the function (or the module) the body is in
+        def return_value(vm):
+            raise Returned(box(value(vm)))
+
+        compiled.append(return_value)
+        positions[return_value] = (stmt.line, stmt.column)
+        break
+
+    return ClosureBody(name, tuple(compiled), positions=positions, outermost=outermost)
+
+
+def resolve(name: str, scope: Scope | None) -> int | None:
+    return scope.resolve(name) if scope is not None else None
+
+
+def compile_stmt(stmt, scope: Scope | None) -> Callable:
+    match stmt:
+        case codes.Assign() if resolve(stmt.name, scope) == FAST:
+            value = stmt.value
+            if stmt.operation != '':
+                value = codes.BinaryOp(stmt.line, stmt.column, stmt.operation, codes.Id(
+                    stmt.line, stmt.column, stmt.name
+                ), value)
+
+            value, index = compile_expr(value, scope), scope.fast[stmt.name]
+
+            def store_fast(vm):
+                vm.frame.fast[index] = value(vm)
+
+            return store_fast
+        case codes.Assign():
+            value = compile_expr(stmt.value, scope)
+            return lambda vm: vm.assign(stmt, box(value(vm)))
+        case codes.FuncDef():
+            node = stmt._replace(body=compile_function(
+                stmt.name.value, stmt.body, stmt.params, scope
+            ))
+            return lambda vm: vm.execute_func(node)
+        case codes.AttrFuncDef():
+            node = stmt._replace(body=compile_function(
+                f'{stmt.obj}.{stmt.name}', stmt.body, stmt.params, scope
+            ))
+            return lambda vm: vm.execute_attr_func(node)
+        case codes.If():
+            return compile_if(stmt, scope)
+        case codes.While():
+            condition = compile_expr(stmt.condition, scope)
+            body = compile_block('while', stmt.body.stmts, 'body', scope)
+
+            def while_loop(vm):
+                # Comparisons give raw bools, which don't need truthy
+                while (value := condition(vm)) is True or value is not False and truthy(value):
+                    body(vm)
+
+            return while_loop
+        case codes.Repeat():
+            condition = compile_expr(stmt.condition, scope)
+            body = compile_block('repeat', stmt.body.stmts, 'body', scope)
+
+            def repeat_loop(vm):
+                while (value := condition(vm)) is False or value is not True and not truthy(value):
+                    body(vm)
+
+            return repeat_loop
+        case codes.For() if resolve(stmt.ident, scope) == FAST:
+            iterable, index = compile_expr(stmt.iterable, scope), scope.fast[stmt.ident]
+            body = compile_block('for', stmt.body.stmts, 'body', scope)
+
+            def for_loop_fast(vm):
+                fast = vm.frame.fast
+                for value in iterate(vm, iterable(vm)):
+                    fast[index] = unbox(value)
+                    body(vm)
+
+            return for_loop_fast
+        case codes.For():
+            iterable = compile_expr(stmt.iterable, scope)
+            body = compile_block('for', stmt.body.stmts, 'body', scope)
+            binding = codes.Assign(stmt.line, stmt.column, stmt.ident, None, False, '', 'any')
+
+            def for_loop(vm):
+                for value in iterate(vm, iterable(vm)):
+                    vm.assign(binding, value)
+                    body(vm)
+
+            return for_loop
+        case _:
+            return compile_expr(stmt, scope)
+
+
+def compile_if(stmt: codes.If, scope: Scope | None) -> Callable:
+    branches = [(stmt.condition, stmt.then)]
+    if stmt.elseif_chain is not None:
+        branches += stmt.elseif_chain
+
+    branches = tuple(
+        (compile_expr(condition, scope), compile_block('if', body.stmts, 'body', scope))
+        for condition, body in branches
+    )
+    otherwise = compile_block('else', stmt.otherwise.stmts, 'body', scope)\
+        if stmt.otherwise is not None else None
+
+    def if_stmt(vm):
+        for condition, body in branches:
+            if truthy(condition(vm)):
+                body(vm)
+                return
+
+        if otherwise is not None:
+            otherwise(vm)
+
+    return if_stmt
+
+
+def compile_literal(expr) -> Callable:
+    # The value is made once when compiling, evaluating the literal gives the same value
+    const = to_value(expr)
+    return lambda _: const
+
+
+def compile_expr(expr, scope: Scope | None) -> Callable:
+    match expr:
+        case codes.Id(value=name) if resolve(name, scope) == FAST:
+            pos, index = [expr.line, expr.column], scope.fast[name]
+
+            def load_fast(vm):
+                value = vm.frame.fast[index]
+                if value is None:
+                    # Not assigned yet, so the name may still be bound in an enclosing scope
+                    value = vm.lookup(name)
+                    if value is None:
+                        vm.error(SNameError(name, pos))
+
+                    value = value.value if value.__class__ is Var else value
+
+                return value
+
+            return load_fast
+        case codes.Id(value=name) if resolve(name, scope) == GLOBAL:
+            pos = [expr.line, expr.column]
+
+            def load_global(vm):
+                value = vm.globals.get(name)
+                if value is None:
+                    value = vm.lookup(name)
+                    if value is None:
+                        vm.error(SNameError(name, pos))
+
+                return value.value if value.__class__ is Var else value
+
+            return load_global
+        case codes.Id(value=name):
+            pos = [expr.line, expr.column]
+
+            def load_name(vm):
+                value = vm.env.get(name)
+                if value is None:
+                    value = vm.lookup(name)
+                    if value is None:
+                        vm.error(SNameError(name, pos))
+
+                return value.value if value.__class__ is Var else value
+
+            return load_name
+        case codes.Int() | codes.Float() | codes.String() | codes.Bool() | codes.Nil() |\
+                codes.Hex() | codes.Regex():
+            return compile_literal(expr)
+        case codes.BinaryOp():
+            return compile_binaryop(expr, scope)
+        case codes.Call():
+            func = compile_expr(expr.func, scope)
+            args = tuple(
+                (compile_expr(arg.value, scope), arg.name)
+                for arg in (expr.args.args if expr.args else [])
+            )
+            pos = [expr.line, expr.column]
+
+            def call(vm):
+                f = box(func(vm))
+                values = [Arg(box(value(vm)), name) for value, name in args]
+                try:
+                    return vm.call(f, values)
+                except SError as error:
+                    if error.pos is None:
+                        error.pos = pos
+
+                    raise
+
+            return call
+        case codes.Attribute():
+            base = compile_expr(expr.base, scope)
+            get = attribute_getter(expr.attr, expr.null_safe, [expr.line, expr.column])
+            return lambda vm: get(vm, base(vm))
+        case codes.Index():
+            value, item = compile_expr(expr.expr, scope), compile_expr(expr.item, scope)
+            return lambda vm: vm.index(box(value(vm)), box(item(vm)))
+        case codes.Array():
+            values = tuple(compile_expr(arg.value, scope) for arg in expr.value)
+            return lambda vm: Array([box(value(vm)) for value in values])
+        case codes.Dictionary():
+            items = tuple(
+                (compile_expr(key, scope), compile_expr(value, scope))
+                for key, value in expr.value.items()
+            )
+            return lambda vm: Dictionary({
+                box(key(vm)): box(value(vm)) for key, value in items
+            })
+        case _:
+            # Anything without its own closure is run by the tree walking handlers
+            return lambda vm: vm.execute(expr)
+
+
+def compile_binaryop(expr: codes.BinaryOp, scope: Scope | None) -> Callable:
+    left, right = compile_expr(expr.left, scope), compile_expr(expr.right, scope)
+    op, pos = expr.op, [expr.line, expr.column]
+
+    # The implementation for the classes of the operands it was last run with
+    left_cls = right_cls = operator = None
+
+    def binary_op(vm):
+        nonlocal left_cls, right_cls, operator
+        lhs = left(vm)
+        rhs = right(vm)
+
+        if lhs.__class__ is not left_cls or rhs.__class__ is not right_cls:
+            left_cls, right_cls = lhs.__class__, rhs.__class__
+            operator = resolve_operator(op, left_cls, right_cls)
+
+        try:
+            out = operator(lhs, rhs)
+        except TypeError:
+            out = None
+        except ZeroDivisionError:
+            vm.error(STypeError('Cannot divide by zero', pos))
+
+        if out is None:
+            operator_error(vm, lhs, op, rhs, pos)
+
+        return out
+
+    return binary_op
+
+
+def compile_code(code: codes.Code) -> ClosureBody:
+    """Compiles the parsed code of a file
+
+    Args:
+        code (codes.Code): The parsed code
+
+    Returns:
+        ClosureBody: The compiled module code
+    """
+
+    return compile_block('<module>', code.stmts, 'module', resolve_module(code.stmts))
+
+
+def compile_function(name: str, body: codes.Body, params=(), parent: Scope | None = None) -> ClosureBody:
+    """Compiles the body of a function
+
+    Args:
+        name (str): The name of the function
+        body (codes.Body): The body of the function
+        params (codes.Params, optional): The parameters of the function. Defaults to ().
+        parent (Scope | None, optional): The scope the function is defined in, its names are
+            only resolved at compile time if given. Defaults to None.
+
+    Returns:
+        ClosureBody: The compiled function body
+    """
+
+    if parent is None:
+        return compile_block(name, body.stmts, 'function', None)
+
+    scope = resolve_function(
+        [param.name for param in params.params] if params else [], body.stmts, parent
+    )
+
+    compiled = compile_block(name, body.stmts, 'function', scope)
+    compiled.varnames = tuple(scope.fast)
+    return compiled
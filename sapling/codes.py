@@ -59,5 +59,6 @@ EnumDefinition = namedtuple('EnumDefinition', ['line', 'column', 'name', 'value'
 If = namedtuple('If', ['line', 'column', 'condition', 'then', 'otherwise', 'elseif_chain'])
 Repeat = namedtuple('Repeat', ['line', 'column', 'body', 'condition'])
 While = namedtuple('While', ['line', 'column', 'condition', 'body'])
+For = namedtuple('For', ['line', 'column', 'ident', 'iterable', 'body'])
 Return = namedtuple('Return', ['line', 'column', 'value'])
 Import = namedtuple('Import', ['line', 'column', 'name', 'from_'])
@@ -0,0 +1,345 @@
+"""
+compiler.py
+-----------
+
+Compiles the bytecode tree produced by the parser into linear bytecode (a CodeObject)
+that the VM runs in a single dispatch loop
+
+"""
+
+from dataclasses import dataclass, field
+
+import sapling.codes as codes
+from sapling.opcodes import *
+from sapling.optimizer import to_value
+from sapling.resolver import Scope, FAST, GLOBAL, resolve_module, resolve_function
+
+
+# A generic instruction tries to specialise itself once it has run this many times. If it can't,
+# or its specialised form stops matching its operands, it waits as long again.
+QUICKEN_AFTER = 16
+
+# The number of entries in the inline cache of each instruction that has one. The first entry
+# counts down the runs left before the instruction tries to specialise itself.
+cache_sizes = {BINARY_OP: 4, INDEX: 1, LOAD_ATTR: 3, CALL: 4}
+
+
+def show_const(const) -> str:
+    """Shows a constant an instruction uses in a disassembly: the value of a literal, the names
+    of the arguments of a call, the name an assignment stores and the kind of a node run by
+    the tree walking handlers"""
+
+    match const:
+        case codes.Assign():
+            return const.name
+        case codes.FuncDef():
+            return f'FuncDef {const.name.value}'
+        case tuple() if hasattr(const, '_fields'):
+            return type(const).__name__
+        case _ if hasattr(const, 'repr'):
+            return const.repr(None)
+
+    return repr(const)
+
+
+@dataclass(slots=True)
+class CodeObject:
+    """A flat block of compiled Sapling bytecode"""
+
+    name: str
+    instructions: list[tuple[int, int]] = field(default_factory=list)
+    consts: list = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    positions: list[tuple[int, int]] = field(default_factory=list)  # The line table
+    varnames: list[str] = field(default_factory=list)  # The local variables stored in slots
+
+    # The inline cache of each instruction. BINARY_OP keeps the classes of the operands it was
+    # last run with and the implementation of the operator for them, LOAD_ATTR the version of the
+    # Class or Lib and the value LOAD_ATTR_CLASS gives, or the class and the way to get the
+    # attribute for LOAD_ATTR_BUILTIN, and CALL the body and the parameter names of the
+    # function CALL_FUNC was specialised for, with the index and class of each argument given
+    # to an annotated parameter.
+    caches: list[list | None] = field(default_factory=list)
+
+    def disassemble(self) -> str:
+        """Gets a human readable listing of the instructions
+
+        Returns:
+            str: One line per instruction
+        """
+
+        lines = []
+        for i, (op, arg) in enumerate(self.instructions):
+            line = f'{self.positions[i][0]:>5} {i:>5} {opnames[op]:<20} {arg}'
+
+            # A specialised instruction has the argument of the one it was specialised from
+            op = generic_ops.get(op, op)
+            if op in {LOAD_NAME, LOAD_GLOBAL, LOAD_ATTR, LOAD_ATTR_NULL_SAFE}:
+                line += f' ({self.names[arg]})'
+            elif op in {LOAD_FAST, STORE_FAST}:
+                line += f' ({self.varnames[arg]})'
+            elif op == BINARY_OP:
+                line += f' ({binary_operators[arg]})'
+            elif op in {LOAD_CONST, CALL, STORE_NAME, EVAL_NODE, EXEC_NODE}:
+                line += f' ({show_const(self.consts[arg])})'
+
+            lines.append(line)
+
+        return '\n'.join(lines)
+
+
+class Compiler:
+    """Compiles one block of code (a module or a function body) into a CodeObject"""
+
+    literals = (
+        codes.Int, codes.Float, codes.String, codes.Bool, codes.Nil, codes.Regex, codes.Hex
+    )
+
+    def __init__(self, name: str, scope: Scope | None = None):
+        self.code = CodeObject(name)
+        self.name_indexes = {}
+        self.literal_indexes = {}
+        self.scope = scope
+
+        if scope is not None:
+            self.code.varnames = list(scope.fast)
+
+    def resolve(self, name: str) -> int | None:
+        return self.scope.resolve(name) if self.scope is not None else None
+
+    def emit(self, op: int, arg: int, node) -> int:
+        self.code.instructions.append((op, arg))
+        self.code.positions.append((node.line, node.column))
+        size = cache_sizes.get(op)
+        self.code.caches.append([QUICKEN_AFTER] + [None] * (size - 1) if size else None)
+        return len(self.code.instructions) - 1
+
+    def patch(self, index: int) -> None:
+        """Points the jump at the index to the next instruction to be emitted"""
+
+        op, _ = self.code.instructions[index]
+        self.code.instructions[index] = (op, len(self.code.instructions))
+
+    def add_const(self, value) -> int:
+        self.code.consts.append(value)
+        return len(self.code.consts) - 1
+
+    def add_literal(self, node) -> int:
+        """Adds the value a literal evaluates to, so it is only made once for the code object"""
+
+        # Values don't hold positions, so equal literals share an object. The type is part of the
+        # key as different types can be equal and the repr keeps 0.0 apart from -0.0
+        key = (type(node), repr(node[2:]))
+        if key not in self.literal_indexes:
+            self.literal_indexes[key] = self.add_const(to_value(node))
+
+        return self.literal_indexes[key]
+
+    def add_name(self, name: str) -> int:
+        if name not in self.name_indexes:
+            self.name_indexes[name] = len(self.code.names)
+            self.code.names.append(name)
+
+        return self.name_indexes[name]
+
+    def compile_block(self, stmts) -> None:
+        """Compiles a list of statements, of a module, a function or the body of an
+        if/while/repeat"""
+
+        for stmt in stmts:
+            if not isinstance(stmt, codes.Return):
+                self.compile_stmt(stmt)
+                continue
+
+            # A return ends the function the block is in (or the module), wherever it is nested
+            self.compile_expr(stmt.value)
+            self.emit(RETURN_VALUE, 0, stmt)
+            return
+
+    def compile_stmt(self, stmt) -> None:
+        match stmt:
+            case codes.Assign() if self.resolve(stmt.name) == FAST:
+                value = stmt.value
+                if stmt.operation != '':
+                    value = codes.BinaryOp(stmt.line, stmt.column, stmt.operation, codes.Id(
+                        stmt.line, stmt.column, stmt.name
+                    ), value)
+
+                self.compile_expr(value)
+                self.emit(STORE_FAST, self.scope.fast[stmt.name], stmt)
+            case codes.Assign():
+                self.compile_expr(stmt.value)
+                self.emit(STORE_NAME, self.add_const(stmt), stmt)
+            case codes.FuncDef():
+                self.emit(EXEC_NODE, self.add_const(stmt._replace(body=compile_function(
+                    stmt.name.value, stmt.body, stmt.params, self.scope
+                ))), stmt)
+            case codes.AttrFuncDef():
+                self.emit(EXEC_NODE, self.add_const(stmt._replace(body=compile_function(
+                    f'{stmt.obj}.{stmt.name}', stmt.body, stmt.params, self.scope
+                ))), stmt)
+            case codes.If():
+                self.compile_if(stmt)
+            case codes.While():
+                start = len(self.code.instructions)
+                self.compile_expr(stmt.condition)
+                exit_jump = self.emit(POP_JUMP_IF_FALSE, 0, stmt)
+                self.compile_block(stmt.body.stmts)
+                self.emit(JUMP, start, stmt)
+                self.patch(exit_jump)
+            case codes.Repeat():
+                start = len(self.code.instructions)
+                self.compile_expr(stmt.condition)
+                exit_jump = self.emit(POP_JUMP_IF_TRUE, 0, stmt)
+                self.compile_block(stmt.body.stmts)
+                self.emit(JUMP, start, stmt)
+                self.patch(exit_jump)
+            case codes.For():
+                self.compile_expr(stmt.iterable)
+                self.emit(GET_ITER, 0, stmt)
+                start = self.emit(FOR_ITER, 0, stmt)
+                if self.resolve(stmt.ident) == FAST:
+                    self.emit(STORE_FAST, self.scope.fast[stmt.ident], stmt)
+                else:
+                    self.emit(STORE_NAME, self.add_const(codes.Assign(
+                        stmt.line, stmt.column, stmt.ident, None, False, '', 'any'
+                    )), stmt)
+
+                self.compile_block(stmt.body.stmts)
+                self.emit(JUMP, start, stmt)
+                self.patch(start)
+            case codes.Import() | codes.Enum() | codes.Struct():
+                self.emit(EXEC_NODE, self.add_const(stmt), stmt)
+            case _:
+                self.compile_expr(stmt)
+                self.emit(POP_TOP, 0, stmt)
+
+    def compile_if(self, stmt: codes.If) -> None:
+        branches = [(stmt.condition, stmt.then)]
+        if stmt.elseif_chain is not None:
+            branches += stmt.elseif_chain
+
+        end_jumps = []
+        for condition, body in branches:
+            self.compile_expr(condition)
+            next_jump = self.emit(POP_JUMP_IF_FALSE, 0, stmt)
+            self.compile_block(body.stmts)
+            end_jumps.append(self.emit(JUMP, 0, stmt))
+            self.patch(next_jump)
+
+        if stmt.otherwise is not None:
+            self.compile_block(stmt.otherwise.stmts)
+
+        for jump in end_jumps:
+            self.patch(jump)
+
+    def compile_expr(self, expr) -> None:
+        match expr:
+            case codes.Id():
+                kind = self.resolve(expr.value)
+                if kind == FAST:
+                    self.emit(LOAD_FAST, self.scope.fast[expr.value], expr)
+                elif kind == GLOBAL:
+                    self.emit(LOAD_GLOBAL, self.add_name(expr.value), expr)
+                else:
+                    self.emit(LOAD_NAME, self.add_name(expr.value), expr)
+            case _ if isinstance(expr, self.literals):
+                self.emit(LOAD_CONST, self.add_literal(expr), expr)
+            case codes.BinaryOp():
+                self.compile_expr(expr.left)
+                self.compile_expr(expr.right)
+                self.emit(BINARY_OP, binary_operators.index(expr.op), expr)
+            case codes.Call():
+                self.compile_expr(expr.func)
+                args = expr.args.args if expr.args else []
+                for arg in args:
+                    self.compile_expr(arg.value)
+
+                self.emit(CALL, self.add_const(tuple(arg.name for arg in args)), expr)
+            case codes.Attribute():
+                self.compile_expr(expr.base)
+                self.emit(
+                    LOAD_ATTR_NULL_SAFE if expr.null_safe else LOAD_ATTR,
+                    self.add_name(expr.attr),
+                    expr
+                )
+            case codes.Index():
+                self.compile_expr(expr.expr)
+                self.compile_expr(expr.item)
+                self.emit(INDEX, 0, expr)
+            case codes.Array():
+                for arg in expr.value:
+                    self.compile_expr(arg.value)
+
+                self.emit(BUILD_ARRAY, len(expr.value), expr)
+            case codes.Dictionary():
+                for key, value in expr.value.items():
+                    self.compile_expr(key)
+                    self.compile_expr(value)
+
+                self.emit(BUILD_DICT, len(expr.value), expr)
+            case _:
+                # Anything without its own opcode is run by the tree walking handlers
+                self.emit(EVAL_NODE, self.add_const(expr), expr)
+
+
+def disassemble_all(code: CodeObject) -> str:
+    """Gets a human readable listing of a code object and the functions compiled into it
+
+    Args:
+        code (CodeObject): The code object
+
+    Returns:
+        str: The listing of each code object, after a line naming it
+    """
+
+    listings = []
+    pending = [code]
+    while pending:
+        code = pending.pop(0)
+        listings.append(f'Disassembly of {code.name}:\n{code.disassemble()}')
+        pending += [
+            const.body for const in code.consts
+            if isinstance(const, (codes.FuncDef, codes.AttrFuncDef))
+            and isinstance(const.body, CodeObject)
+        ]
+
+    return '\n\n'.join(listings)
+
+
+def compile_code(code: codes.Code) -> CodeObject:
+    """Compiles the parsed code of a file
+
+    Args:
+        code (codes.Code): The parsed code
+
+    Returns:
+        CodeObject: The compiled module code
+    """
+
+    compiler = Compiler('<module>', resolve_module(code.stmts))
+    compiler.compile_block(code.stmts)
+    return compiler.code
+
+
+def compile_function(name: str, body: codes.Body, params=(), parent: Scope | None = None) -> CodeObject:
+    """Compiles the body of a function
+
+    Args:
+        name (str): The name of the function
+        body (codes.Body): The body of the function
+        params (codes.Params, optional): The parameters of the function. Defaults to ().
+        parent (Scope | None, optional): The scope the function is defined in, its names are
+            only resolved at compile time if given. Defaults to None.
+
+    Returns:
+        CodeObject: The compiled function code
+    """
+
+    scope = resolve_function(
+        [param.name for param in params.params] if params else [], body.stmts, parent
+    ) if parent is not None else None
+
+    compiler = Compiler(name, scope)
+    compiler.compile_block(body.stmts)
+    return compiler.code
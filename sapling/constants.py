@@ -15,6 +15,7 @@ TOKENS = {
     'If': r'if(?!\w)',
     'Else': r'else(?!\w)',
     'While': r'while(?!\w)',
+    'For': r'for(?!\w)',
     'Func': r'func(?!\w)',
     'Import': r'import(?!\w)',
     'Return': r'return(?!\w)',
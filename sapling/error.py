@@ -4,16 +4,21 @@ error.py
 
 Contains the error classes used by the Sapling VM
 All errors inherit from the SError (Sapling Error) class
+
+Errors are raised as exceptions and reported by the VM running the code. An error created
+without a position gets the position of the code that was running when it was raised.
 """
 
 
 from sys import exit as sys_exit
 
 
-class SError:
+class SError(Exception):
     """Base Sapling error class"""
     
-    def __init__(self, pos: list):
+    def __init__(self, pos: list | None = None):
+        super().__init__()
+
         self.pos = pos
 
     def report(self):
@@ -28,7 +33,7 @@ class STypeError(SError):
     """The type error class used when the current code is expecting a certain type
     but the current type is not"""
 
-    def __init__(self, msg: str, pos: list):
+    def __init__(self, msg: str, pos: list | None = None):
         super().__init__(pos)
 
         self.msg = msg
@@ -41,7 +46,7 @@ class STypeError(SError):
 class SFileError(SError):
     """The file error class used when a file is not found"""
     
-    def __init__(self, path: str, pos: list):
+    def __init__(self, path: str, pos: list | None = None):
         super().__init__(pos)
 
         self.path = path
@@ -54,7 +59,7 @@ class SFileError(SError):
 class SIndexError(SError):
     """The index error class used when an index is out of range or a key is not found"""
 
-    def __init__(self, msg: str, pos: list):
+    def __init__(self, msg: str, pos: list | None = None):
         super().__init__(pos)
 
         self.msg = msg
@@ -67,7 +72,7 @@ class SIndexError(SError):
 class SImportError(SError):
     """The import error class used when a library is not found or is invalid"""
 
-    def __init__(self, lib_name: str, pos: list) -> None:
+    def __init__(self, lib_name: str, pos: list | None = None) -> None:
         super().__init__(pos)
 
         self.lib_name = lib_name
@@ -81,7 +86,7 @@ class SAttributeError(SError):
     """The attribute error class used when an object has been given an attribute that
     doesn't exist"""
 
-    def __init__(self, obj_type: str, attr: str, pos: list):
+    def __init__(self, obj_type: str, attr: str, pos: list | None = None):
         super().__init__(pos)
 
         self.obj_type = obj_type
@@ -96,7 +101,7 @@ class SNameError(SError):
     """The name error class used when an object (e.g. variable or function) is not defined
     in the environment"""
 
-    def __init__(self, name: str, pos: list):
+    def __init__(self, name: str, pos: list | None = None):
         super().__init__(pos)
 
         self.name = name
@@ -110,7 +115,7 @@ class SRuntimeError(SError):
     """The runtime error class used when an error occurs during runtime and the
     error type cannot be inferred"""
 
-    def __init__(self, msg: str, pos: list):
+    def __init__(self, msg: str, pos: list | None = None):
         super().__init__(pos)
 
         self.msg = msg
@@ -123,7 +128,7 @@ class SRuntimeError(SError):
 class SOverflowError(SError):
     """The overflow error class used when an overflow occurs"""
 
-    def __init__(self, msg: str, pos: list):
+    def __init__(self, msg: str, pos: list | None = None):
         super().__init__(pos)
 
         self.msg = msg
@@ -136,7 +141,7 @@ class SOverflowError(SError):
 class SDecodeError(SError):
     """The decode error class used when an error occurs during decoding"""
 
-    def __init__(self, msg: str, pos: list):
+    def __init__(self, msg: str, pos: list | None = None):
         super().__init__(pos)
 
         self.msg = msg
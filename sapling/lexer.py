@@ -2,37 +2,90 @@
 lexer.py
 --------
 
-The lexer for sapling
-uses RPLY
+The lexer for sapling. The patterns of the tokens are combined into a single regular expression
+with a named group for each of them, so a token is found with one match. The skips are tried
+first, then TOKENS in order, and the first pattern that matches is used, as in the RPLY lexer.
+The tokens are RPLY tokens, for the RPLY parser.
 """
 
 
-from rply.lexer import LexerStream
-from rply import LexerGenerator
+from re import compile as re_compile
+from typing import Iterator
+
+from rply.errors import LexingError
+from rply.token import SourcePosition, Token
 
 from sapling.constants import TOKENS, SKIPS
 
 
-lg = LexerGenerator()
+# Maps the name of each group of the pattern to the token it matches, None for the skips
+group_tokens = {f'skip{i}': None for i in range(len(SKIPS))} | {
+    f'token{i}': name for i, name in enumerate(TOKENS)
+}
+
+pattern = re_compile('|'.join(
+    [f'(?P<skip{i}>{skip})' for i, skip in enumerate(SKIPS)]
+    + [f'(?P<token{i}>{token})' for i, token in enumerate(TOKENS.values())]
+))
+
+
+def tokenize(src: str) -> Iterator[Token]:
+    """Scans the tokens of the source code, one at a time
+
+    Args:
+        src (str): The source code
+
+    Raises:
+        LexingError: At the first character no token starts with
+
+    Yields:
+        Token: The tokens, with their positions
+    """
+
+    match = pattern.match
+    idx, end = 0, len(src)
+    lineno, line_start = 1, 0
+    while idx < end:
+        found = match(src, idx)
+        if found is None:
+            raise LexingError(None, SourcePosition(idx, lineno, idx - line_start + 1))
+
+        start, idx = found.span()
+        name = group_tokens[found.lastgroup]
+        if name is not None:
+            yield Token(name, found.group(), SourcePosition(start, lineno, start - line_start + 1))
+
+        newlines = src.count('\n', start, idx)
+        if newlines:
+            lineno += newlines
+            line_start = src.rfind('\n', start, idx) + 1
+
+
+class TokenStream:
+    """The tokens of a file, scanned as the parser reads them. The source is kept for reporting
+    syntax errors."""
 
+    def __init__(self, src: str):
+        self.s = src
+        self.tokens = tokenize(src)
 
-for name, pattern in TOKENS.items():
-    lg.add(name, pattern)
+    def __iter__(self):
+        return self
 
-for pattern in SKIPS:
-    lg.ignore(pattern)
+    def __next__(self) -> Token:
+        return next(self.tokens)
 
+    next = __next__
 
-lexer = lg.build()
 
-def lex(src: str) -> LexerStream:
-    """Builds the RPLY lexer and tokenizes the source code
+def lex(src: str) -> TokenStream:
+    """Tokenizes the source code
 
     Args:
         src (str): The source code of a file
 
     Returns:
-        LexerStream: The tokens
+        TokenStream: The tokens
     """
 
-    return lexer.lex(src)
+    return TokenStream(src)
@@ -10,20 +10,21 @@ from typing import Callable, Self, Iterable, AnyStr, Union
 from re import Pattern, compile as re_compile
 from dataclasses import dataclass, field
 from functools import reduce
+from itertools import count
+from collections import OrderedDict
+from operator import add, sub, mul, truediv, mod, eq, ne, gt, lt, ge, le
 
-from sapling.vmutils import Param, py_to_sap, sap_to_py, verify_params, Arg
+from sapling.vmutils import Param, py_to_sap, sap_to_py, param_binder, Arg, Frame
 from sapling.std.call_decorator import call_decorator
-from sapling.error import SAttributeError
+from sapling.error import SError, SAttributeError, STypeError
 from sapling.codes import Body
+from sapling.opcodes import operators
 
 
 @dataclass(slots=True)
 class Node:
     """Used to represent a node in the VM"""
 
-    line: int = field(hash=False, repr=False, compare=False)
-    column: int = field(hash=False, repr=False, compare=False)
-
     type = 'node'
 
     def repr(self, _) -> str:
@@ -39,121 +40,78 @@ class Node:
         return str(self.value) if hasattr(self, 'value') else self
 
 
-@dataclass(unsafe_hash=True, slots=True)
-class Int(Node):
-    """Used to represent integers to Sapling"""
-
-    value: int
-
-    type = 'int'
-
-
-    @call_decorator(req_vm=False)
-    def _to_hex(self) -> 'String':
-        return String(self.line, self.column, hex(self.value)[2:].upper())
-
-    @call_decorator(req_vm=False)
-    def _to_octal(self) -> 'String':
-        return String(self.line, self.column, oct(self.value))
-
-    @call_decorator(req_vm=False)
-    def _to_binary(self) -> 'String':
-        return String(self.line, self.column, bin(self.value)[2:])
-    
-    @call_decorator(req_vm=False)
-    def _is_negative(self) -> 'Bool':
-        return Bool(self.line, self.column, self.value < 0)
-
-
+    # The operators are looked up in the operator table, see apply_operator
     def __add__(self, other):
-        match other.type:
-            case 'int':
-                return Int(self.line, self.column, self.value + other.value)
-            case 'float':
-                return Float(self.line, self.column, self.value + other.value)
+        return apply_operator('+', self, other)
 
     def __sub__(self, other):
-        match other.type:
-            case 'int':
-                return Int(self.line, self.column, self.value - other.value)
-            case 'float':
-                return Float(self.line, self.column, self.value - other.value)
-            case 'string':
-                return String(self.line, self.column, other.value[:-self.value])
-            case 'array':
-                return Array(self.line, self.column, other.value[:-self.value])
+        return apply_operator('-', self, other)
 
     def __mul__(self, other):
-        match other.type:
-            case 'int':
-                return Int(self.line, self.column, self.value * other.value)
-            case 'float':
-                return Float(self.line, self.column, self.value * other.value)
+        return apply_operator('*', self, other)
 
     def __truediv__(self, other):
-        match other.type:
-            case 'int':
-                if other.value == 0:
-                    raise ZeroDivisionError
-                
-                return Float(self.line, self.column, self.value / other.value)
-            case 'float':
-                return Float(self.line, self.column, self.value / other.value)
+        return apply_operator('/', self, other)
 
     def __mod__(self, other):
-        match other.type:
-            case 'int':
-                return Int(self.line, self.column, self.value % other.value)
-            case 'float':
-                return Float(self.line, self.column, self.value % other.value)
+        return apply_operator('%', self, other)
 
     def __eq__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value == other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value == other.value)
+        return apply_operator('==', self, other)
 
     def __ne__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value != other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value != other.value)
+        return apply_operator('!=', self, other)
 
     def __gt__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value > other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value > other.value)
+        return apply_operator('>', self, other)
 
     def __lt__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value < other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value < other.value)
+        return apply_operator('<', self, other)
+
+    def __ge__(self, other):
+        return apply_operator('>=', self, other)
 
     def __le__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value <= other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value <= other.value)
+        return apply_operator('<=', self, other)
+
+    def __and__(self, other):
+        return apply_operator('AND', self, other)
+
+    def __or__(self, other):
+        return apply_operator('OR', self, other)
+
+
+@dataclass(unsafe_hash=True, slots=True, eq=False)
+class Int(Node):
+    """Used to represent integers to Sapling"""
+
+    value: int
+
+    type = 'int'
+
+
+    @call_decorator(req_vm=False)
+    def _to_hex(self) -> 'String':
+        return String(hex(self.value)[2:].upper())
+
+    @call_decorator(req_vm=False)
+    def _to_octal(self) -> 'String':
+        return String(oct(self.value))
+
+    @call_decorator(req_vm=False)
+    def _to_binary(self) -> 'String':
+        return String(bin(self.value)[2:])
+    
+    @call_decorator(req_vm=False)
+    def _is_negative(self) -> 'Bool':
+        return to_bool(self.value < 0)
 
-    def __ge__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value >= other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value >= other.value)
 
     def __lshift__(self, other):
         match other.type:
             case 'Bit':
                 from sapling.std.classes.bits import Bit
-                return Bit(self.line, self.column, other.value << self.value)
+                return Bit(other.value << self.value)
 
     def __bool__(self) -> bool:
         return self.value > 0
@@ -165,7 +123,7 @@ class Int(Node):
         return float(self.value)
 
 
-@dataclass(unsafe_hash=True, slots=True)
+@dataclass(unsafe_hash=True, slots=True, eq=False)
 class Float(Node):
     """Used to represent floating point numbers in Sapling"""
 
@@ -174,83 +132,6 @@ class Float(Node):
     type = 'float'
 
 
-    def __add__(self, other):
-        match other.type:
-            case 'int':
-                return Float(self.line, self.column, self.value + other.value)
-            case 'float':
-                return Float(self.line, self.column, self.value + other.value)
-
-    def __sub__(self, other):
-        match other.type:
-            case 'int':
-                return Float(self.line, self.column, self.value - other.value)
-            case 'float':
-                return Float(self.line, self.column, self.value - other.value)
-
-    def __mul__(self, other):
-        match other.type:
-            case 'int':
-                return Float(self.line, self.column, self.value * other.value)
-            case 'float':
-                return Float(self.line, self.column, self.value * other.value)
-
-    def __truediv__(self, other):
-        match other.type:
-            case 'int':
-                return Float(self.line, self.column, self.value / other.value)
-            case 'float':
-                return Float(self.line, self.column, self.value / other.value)
-
-    def __mod__(self, other):
-        match other.type:
-            case 'int':
-                return Float(self.line, self.column, self.value % other.value)
-            case 'float':
-                return Float(self.line, self.column, self.value % other.value)
-
-    def __eq__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value == other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value == other.value)
-
-    def __ne__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value != other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value != other.value)
-
-    def __gt__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value > other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value > other.value)
-
-    def __lt__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value < other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value < other.value)
-
-    def __le__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value < other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value <= other.value)
-
-    def __ge__(self, other):
-        match other.type:
-            case 'int':
-                return Bool(self.line, self.column, self.value >= other.value)
-            case 'float':
-                return Bool(self.line, self.column, self.value >= other.value)
-
     def __bool__(self) -> bool:
         return self.value > 0.0
     
@@ -270,7 +151,7 @@ class Hex(Node):
     type = 'hex'
 
 
-@dataclass(unsafe_hash=True, slots=True)
+@dataclass(unsafe_hash=True, slots=True, eq=False)
 class String(Node):
     """Used to represent a string in Sapling"""
 
@@ -284,97 +165,52 @@ class String(Node):
 
     @call_decorator(req_vm=False)
     def _lower(self) -> Self:
-        return String(self.line, self.column, self.value.lower())
+        return String(self.value.lower())
 
     @call_decorator(req_vm=False)
     def _upper(self) -> Self:
-        return String(self.line, self.column, self.value.upper())
+        return String(self.value.upper())
 
     @call_decorator(req_vm=False)
     def _title(self) -> Self:
-        return String(self.line, self.column, self.value.title())
+        return String(self.value.title())
 
     @call_decorator({'old': {'type': 'string'}, 'new': {'type': 'string'}}, req_vm=False)
     def _replace(self, old: Self, new: Self) -> Self:
-        return String(self.line, self.column, self.value.replace(old.value, new.value))
+        return String(self.value.replace(old.value, new.value))
 
     @call_decorator({'text': {'type': 'string'}}, req_vm=False)
     def _split(self, text: Self) -> 'Array':
-        return Array.from_py_iter(self.value.split(text.value), self.line, self.column)
+        return Array.from_py_iter(self.value.split(text.value))
 
     @call_decorator({'text': {'type': 'string'}}, req_vm=False)
     def _join(self, text: Self) -> Self:
-        return String(self.line, self.column, text.value.join(self.value))
+        return String(text.value.join(self.value))
 
     @call_decorator({'text': {'type': 'string'}}, req_vm=False)
     def _strip(self, text: Self) -> Self:
-        return String(self.line, self.column, self.value.strip(text.value))
+        return String(self.value.strip(text.value))
 
     @call_decorator()
     def _to_bytes(self, vm) -> 'StrBytes':
         if isinstance(self.value, bytes):
-            vm.error(SAttributeError(self.type, 'to_bytes', [self.line, self.column]))
+            vm.error(SAttributeError(self.type, 'to_bytes'))
 
-        return StrBytes(self.line, self.column, self.value.encode('utf-8'))
+        return StrBytes(self.value.encode('utf-8'))
 
 
     @property
     def _length(self) -> Int:
-        return Int(self.line, self.column, len(self.value))
+        return Int(len(self.value))
 
     @property
     def _start(self) -> Self:
-        return String(self.line, self.column, self.value[0])
+        return String(self.value[0])
 
     @property
     def _end(self) -> Self:
-        return String(self.line, self.column, self.value[-1])
-
-
-    def __add__(self, other):
-        match other.type:
-            case 'string':
-                return String(self.line, self.column, self.value + other.value)
+        return String(self.value[-1])
 
-    def __sub__(self, other):
-        match other.type:
-            case 'int':
-                return String(self.line, self.column, self.value[other.value:])
-
-    def __mul__(self, other):
-        match other.type:
-            case 'int':
-                return String(self.line, self.column, self.value * other.value)
-
-    def __eq__(self, other):
-        match other.type:
-            case 'string':
-                return Bool(self.line, self.column, self.value == other.value)
-
-    def __ne__(self, other):
-        match other.type:
-            case 'string':
-                return Bool(self.line, self.column, self.value != other.value)
-
-    def __lt__(self, other):
-        match other.type:
-            case 'string':
-                return Bool(self.line, self.column, len(self.value) < len(other.value))
-
-    def __gt__(self, other):
-        match other.type:
-            case 'string':
-                return Bool(self.line, self.column, len(self.value) > len(other.value))
-
-    def __le__(self, other):
-        match other.type:
-            case 'string':
-                return Bool(self.line, self.column, len(self.value) <= len(other.value))
-
-    def __ge__(self, other):
-        match other.type:
-            case 'string':
-                return Bool(self.line, self.column, len(self.value) >= len(other.value))
 
     def __bool__(self) -> bool:
         return self.value != ''
@@ -392,10 +228,10 @@ class String(Node):
         if i.value >= len(self.value):
             raise IndexError()
         
-        return String(self.line, self.column, self.value[i.value])
+        return String(self.value[i.value])
 
 
-@dataclass(unsafe_hash=True, slots=True)
+@dataclass(unsafe_hash=True, slots=True, eq=False)
 class StrBytes(String):
     """Used to represent and store a byte string in Sapling"""
 
@@ -409,75 +245,8 @@ class StrBytes(String):
 
     @call_decorator(req_vm=False)
     def _to_string(self) -> String:
-        return String(self.line, self.column, self.value.decode('utf-8'))
-
-
-    def __add__(self, other):
-        match other.type:
-            case 'strbytes':
-                return StrBytes(self.line, self.column, self.value + other.value)
-            case 'string':
-                return StrBytes(self.line, self.column, self.value + other.value.encode('utf-8'))
-
-    def __sub__(self, other):
-        match other.type:
-            case 'int':
-                return StrBytes(self.line, self.column, self.value[other.value:])
-
-    def __mul__(self, other):
-        match other.type:
-            case 'int':
-                return StrBytes(self.line, self.column, self.value * other.value)
-
-    def __eq__(self, other):
-        match other.type:
-            case 'strbytes':
-                return Bool(self.line, self.column, self.value == other.value)
-            case 'string':
-                return Bool(self.line, self.column, self.value == other.value.encode('utf-8'))
-
-    def __ne__(self, other):
-        match other.type:
-            case 'strbytes':
-                return Bool(self.line, self.column, self.value != other.value)
-            case 'string':
-                return Bool(self.line, self.column, self.value != other.value.encode('utf-8'))
-
-    def __gt__(self, other):
-        match other.type:
-            case 'strbytes':
-                return Bool(self.line, self.column, len(self.value) > len(other.value))
-            case 'string':
-                return Bool(self.line, self.column, len(self.value) > len(
-                    other.value.encode('utf-8')
-                ))
+        return String(self.value.decode('utf-8'))
 
-    def __lt__(self, other):
-        match other.type:
-            case 'strbytes':
-                return Bool(self.line, self.column, len(self.value) < len(other.value))
-            case 'string':
-                return Bool(self.line, self.column, len(self.value) < len(
-                    other.value.encode('utf-8')
-                ))
-
-    def __ge__(self, other):
-        match other.type:
-            case 'strbytes':
-                return Bool(self.line, self.column, len(self.value) >= len(other.value))
-            case 'string':
-                return Bool(self.line, self.column, len(self.value) >= len(
-                    other.value.encode('utf-8')
-                ))
-
-    def __le__(self, other):
-        match other.type:
-            case 'strbytes':
-                return Bool(self.line, self.column, len(self.value) <= len(other.value))
-            case 'string':
-                return Bool(self.line, self.column, len(self.value) <= len(
-                    other.value.encode('utf-8')
-                ))
 
     def __bool__(self) -> bool:
         return self.value != b''
@@ -489,10 +258,10 @@ class StrBytes(String):
         if i.value >= len(self.value):
             raise IndexError()
         
-        return StrBytes(self.line, self.column, self.value[i.value])
+        return StrBytes(self.value[i.value])
 
 
-@dataclass(unsafe_hash=True, slots=True)
+@dataclass(unsafe_hash=True, slots=True, eq=False)
 class Bool(Node):
     """Used to represent a boolean (1 or 0) in Sapling"""
 
@@ -504,26 +273,6 @@ class Bool(Node):
         return str(self.value).lower()
 
 
-    def __eq__(self, other):
-        match other.type:
-            case 'bool':
-                return Bool(self.line, self.column, self.value == other.value)
-
-    def __ne__(self, other):
-        match other.type:
-            case 'bool':
-                return Bool(self.line, self.column, self.value != other.value)
-
-    def __and__(self, other):
-        match other.type:
-            case 'bool':
-                return Bool(self.line, self.column, self.value and other.value)
-
-    def __or__(self, other):
-        match other.type:
-            case 'bool':
-                return Bool(self.line, self.column, self.value or other.value)
-
     def __bool__(self) -> bool:
         return self.value
 
@@ -543,7 +292,85 @@ class Nil(Node):
         return False
 
 
-@dataclass(unsafe_hash=True, slots=True)
+# Bools, nil and small integers are immutable, so operators share instances of them instead of
+# making new ones
+TRUE = Bool(True)
+FALSE = Bool(False)
+NIL = Nil()
+SMALL_INTS = tuple(Int(i) for i in range(-5, 257))
+
+
+def to_bool(value) -> Bool:
+    """Gets the shared Bool for the truth of a Python value"""
+
+    return TRUE if value else FALSE
+
+
+def to_int(value: int) -> Int:
+    """Makes an Int, small integers are shared"""
+
+    return SMALL_INTS[value + 5] if -5 <= value <= 256 else Int(value)
+
+
+# Compiled code keeps ints, floats, strings and bools as raw Python values. They are boxed into
+# the classes above when they leave it: when stored in a variable, passed to a function, put in
+# an array or dictionary, returned and so on.
+boxes = {int: to_int, float: Float, str: String, bool: to_bool}
+unboxed = {Int, Float, String, Bool}
+box_classes = {int: Int, float: Float, str: String, bool: Bool}
+
+
+def box(value):
+    """Boxes a raw value of compiled code into its object, objects are returned as they are"""
+
+    boxer = boxes.get(value.__class__)
+    return boxer(value) if boxer is not None else value
+
+
+def unbox(value):
+    """Unboxes an Int, Float, String or Bool into its raw value, other objects are returned as
+    they are"""
+
+    return value.value if value.__class__ in unboxed else value
+
+
+def truthy(value) -> bool:
+    """Whether a raw value or an object is true to Sapling, where only positive numbers are"""
+
+    cls = value.__class__
+    if cls is int or cls is float:
+        return value > 0
+
+    return bool(value)
+
+
+def iterate(vm, value) -> Iterable:
+    """Gets the objects a for loop over a value binds in turn: the values of an array, the keys
+    of a dictionary or the characters of a string
+
+    Args:
+        vm (VM): The VM running the loop
+        value: The value looped over, raw or an object
+
+    Returns:
+        Iterable: The objects
+    """
+
+    cls = value.__class__
+    if cls is Array:
+        return value.value
+    elif cls is Dictionary:
+        # The keys are copied, so the body can add to the dictionary
+        return tuple(value.value)
+    elif cls is str:
+        return map(String, value)
+    elif cls is String:
+        return map(String, value.value)
+
+    vm.error(STypeError(f'Cannot iterate over type \'{box(value).type}\''))
+
+
+@dataclass(unsafe_hash=True, slots=True, eq=False)
 class Regex(Node):
     """Used to represent and store a regular expression in Sapling"""
 
@@ -557,53 +384,20 @@ class Regex(Node):
     
     @property
     def _flag(self) -> String:
-        return String(self.line, self.column, self.value.flags)
+        return String(self.value.flags)
 
     @call_decorator({'string': {'type': 'string'}}, req_vm=False)
     def _match(self, string: String) -> Bool:
-        return Bool(self.line, self.column, self.value.match(string.value) is not None)
+        return to_bool(self.value.match(string.value) is not None)
 
     @call_decorator({'string': {'type': 'string'}}, req_vm=False)
     def _match_string(self, string: String) -> String:
-        return String(self.line, self.column, self.value.match(string.value).group(0))
+        return String(self.value.match(string.value).group(0))
 
     @call_decorator({'string': {'type': 'string'}}, req_vm=False)
     def _find_all(self, string: String) -> 'Array':
-        return Array.from_py_iter(self.value.findall(string.value), self.line, self.column)
-
-
-    def __add__(self, other):
-        match other.type:
-            case 'regex':
-                return Regex(self.line, self.column, re_compile(
-                    self.value.pattern + other.value.pattern
-                ))
-            case 'string':
-                return Regex(self.line, self.column, re_compile(self.value.pattern + other.value))
-
-    def __sub__(self, other):
-        match other.type:
-            case 'int':
-                return Regex(self.line, self.column, re_compile(self.value.pattern[other.value:]))
-
-    def __mul__(self, other):
-        match other.type:
-            case 'int':
-                return Regex(self.line, self.column, re_compile(self.value.pattern * other.value))
+        return Array.from_py_iter(self.value.findall(string.value))
 
-    def __eq__(self, other):
-        match other.type:
-            case 'regex':
-                return Bool(self.line, self.column, self.value.pattern == other.value.pattern)
-            case 'string':
-                return Bool(self.line, self.column, self.value.pattern == other.value)
-
-    def __ne__(self, other):
-        match other.type:
-            case 'regex':
-                return Bool(self.line, self.column, self.value.pattern != other.value.pattern)
-            case 'string':
-                return Bool(self.line, self.column, self.value.pattern != other.value)
 
     def __bool__(self) -> bool:
         return self.value is not None
@@ -615,10 +409,10 @@ class Regex(Node):
         if i.value >= len(self.value.pattern):
             raise IndexError()
         
-        return Regex(self.line, self.column, re_compile(self.value.pattern[i.value]))
+        return Regex(re_compile(self.value.pattern[i.value]))
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False)
 class Array(Node):
     """Used to represent an array of nodes in Sapling"""
 
@@ -631,21 +425,17 @@ class Array(Node):
 
 
     @staticmethod
-    def from_py_iter(py_iterable: Iterable, line: int, column: int) -> 'Array':
+    def from_py_iter(py_iterable: Iterable) -> 'Array':
         """Convert a python iterable to a Sapling Array
 
         Args:
             py_iterable (Iterable): The python iterable
-            line (int): The line of the array
-            column (int): The column of the array
 
         Returns:
             Self: The generated array
         """
 
-        return Array(line, column, map(lambda v:
-            py_to_sap(v, line, column), py_iterable
-        ))
+        return Array(map(py_to_sap, py_iterable))
 
     def to_py_list(self) -> list:
         """Converts this Sapling Array into a python list
@@ -662,38 +452,38 @@ class Array(Node):
         if len(self.value) >= index.value:
             return self.value[index.value]
 
-        return Nil(self.line, self.column)
+        return NIL
 
     @call_decorator({'index': {'type': 'int'}, 'value': {}}, req_vm=False)
     def _set(self, index: Int, value: Node) -> Self:
         if len(self.value) > index.value:
             self.value[index.value] = value
 
-        return Nil(self.line, self.column)
+        return NIL
 
     @call_decorator({'value': {}}, req_vm=False)
     def _add(self, value: Node) -> Self:
-        return Array(self.line, self.column, self.value + [value])
+        return Array(self.value + [value])
 
     @call_decorator({'value': {}}, req_vm=False)
     def _remove(self, value: Node) -> Self:
-        return Array(self.line, self.column, [
+        return Array([
             val for val in self.value if val != value
         ])
 
     @call_decorator({'value': {}}, req_vm=False)
     def _has(self, value: Node) -> Bool:
-        return Bool(self.line, self.column, value in self.value)
+        return to_bool(value in self.value)
     
     @call_decorator({'func': {'type': 'func'}})
     def _map(self, vm, func: 'Func') -> Self:
-        return Array(self.line, self.column, map(
+        return Array(map(
             lambda v: func(vm, (Arg(v),)), self.value
         ))
     
     @call_decorator({'func': {'type': 'func'}})
     def _filter(self, vm, func: 'Func') -> Self:
-        return Array(self.line, self.column, filter(
+        return Array(filter(
             lambda v: func(vm, (Arg(v),)), self.value
         ))
     
@@ -705,7 +495,7 @@ class Array(Node):
     
     @call_decorator({'func': {'type': 'func'}})
     def _sort(self, vm, func: 'Func') -> Self:
-        return Array(self.line, self.column, sorted(
+        return Array(sorted(
             self.value, key=lambda v: func(vm, (Arg(v),))
         ))
 
@@ -716,31 +506,6 @@ class Array(Node):
     def __post_init__(self):
         self.value = list(self.value)
 
-    def __add__(self, other):
-        match other.type:
-            case 'array':
-                return Array(self.line, self.column, self.value + other.value)
-
-    def __sub__(self, other):
-        match other.type:
-            case 'int':
-                return Array(self.line, self.column, self.value[other.value:])
-
-    def __mul__(self, other):
-        match other.type:
-            case 'int':
-                return Array(self.line, self.column, self.value * other.value)
-
-    def __eq__(self, other):
-        match other.type:
-            case 'array':
-                return Bool(self.line, self.column, self.value == other.value)
-
-    def __ne__(self, other):
-        match other.type:
-            case 'array':
-                return Bool(self.line, self.column, self.value != other.value)
-
     def __bool__(self) -> bool:
         return len(self.value) > 0
 
@@ -770,20 +535,18 @@ class Dictionary(Node):
 
     
     @staticmethod
-    def from_py_dict(d: dict, line: int, column: int) -> 'Dictionary':
+    def from_py_dict(d: dict) -> 'Dictionary':
         """Convert a python dictionary to a Sapling Dictionary object
 
         Args:
             d (dict): The python dictionary
-            line (int): The line of where the dictionary is created
-            column (int): The column of where the dictionary is created
 
         Returns:
             Dictionary: The generated dictionary
         """
         
-        return Dictionary(line, column, {
-            py_to_sap(k, line, column): py_to_sap(v, line, column)
+        return Dictionary({
+            py_to_sap(k): py_to_sap(v)
             for k, v in d.items()
         })
     
@@ -799,21 +562,21 @@ class Dictionary(Node):
     
     @property
     def _keys(self) -> Array:
-        return Array.from_py_iter(self.value.keys(), self.line, self.column)
+        return Array.from_py_iter(self.value.keys())
     
     @property
     def _values(self) -> Array:
-        return Array.from_py_iter(self.value.values(), self.line, self.column)
+        return Array.from_py_iter(self.value.values())
     
     
     @call_decorator({'key': {}}, req_vm=False)
     def _get(self, key: Node) -> Node:
-        return self.value.get(key, Nil(key.line, key.column))
+        return self.value.get(key, NIL)
     
     @call_decorator({'key': {}, 'value': {}}, req_vm=False)
     def _add(self, key: Node, value: Node) -> Nil:
         self.value[key] = value
-        return Nil(self.line, self.column)
+        return NIL
     
     
     def __hash__(self):
@@ -843,6 +606,10 @@ class Func(Node):
     params: tuple[Param]
     body: Body | None = field(default=None)
     func: Union[Callable, None] = field(default=None)
+    frame: Union[Frame, None] = field(default=None, compare=False)
+
+    # Binds the arguments of a call to the parameters, made the first time the function is called
+    binder: Union[Callable, None] = field(default=None, compare=False, repr=False)
 
     type = 'func'
 
@@ -852,11 +619,11 @@ class Func(Node):
 
     @property
     def _name(self) -> String:
-        return String(self.line, self.column, self.name)
+        return String(self.name)
 
     @property
     def _is_builtin(self) -> Bool:
-        return Bool(self.line, self.column, self.func is not None)
+        return to_bool(self.func is not None)
     
     
     @call_decorator({'args': {'type': 'array', 'default': (Array, [])}})
@@ -869,20 +636,21 @@ class Func(Node):
             return self.func(vm, args)
         elif self.body is not None:
             from sapling.vm import VM
+            frame = Frame({}, self.frame)
             if not isinstance(vm, VM):
                 parent_cls, vm, args = vm, args[0], args[1:]
-                vm.env['self'] = parent_cls
+                frame.locals['self'] = parent_cls
+
+            if self.binder is None:
+                self.binder = param_binder(self.params)
 
-            env = vm.env
-            args = verify_params(vm, args, self.params)
-            for param, arg in zip(self.params, args):
-                env[param.name] = arg
+            for param, arg in zip(self.params, self.binder(vm, args)):
+                frame.locals[param.name] = arg
 
-            func_vm = VM(vm.src, env)
-            out = func_vm.execute(self.body)
-            return out if out is not None else Nil(*vm.loose_pos)
+            out = vm.execute_frame(frame, self.body)
+            return out if out is not None else NIL
 
-        return Nil(*vm.loose_pos)
+        return NIL
 
 
 @dataclass(unsafe_hash=True, slots=True)
@@ -903,6 +671,78 @@ class Method(Func):
         return super(Method, self).__call__(vm, args)
 
 
+@dataclass(unsafe_hash=True, slots=True)
+class Memo(Func):
+    """Used to represent a function whose results are cached, made by the builtin memo. The
+    results are kept for the most recently used arguments, up to max_size of them (0 keeps all)"""
+
+    wrapped: Func = field(default=None)
+    max_size: int = field(default=128)
+    results: OrderedDict = field(default_factory=OrderedDict, compare=False, repr=False)
+    hits: int = field(default=0, compare=False)
+    misses: int = field(default=0, compare=False)
+
+    def repr(self, _) -> str:
+        return f'Memo \'{self.name}\''
+
+
+    @property
+    def _hits(self) -> Int:
+        return Int(self.hits)
+
+    @property
+    def _misses(self) -> Int:
+        return Int(self.misses)
+
+    @property
+    def _size(self) -> Int:
+        return Int(len(self.results))
+
+    @property
+    def _max_size(self) -> Int:
+        return Int(self.max_size)
+
+
+    @call_decorator(req_vm=False)
+    def _clear(self) -> Nil:
+        self.results.clear()
+        self.hits = self.misses = 0
+        return NIL
+
+
+    def __call__(self, vm, args: list):
+        # Values are keyed with their class, as an int equals a float (and a bool) of the same
+        # value. An array can be changed after the call, so calls with one aren't cached.
+        key = tuple(
+            (arg.name, arg.value.__class__, getattr(arg.value, 'value', arg.value)) for arg in args
+        )
+        if any(cls is Array for _, cls, _ in key):
+            return self.wrapped(vm, args)
+
+        try:
+            result = self.results.get(key)
+        except TypeError:
+            return self.wrapped(vm, args)
+
+        if result is not None:
+            self.hits += 1
+            self.results.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = self.wrapped(vm, args)
+        self.results[key] = result
+        if self.max_size and len(self.results) > self.max_size:
+            self.results.popitem(last=False)
+
+        return result
+
+
+# Every Class and Lib has a version no other one has, a Class is given a new one when its objects
+# change. Caches of the attributes of an object are valid while it keeps the version.
+versions = count()
+
+
 @dataclass(unsafe_hash=True, slots=True)
 class Class(Node):
     """Used to represent a class in Sapling"""
@@ -912,6 +752,7 @@ class Class(Node):
     repr_func: Union[Callable, None] = field(default=None)
     type: str = field(default='class')
     python_class: Union[type, None] = field(default=None)
+    version: int = field(default_factory=versions.__next__, compare=False, repr=False)
 
     def repr(self, context) -> str:
         if self.repr_func is not None:
@@ -923,20 +764,18 @@ class Class(Node):
         return f'Class \'{self.name}\''
 
     @staticmethod
-    def from_py_cls(py_cls, line: int, column: int) -> 'Class':
+    def from_py_cls(py_cls) -> 'Class':
         """Converts a python class into a Sapling Class
 
         Args:
             py_cls (class): The python class
-            line (int): The line of execution
-            column (int): The column of execution
 
         Returns:
             Self: The Sapling Class
         """
 
-        return Class(line, column, py_cls.__class__.__name__, {
-            name: py_to_sap(getattr(py_cls, name), line, column)
+        return Class(py_cls.__class__.__name__, {
+            name: py_to_sap(getattr(py_cls, name))
             for name in dir(py_cls)
             if not name.startswith('__') and name.startswith('_')
         }, getattr(py_cls, 'repr', None), getattr(py_cls, 'type', 'class'), py_cls)
@@ -950,6 +789,17 @@ class Class(Node):
     def __dir__(self):
         return list(self.objects.keys())
 
+    def set_object(self, name: str, value) -> None:
+        """Binds a name in the objects of the class, giving the class a new version
+
+        Args:
+            name (str): The name, with the leading underscore
+            value (Node): The value
+        """
+
+        self.objects[name] = value
+        self.version = next(versions)
+
 
 @dataclass(unsafe_hash=True, slots=True)
 class Lib(Node):
@@ -959,6 +809,7 @@ class Lib(Node):
     objects: dict
     repr_func: Union[Callable, None] = field(default=None)
     type: str = field(default='lib')
+    version: int = field(default_factory=versions.__next__, compare=False, repr=False)
 
     def repr(self, context) -> str:
         if self.repr_func is not None:
@@ -971,20 +822,18 @@ class Lib(Node):
 
 
     @staticmethod
-    def from_py(py_lib: type, line: int, column: int) -> 'Lib':
+    def from_py(py_lib: type) -> 'Lib':
         """Converts the python library class into a Sapling Lib(rary)
 
         Args:
             py_lib (class): The python class
-            line (int): The line of execution
-            column (int): The column of execution
 
         Returns:
             Self: The Sapling Lib(rary)
         """
 
-        return Lib(line, column, py_lib.__name__, {
-            name: py_to_sap(getattr(py_lib, name), line, column)
+        return Lib(py_lib.__name__, {
+            name: py_to_sap(getattr(py_lib, name))
             for name in dir(py_lib)
             if not name.startswith('__') and name.startswith('_')
         }, getattr(py_lib, 'repr', None), getattr(py_lib, 'type', 'lib'))
@@ -998,3 +847,245 @@ class Lib(Node):
     
     def __dir__(self):
         return list(self.objects.keys())
+
+
+def attribute_binder(cls: type, attr: str) -> Callable | None:
+    """Finds how an attribute defined by a builtin class is got from its objects, so it's not
+    looked up again for each of them. Classes and Libs have attributes of their own instead.
+
+    Args:
+        cls (type): The class of the objects, which may be the class of a raw value
+        attr (str): The attribute, with the leading underscore
+
+    Returns:
+        Callable | None: Gets the attribute from an object of the class, None if the attribute
+            isn't defined by the class
+    """
+
+    boxed_cls = box_classes.get(cls, cls)
+    if boxed_cls is Class or boxed_cls is Lib or boxed_cls.__dictoffset__:
+        return None
+
+    for base in boxed_cls.__mro__:
+        if attr in base.__dict__:
+            get = getattr(base.__dict__[attr], '__get__', None)
+            if get is None or cls is boxed_cls:
+                return get
+
+            boxer = boxes[cls]
+            return lambda value: get(boxer(value))
+
+
+def attribute_getter(attr: str, null_safe: bool, pos: list | None = None) -> Callable:
+    """Makes the function one place in compiled code gets an attribute with. It caches what it
+    found for the class of the object it was last called with: the value for a Class or Lib,
+    while the object keeps its version, or how it's got for the objects of a builtin class.
+
+    Args:
+        attr (str): The attribute, with the leading underscore
+        null_safe (bool): Whether getting the attribute of nil gives nil
+        pos (list | None, optional): The position of the place, given to the errors getting the
+            attribute. Defaults to None.
+
+    Returns:
+        Callable: The function, taking the VM and the object (which may be a raw value)
+    """
+
+    cls = version = value = bind = None
+
+    def get_attribute(vm, base):
+        nonlocal cls, version, value, bind
+        if base.__class__ is cls:
+            if bind is not None:
+                return bind(base)
+
+            if base.version == version:
+                return value
+
+        try:
+            out = vm.get_attribute(box(base), attr, null_safe)
+        except SError as error:
+            if error.pos is None:
+                error.pos = pos
+
+            raise
+
+        cls = base.__class__
+        if cls is Class or cls is Lib:
+            version, value, bind = base.version, out, None
+        else:
+            bind = attribute_binder(cls, attr)
+            if bind is None:
+                cls = None
+
+        return out
+
+    return get_attribute
+
+
+# Maps (operator, left type, right type) to the function applying the operator. Operands of the
+# types int, float, string and bool are given to it as raw values, anything else as an object.
+# It may give a raw value or an object and gives None if it can't be applied to the operands.
+operator_table: dict[tuple[str, str, str], Callable] = {}
+
+# The types of raw values, their objects are unboxed for the functions of the operator table
+raw_types = {int: 'int', float: 'float', str: 'string', bool: 'bool'}
+raw_type_names = set(raw_types.values())
+
+# The implementations already resolved for the classes of the operands
+resolved_operators: dict[tuple[str, type, type], Callable] = {}
+
+
+def register_operators(table: dict[tuple[str, str, str], Callable]) -> None:
+    """Adds operator implementations to the operator table, std classes can use this to give
+    their objects operators
+
+    Args:
+        table (dict): Maps (operator, left type, right type) to the function applying it
+    """
+
+    operator_table.update(table)
+    resolved_operators.clear()
+
+
+def type_name(cls: type) -> str | None:
+    """Gets the Sapling type of the values of a class, None if it isn't the same for all of them"""
+
+    name = raw_types.get(cls, getattr(cls, 'type', None))
+    return name if isinstance(name, str) else None
+
+
+def resolve_operator(op: str, left_cls: type, right_cls: type) -> Callable:
+    """Finds the implementation of an operator for the classes of its operands
+
+    Args:
+        op (str): The operator, a key of sapling.opcodes.operators
+        left_cls (type): The class of the left operand, which may be a raw value
+        right_cls (type): The class of the right operand, which may be a raw value
+
+    Returns:
+        Callable: Applies the operator to the operands as compiled code holds them, giving a raw
+            value or an object, or None if the operator can't be applied to them
+    """
+
+    key = (op, left_cls, right_cls)
+    impl = resolved_operators.get(key)
+    if impl is not None:
+        return impl
+
+    left_type, right_type = type_name(left_cls), type_name(right_cls)
+    impl = operator_table.get((op, left_type, right_type))
+    if impl is None:
+        # Classes with operator methods of their own (like subclasses) are applied through them
+        operator = operators[op]
+        impl = lambda left, right: unbox(operator(box(left), box(right)))
+    elif left_cls in unboxed and right_cls in unboxed:
+        impl = lambda left, right, impl=impl: impl(left.value, right.value)
+    elif left_cls in unboxed:
+        impl = lambda left, right, impl=impl: impl(left.value, right)
+    elif right_cls in unboxed:
+        impl = lambda left, right, impl=impl: impl(left, right.value)
+
+    resolved_operators[key] = impl
+    return impl
+
+
+def apply_operator(op: str, left: Node, right: Node):
+    """Applies an operator to two objects, it's what their operator methods do. The types of the
+    classes the left operand inherits from are tried in order, like inherited methods would be.
+
+    Args:
+        op (str): The operator, a key of sapling.opcodes.operators
+        left (Node): The left operand
+        right (Node): The right operand
+
+    Returns:
+        The resulting object, None if the operator can't be applied to the operands
+    """
+
+    right_type = type_name(right.__class__)
+    if right_type in raw_type_names:
+        right = right.value
+
+    for cls in left.__class__.__mro__:
+        left_type = cls.__dict__.get('type')
+        impl = operator_table.get((op, left_type, right_type))
+        if impl is not None:
+            out = impl(left.value if left_type in raw_type_names else left, right)
+            return box(out) if out is not None else None
+
+
+_numbers = ('int', 'float')
+
+for _left in _numbers:
+    for _right in _numbers:
+        operator_table |= {
+            ('+', _left, _right): add,
+            ('-', _left, _right): sub,
+            ('*', _left, _right): mul,
+            ('/', _left, _right): truediv,
+            ('%', _left, _right): mod,
+            ('==', _left, _right): eq,
+            ('!=', _left, _right): ne,
+            ('>', _left, _right): gt,
+            ('<', _left, _right): lt,
+            ('>=', _left, _right): ge,
+            ('<=', _left, _right): le,
+        }
+
+operator_table |= {
+    # Float has always compared itself to an int with < for <=
+    ('<=', 'float', 'int'): lt,
+
+    ('-', 'int', 'string'): lambda left, right: right[:-left],
+    ('-', 'int', 'array'): lambda left, right: Array(right.value[:-left]),
+
+    ('+', 'string', 'string'): add,
+    ('-', 'string', 'int'): lambda left, right: left[right:],
+    ('*', 'string', 'int'): mul,
+    ('==', 'string', 'string'): eq,
+    ('!=', 'string', 'string'): ne,
+    ('>', 'string', 'string'): lambda left, right: len(left) > len(right),
+    ('<', 'string', 'string'): lambda left, right: len(left) < len(right),
+    ('>=', 'string', 'string'): lambda left, right: len(left) >= len(right),
+    ('<=', 'string', 'string'): lambda left, right: len(left) <= len(right),
+
+    ('+', 'strbytes', 'strbytes'): lambda left, right: StrBytes(left.value + right.value),
+    ('+', 'strbytes', 'string'): lambda left, right: StrBytes(left.value + right.encode('utf-8')),
+    ('-', 'strbytes', 'int'): lambda left, right: StrBytes(left.value[right:]),
+    ('*', 'strbytes', 'int'): lambda left, right: StrBytes(left.value * right),
+    ('==', 'strbytes', 'strbytes'): lambda left, right: left.value == right.value,
+    ('==', 'strbytes', 'string'): lambda left, right: left.value == right.encode('utf-8'),
+    ('!=', 'strbytes', 'strbytes'): lambda left, right: left.value != right.value,
+    ('!=', 'strbytes', 'string'): lambda left, right: left.value != right.encode('utf-8'),
+    ('>', 'strbytes', 'strbytes'): lambda left, right: len(left.value) > len(right.value),
+    ('>', 'strbytes', 'string'): lambda left, right: len(left.value) > len(right.encode('utf-8')),
+    ('<', 'strbytes', 'strbytes'): lambda left, right: len(left.value) < len(right.value),
+    ('<', 'strbytes', 'string'): lambda left, right: len(left.value) < len(right.encode('utf-8')),
+    ('>=', 'strbytes', 'strbytes'): lambda left, right: len(left.value) >= len(right.value),
+    ('>=', 'strbytes', 'string'): lambda left, right: len(left.value) >= len(right.encode('utf-8')),
+    ('<=', 'strbytes', 'strbytes'): lambda left, right: len(left.value) <= len(right.value),
+    ('<=', 'strbytes', 'string'): lambda left, right: len(left.value) <= len(right.encode('utf-8')),
+
+    ('+', 'regex', 'regex'): lambda left, right: Regex(re_compile(
+        left.value.pattern + right.value.pattern
+    )),
+    ('+', 'regex', 'string'): lambda left, right: Regex(re_compile(left.value.pattern + right)),
+    ('-', 'regex', 'int'): lambda left, right: Regex(re_compile(left.value.pattern[right:])),
+    ('*', 'regex', 'int'): lambda left, right: Regex(re_compile(left.value.pattern * right)),
+    ('==', 'regex', 'regex'): lambda left, right: left.value.pattern == right.value.pattern,
+    ('==', 'regex', 'string'): lambda left, right: left.value.pattern == right,
+    ('!=', 'regex', 'regex'): lambda left, right: left.value.pattern != right.value.pattern,
+    ('!=', 'regex', 'string'): lambda left, right: left.value.pattern != right,
+
+    ('+', 'array', 'array'): lambda left, right: Array(left.value + right.value),
+    ('-', 'array', 'int'): lambda left, right: Array(left.value[right:]),
+    ('*', 'array', 'int'): lambda left, right: Array(left.value * right),
+    ('==', 'array', 'array'): lambda left, right: left.value == right.value,
+    ('!=', 'array', 'array'): lambda left, right: left.value != right.value,
+
+    ('==', 'bool', 'bool'): eq,
+    ('!=', 'bool', 'bool'): ne,
+    ('AND', 'bool', 'bool'): lambda left, right: left and right,
+    ('OR', 'bool', 'bool'): lambda left, right: left or right,
+}
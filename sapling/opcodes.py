@@ -0,0 +1,91 @@
+"""
+opcodes.py
+----------
+
+Contains the opcodes of the linear bytecode produced by the compiler
+
+"""
+
+from operator import add, sub, mul, truediv, mod, eq, ne, gt, lt, ge, le, and_, or_
+
+
+NOP = 0
+LOAD_CONST = 1
+LOAD_NAME = 2
+STORE_NAME = 3
+BINARY_OP = 4
+EVAL_NODE = 5
+POP_TOP = 6
+JUMP = 7
+POP_JUMP_IF_FALSE = 8
+POP_JUMP_IF_TRUE = 9
+CALL = 10
+LOAD_ATTR = 11
+LOAD_ATTR_NULL_SAFE = 12
+INDEX = 13
+BUILD_ARRAY = 14
+BUILD_DICT = 15
+RETURN_VALUE = 16
+EXEC_NODE = 17
+LOAD_FAST = 18
+STORE_FAST = 19
+LOAD_GLOBAL = 20
+
+# The specialised instructions the VM rewrites an instruction into once it has run with the same
+# kind of operands a number of times. Each one checks its operands are still of that kind and
+# turns back into the generic instruction when they aren't.
+BINARY_ADD_INT = 21
+BINARY_SUB_INT = 22
+BINARY_OP_INT = 23
+BINARY_OP_FLOAT = 24
+BINARY_ADD_STRING = 25
+INDEX_ARRAY_INT = 26
+LOAD_ATTR_CLASS = 27
+CALL_FUNC = 28
+LOAD_ATTR_BUILTIN = 29
+
+# GET_ITER replaces the value on top of the stack with an iterator over it. FOR_ITER pushes the
+# next value of the iterator, or pops it and jumps to its argument once it's exhausted.
+GET_ITER = 30
+FOR_ITER = 31
+
+
+opnames = {v: k for k, v in globals().items() if k.isupper()}
+
+jump_ops = {JUMP, POP_JUMP_IF_FALSE, POP_JUMP_IF_TRUE, FOR_ITER}
+
+# Maps each specialised instruction to the generic instruction it was specialised from
+generic_ops = {
+    BINARY_ADD_INT: BINARY_OP,
+    BINARY_SUB_INT: BINARY_OP,
+    BINARY_OP_INT: BINARY_OP,
+    BINARY_OP_FLOAT: BINARY_OP,
+    BINARY_ADD_STRING: BINARY_OP,
+    INDEX_ARRAY_INT: INDEX,
+    LOAD_ATTR_CLASS: LOAD_ATTR,
+    LOAD_ATTR_BUILTIN: LOAD_ATTR,
+    CALL_FUNC: CALL,
+}
+
+operators = {
+    '+': add,
+    '-': sub,
+    '*': mul,
+    '/': truediv,
+    '%': mod,
+    '==': eq,
+    '!=': ne,
+    '>': gt,
+    '<': lt,
+    '>=': ge,
+    '<=': le,
+    'AND': and_,
+    'OR': or_
+}
+
+# The index of an operator in this tuple is the argument of BINARY_OP
+binary_operators = tuple(operators)
+
+# The operators the specialised instructions for two ints or two floats apply, none of them can
+# raise an error for those operands
+numeric_operators = frozenset({'+', '-', '*', '==', '!=', '>', '<', '>=', '<='})
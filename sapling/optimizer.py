@@ -0,0 +1,769 @@
+"""
+optimizer.py
+------------
+
+Optimizes the bytecode tree produced by the parser before it is run or written to a .sapped
+file. Operators applied to literals are folded into a single literal, using the operators of
+sapling.objects so the result is exactly what running them would give, and constants assigned
+a literal are propagated into the places they're used. Calls of small functions that only
+return an expression of their parameters are replaced by that expression, and expressions that
+give the same value on every iteration of a loop are computed once before it. Code that can't
+run, or whose result is never used, is removed, and a function returning a call of itself loops
+instead.
+
+"""
+
+from re import compile as re_compile
+from typing import Iterator
+
+import sapling.codes as codes
+from sapling.opcodes import operators
+from sapling.resolver import names_in
+
+
+# Folding a string any longer than this would only make the .sapped file bigger
+MAX_FOLDED_LENGTH = 4096
+
+# A function is only inlined if the expression it returns reads parameters and applies operators
+# at most this many times in total
+INLINE_MAX_SIZE = 16
+
+foldable = (codes.Int, codes.Float, codes.String, codes.Bool, codes.Nil)
+literals = foldable + (codes.Hex, codes.Regex)
+
+# Builtins that compute a value from their arguments alone, a call of one with arguments that
+# don't change in a loop gives the same value on every iteration
+pure_builtins = frozenset({
+    'len', 'type', 'to_int', 'to_float', 'to_string', 'to_bool', 'is_callable', 'is_class'
+})
+
+# Nodes that can change the values a loop reads, or run code that might
+unquiet = (
+    codes.New, codes.FuncDef, codes.FuncExpr, codes.AttrFuncDef, codes.SetSelf, codes.Struct,
+    codes.Enum, codes.Import
+)
+
+# The names of the variables the optimizer adds, they aren't attributes of the module they're in
+temporary_name = re_compile(r'__(invariant|tail)\d+')
+
+
+def to_object(node):
+    """Converts a literal node into the object running it gives"""
+
+    from sapling.objects import Int, Float, String, Hex, Regex, NIL, to_bool
+
+    match node:
+        case codes.Int():
+            return Int(node.value)
+        case codes.Float():
+            return Float(node.value)
+        case codes.String():
+            return String(node.value)
+        case codes.Bool():
+            return to_bool(node.value)
+        case codes.Nil():
+            return NIL
+        case codes.Hex():
+            return Hex(node.value)
+        case codes.Regex():
+            return Regex(re_compile(node.value))
+
+
+def to_value(node):
+    """Converts a literal node into the value compiled code uses for it, ints, floats, strings
+    and bools are raw Python values"""
+
+    from sapling.objects import unbox
+
+    return unbox(to_object(node))
+
+
+def to_literal(value, line: int, column: int):
+    """Converts an object back into a literal node, None if it can't be written as one"""
+
+    match type(value).__name__:
+        case 'Int':
+            return codes.Int(line, column, value.value)
+        case 'Float':
+            return codes.Float(line, column, value.value)
+        case 'String' if len(value.value) <= MAX_FOLDED_LENGTH:
+            return codes.String(line, column, value.value)
+        case 'Bool':
+            return codes.Bool(line, column, value.value)
+        case 'Nil':
+            return codes.Nil(line, column)
+
+
+def fold_binaryop(node: codes.BinaryOp):
+    """Folds an operator applied to two literals. It isn't folded when applying it fails, so the
+    error is still raised when it is run.
+
+    Args:
+        node (codes.BinaryOp): The operation, its operands are already optimized
+
+    Returns:
+        The literal the operation results in, or the operation if it can't be folded
+    """
+
+    if not isinstance(node.left, foldable) or not isinstance(node.right, foldable):
+        return node
+
+    try:
+        value = operators[node.op](to_object(node.left), to_object(node.right))
+    except (TypeError, ZeroDivisionError):
+        return node
+
+    literal = to_literal(value, node.line, node.column)
+    return literal if literal is not None else node
+
+
+def walk(node) -> Iterator:
+    """Yields every node in the node, and the node itself"""
+
+    if isinstance(node, tuple) and hasattr(node, '_fields'):
+        yield node
+
+    if isinstance(node, (tuple, list)):
+        for item in node:
+            yield from walk(item)
+    elif isinstance(node, dict):
+        for key, value in node.items():
+            yield from walk(key)
+            yield from walk(value)
+
+
+def replace(node, replacements: dict[int, codes.Id]):
+    """Replaces the nodes with the ids given (the nodes themselves, not equal ones)"""
+
+    if id(node) in replacements:
+        return replacements[id(node)]
+
+    match node:
+        case tuple() if hasattr(node, '_fields'):
+            return node._make(replace(item, replacements) for item in node)
+        case list() | tuple():
+            return type(node)(replace(item, replacements) for item in node)
+        case dict():
+            return {
+                replace(key, replacements): replace(value, replacements)
+                for key, value in node.items()
+            }
+
+    return node
+
+
+def always_returns(stmt) -> bool:
+    """Whether running a statement always ends in a return"""
+
+    match stmt:
+        case codes.Return():
+            return True
+        case codes.If() if stmt.otherwise is not None:
+            bodies = [stmt.then, stmt.otherwise] + [body for _, body in stmt.elseif_chain or ()]
+            return all(body.stmts and always_returns(body.stmts[-1]) for body in bodies)
+
+    return False
+
+
+def constant_truth(condition) -> bool | None:
+    """Whether a condition is true, None if it isn't a literal"""
+
+    from sapling.objects import truthy
+
+    if isinstance(condition, foldable + (codes.Hex,)):
+        return truthy(to_value(condition))
+
+
+def count_bindings(node, counts: dict[str, int]) -> dict[str, int]:
+    """Counts the number of places each name is bound, anywhere in the node"""
+
+    match node:
+        case codes.Assign():
+            counts[node.name] = counts.get(node.name, 0) + 1
+        case codes.FuncDef():
+            counts[node.name.value] = counts.get(node.name.value, 0) + 1
+        case codes.Param() | codes.Struct() | codes.Enum():
+            counts[node.name] = counts.get(node.name, 0) + 1
+        case codes.ArrayComp() | codes.For():
+            counts[node.ident] = counts.get(node.ident, 0) + 1
+        case codes.Import():
+            # The names an import binds depend on the files found when it's run
+            names = node.name if isinstance(node.name, list) else [node.name]
+            for name in names:
+                name = name[1:-1].replace('-', '_').split('/')[-1]
+                counts[name] = counts.get(name, 0) + 2
+
+    if isinstance(node, (tuple, list)):
+        for item in node:
+            count_bindings(item, counts)
+    elif isinstance(node, dict):
+        for key, value in node.items():
+            count_bindings(key, counts)
+            count_bindings(value, counts)
+
+    return counts
+
+
+def evaluation_order(expr, params: list[str], events: list) -> list | None:
+    """Lists what evaluating an expression an inlined function returns does, in order. The
+    index of a parameter is added where it is read and None where an operator is applied.
+
+    Args:
+        expr: The expression
+        params (list[str]): The names of the parameters of the function
+        events (list): The list the events are added to
+
+    Returns:
+        list | None: The events, None if the expression can't be inlined
+    """
+
+    match expr:
+        case codes.Id(value=name) if name in params:
+            events.append(params.index(name))
+        case _ if isinstance(expr, foldable):
+            pass
+        case codes.BinaryOp():
+            for operand in (expr.left, expr.right):
+                if evaluation_order(operand, params, events) is None:
+                    return None
+
+            events.append(None)
+        case codes.UnaryOp():
+            if evaluation_order(expr.expr, params, events) is None:
+                return None
+
+            events.append(None)
+        case codes.Index():
+            for operand in (expr.expr, expr.item):
+                if evaluation_order(operand, params, events) is None:
+                    return None
+
+            events.append(None)
+        case _:
+            return None
+
+    return events
+
+
+def inlinable(func: codes.FuncDef):
+    """Gets the expression a function can be inlined as, or None if it can't be.
+
+    A function can be inlined if its body only returns an expression of its parameters,
+    literals and operators, that reads each parameter once, in order, before applying any
+    operator. The arguments of a call are then evaluated in the same order and before the
+    same operators as when the function is called, so inlining it can't change what the call
+    does, or the error it raises. Such a function can't call anything, so it isn't recursive.
+    """
+
+    params = func.params.params if func.params else []
+    if any(param.annotation != 'any' or param.default is not None for param in params):
+        return None
+
+    stmts = func.body.stmts
+    if len(stmts) != 1 or not isinstance(stmts[0], codes.Return):
+        return None
+
+    names = [param.name for param in params]
+    events = evaluation_order(stmts[0].value, names, [])
+    if events is None or len(events) > INLINE_MAX_SIZE:
+        return None
+
+    reads = [event for event in events if event is not None]
+    if reads != list(range(len(names))):
+        return None
+
+    if names and None in events[:events.index(len(names) - 1)]:
+        return None
+
+    return stmts[0].value
+
+
+def substitute(expr, args: dict):
+    """Replaces the parameters read in an inlined expression with the arguments"""
+
+    match expr:
+        case codes.Id(value=name) if name in args:
+            return args[name]
+        case codes.BinaryOp():
+            return expr._replace(
+                left=substitute(expr.left, args), right=substitute(expr.right, args)
+            )
+        case codes.UnaryOp():
+            return expr._replace(expr=substitute(expr.expr, args))
+        case codes.Index():
+            return expr._replace(
+                expr=substitute(expr.expr, args), item=substitute(expr.item, args)
+            )
+
+    return expr
+
+
+class Optimizer:
+    """Optimizes the statements of a module, in the order they are run"""
+
+    def __init__(self, stmts, inline: bool = True):
+        self.bindings = count_bindings(stmts, {})
+        self.inline = inline
+
+        # The constants that can be propagated, mapped to their literal values
+        self.consts = {}
+
+        # The functions that can be inlined, mapped to their parameter names and the expression
+        # they return, and the names and positions of the calls inlined
+        self.inlinable = {}
+        self.inlined = []
+
+        # Another thread, or a module run by an import, could change the values a loop reads
+        self.names = names_in(stmts, set())
+        self.hoisting = 'Threads' not in self.names and not any(
+            isinstance(node, codes.Import) for node in walk(stmts)
+        )
+        self.temporaries = 0
+
+        # The names read anywhere, and the number of functions the node being optimized is in
+        self.reads = {node.value for node in walk(stmts) if isinstance(node, codes.Id)} | {
+            node.name for node in walk(stmts)
+            if isinstance(node, codes.Assign) and node.operation != ''
+        }
+        self.functions = 0
+
+    def optimize(self, node):
+        match node:
+            case codes.Id(value=name) if name in self.consts:
+                return self.consts[name]._replace(line=node.line, column=node.column)
+            case codes.FuncDef() if node.name.value == 'main':
+                # VM.run calls main before the constants are assigned
+                return node
+            case codes.Call(func=codes.Id(value=name)) if name in self.inlinable:
+                names, expr = self.inlinable[name]
+                args = node.args.args if node.args else []
+                if len(args) != len(names) or any(arg.name is not None for arg in args):
+                    return node._replace(args=self.optimize(node.args))
+
+                self.inlined.append((name, node.line, node.column))
+                return self.optimize(substitute(expr, {
+                    param: self.optimize(arg.value) for param, arg in zip(names, args)
+                }))
+            case codes.BinaryOp():
+                return fold_binaryop(node._replace(
+                    left=self.optimize(node.left), right=self.optimize(node.right)
+                ))
+            case codes.FuncDef() | codes.AttrFuncDef() | codes.FuncExpr():
+                self.functions += 1
+                try:
+                    node = node._replace(
+                        params=self.optimize(node.params), body=self.optimize(node.body)
+                    )
+                finally:
+                    self.functions -= 1
+
+                return self.eliminate_tail_calls(node) if isinstance(node, codes.FuncDef) else node
+            case codes.Body():
+                return node._replace(stmts=self.block(node.stmts))
+            case tuple() if hasattr(node, '_fields'):
+                return node._make(self.optimize(item) for item in node)
+            case list() | tuple():
+                return type(node)(self.optimize(item) for item in node)
+            case dict():
+                return {self.optimize(key): self.optimize(value) for key, value in node.items()}
+            case _:
+                return node
+
+    def block(self, stmts) -> list:
+        optimized = []
+        for stmt in stmts:
+            for stmt in self.eliminate(self.optimize(stmt)):
+                optimized += self.hoist(stmt)
+
+            # The statements after a return are never run
+            if optimized and always_returns(optimized[-1]):
+                break
+
+        return optimized
+
+    def eliminate(self, stmt) -> list:
+        """Removes the parts of an optimized statement that are never run, or whose result is
+        never used
+
+        Args:
+            stmt: The statement
+
+        Returns:
+            list: The statements to run in place of it
+        """
+
+        match stmt:
+            case codes.If():
+                return self.eliminate_if(stmt)
+            case codes.While() if constant_truth(stmt.condition) is False:
+                return []
+            case codes.Repeat() if constant_truth(stmt.condition) is True:
+                return []
+            case codes.Assign(operation='', constant=False, type='any') if self.functions\
+                    and isinstance(stmt.value, foldable + (codes.Hex,))\
+                    and stmt.name not in self.reads and self.bindings.get(stmt.name) == 1:
+                # A local variable that is never read, assigned a value that can't fail to be made
+                return []
+
+        return [stmt]
+
+    def eliminate_if(self, stmt: codes.If) -> list:
+        """Removes the branches of an if with literal conditions that are never run, and the
+        if itself when the branch it runs is known"""
+
+        branches = []
+        otherwise = stmt.otherwise
+        for condition, body in [(stmt.condition, stmt.then)] + list(stmt.elseif_chain or ()):
+            truth = constant_truth(condition)
+            if truth is True:
+                # The branches after it are never run
+                otherwise = body
+                break
+
+            if truth is None:
+                branches.append((condition, body))
+
+        if not branches:
+            return otherwise.stmts if otherwise is not None else []
+
+        if len(branches) == 1 + len(stmt.elseif_chain or ()) and otherwise is stmt.otherwise:
+            return [stmt]
+
+        (condition, then), *elseif_chain = branches
+        return [stmt._replace(
+            condition=condition, then=then, otherwise=otherwise, elseif_chain=elseif_chain or None
+        )]
+
+    def is_quiet(self, node) -> bool:
+        """Whether running the node can only change the variables it assigns, and print"""
+
+        for item in walk(node):
+            if isinstance(item, unquiet):
+                return False
+
+            if isinstance(item, codes.Call) and not self.is_builtin(item.func, {'print'}):
+                return False
+
+        return True
+
+    def is_builtin(self, func, others: set[str] = frozenset()) -> bool:
+        """Whether the function called is a pure builtin or one of the others given, and its name
+        is never bound over"""
+
+        return isinstance(func, codes.Id) and func.value not in self.bindings\
+            and (func.value in pure_builtins or func.value in others)
+
+    def is_invariant(self, expr, bound: dict[str, int]) -> bool:
+        """Whether an expression gives the same value on every iteration of a loop that is quiet
+        and binds the names given"""
+
+        match expr:
+            case codes.Id(value=name):
+                return name not in bound
+            case _ if isinstance(expr, literals):
+                return True
+            case codes.BinaryOp():
+                return self.is_invariant(expr.left, bound)\
+                    and self.is_invariant(expr.right, bound)
+            case codes.UnaryOp():
+                return self.is_invariant(expr.expr, bound)
+            case codes.Index():
+                return self.is_invariant(expr.expr, bound) and self.is_invariant(expr.item, bound)
+            case codes.Call() if self.is_builtin(expr.func):
+                args = expr.args.args if expr.args else []
+                return all(
+                    arg.name is None and self.is_invariant(arg.value, bound) for arg in args
+                )
+
+        return False
+
+    def find_invariants(self, expr, bound: dict[str, int], found: list) -> list:
+        """Finds the largest invariant expressions in an expression worth computing once, only
+        looking into the parts of it that are always evaluated"""
+
+        if not isinstance(expr, (codes.Id,) + literals) and self.is_invariant(expr, bound):
+            found.append(expr)
+            return found
+
+        match expr:
+            case codes.BinaryOp():
+                self.find_invariants(expr.left, bound, found)
+                self.find_invariants(expr.right, bound, found)
+            case codes.UnaryOp():
+                self.find_invariants(expr.expr, bound, found)
+            case codes.Index():
+                self.find_invariants(expr.expr, bound, found)
+                self.find_invariants(expr.item, bound, found)
+            case codes.Attribute(null_safe=False):
+                self.find_invariants(expr.base, bound, found)
+            case codes.Call():
+                for arg in expr.args.args if expr.args else []:
+                    self.find_invariants(arg.value, bound, found)
+            case codes.Array():
+                for arg in expr.value:
+                    self.find_invariants(arg.value, bound, found)
+
+        return found
+
+    def hoist(self, loop) -> list:
+        """Moves the invariant expressions evaluated on every iteration of a loop into variables
+        assigned before it.
+
+        The loop must be quiet, so nothing it runs can change the values the expressions read.
+        The condition of a loop is evaluated before it runs the body, so the expressions in it
+        are assigned right before the loop. The expressions in the body are only taken from
+        the statements run before anything is printed, and are assigned under an if with the
+        condition, so they aren't evaluated if the body isn't run. They are also only taken up
+        to the first statement that may return or call a function that isn't a pure builtin,
+        as the ones after it might not be run.
+
+        Args:
+            loop: An optimized statement
+
+        Returns:
+            list: The statements to run in place of the loop
+        """
+
+        if not isinstance(loop, (codes.While, codes.Repeat)) or not self.hoisting\
+                or not self.is_quiet(loop):
+            return [loop]
+
+        bound = count_bindings(loop, {})
+        before = self.find_invariants(loop.condition, bound, [])
+
+        guarded = []
+        if not self.prints(loop.condition):
+            for stmt in loop.body.stmts:
+                if self.prints(stmt):
+                    break
+
+                match stmt:
+                    case codes.Assign():
+                        self.find_invariants(stmt.value, bound, guarded)
+                    case codes.If() | codes.While() | codes.Repeat():
+                        self.find_invariants(stmt.condition, bound, guarded)
+                    case codes.For():
+                        self.find_invariants(stmt.iterable, bound, guarded)
+                    case codes.Return():
+                        self.find_invariants(stmt.value, bound, guarded)
+                    case _:
+                        self.find_invariants(stmt, bound, guarded)
+
+                # The statements after one that may end the iteration aren't always run
+                if self.may_exit(stmt):
+                    break
+
+        if not before and not guarded:
+            return [loop]
+
+        replacements = {}
+        assigns = []
+        for expr in before + guarded:
+            name = self.temporary('invariant')
+            replacements[id(expr)] = codes.Id(expr.line, expr.column, name)
+            assigns.append(codes.Assign(expr.line, expr.column, name, expr, False, '', 'any'))
+
+        loop = replace(loop, replacements)
+        if not guarded:
+            return assigns + [loop]
+
+        guarded_body = codes.Body(loop.line, loop.column, assigns[len(before):] + [loop])
+        if isinstance(loop, codes.While):
+            guard = codes.If(loop.line, loop.column, loop.condition, guarded_body, None, None)
+        else:
+            guard = codes.If(
+                loop.line, loop.column, loop.condition, codes.Body(loop.line, loop.column, []),
+                guarded_body, None
+            )
+
+        return assigns[:len(before)] + [guard]
+
+    def may_exit(self, stmt) -> bool:
+        """Whether running a statement may return or call a function that isn't a pure builtin"""
+
+        return any(
+            isinstance(item, codes.Return)
+            or isinstance(item, codes.Call) and not self.is_builtin(item.func)
+            for item in walk(stmt)
+        )
+
+    def prints(self, node) -> bool:
+        return any(
+            isinstance(item, codes.Call) and isinstance(item.func, codes.Id)
+            and item.func.value == 'print' for item in walk(node)
+        )
+
+    def temporary(self, kind: str) -> str:
+        """Makes a name for a variable the optimizer adds, not used anywhere else"""
+
+        while True:
+            name = f'__{kind}{self.temporaries}'
+            self.temporaries += 1
+            if name not in self.names:
+                return name
+
+    def eliminate_tail_calls(self, func: codes.FuncDef) -> codes.FuncDef:
+        """Turns the calls a function returns of itself into a loop. The body runs in a loop,
+        and a return of a call of the function assigns the arguments to the parameters instead,
+        so the next iteration runs the call in the same frame.
+
+        Only a return nothing can run after once it is replaced is turned into a loop, that is
+        one at the end of the body or of a branch of an if at the end. An if without an else
+        whose branches all return is given the statements after it as its else first.
+
+        Args:
+            func (codes.FuncDef): The optimized function
+
+        Returns:
+            codes.FuncDef: The function, with its body in a loop if it returns a call of itself
+        """
+
+        name = func.name.value
+        params = func.params.params if func.params else []
+
+        # Other names could be bound to the function, and the frame of each call has to be kept
+        # when a function defined in the body can keep it
+        if name == 'main' or self.bindings.get(name) != 1 or any(
+            param.annotation != 'any' or param.default is not None for param in params
+        ) or any(isinstance(node, unquiet) for node in walk(func.body.stmts)):
+            return func
+
+        stmts = func.body.stmts
+        if not stmts or not always_returns(stmts[-1]):
+            # Running past the end of the body returns nil, it can't start the next iteration
+            stmts = stmts + [
+                codes.Return(func.line, func.column, codes.Nil(func.line, func.column))
+            ]
+
+        looped = self.tail_block(stmts, name, [param.name for param in params])
+        if looped is None:
+            return func
+
+        body = func.body
+        return func._replace(body=body._replace(stmts=[codes.While(
+            body.line, body.column, codes.Bool(body.line, body.column, True),
+            body._replace(stmts=looped)
+        )]))
+
+    def tail_block(self, stmts: list, name: str, params: list[str]) -> list | None:
+        """Replaces the returns of calls of the function at the end of a block, None if there
+        aren't any"""
+
+        # The statements after an if whose branches all return only run when none is taken
+        for i, stmt in enumerate(stmts[:-1]):
+            if isinstance(stmt, codes.If) and stmt.otherwise is None and all(
+                body.stmts and always_returns(body.stmts[-1])
+                for body in [stmt.then] + [body for _, body in stmt.elseif_chain or ()]
+            ):
+                stmts = stmts[:i] + [stmt._replace(
+                    otherwise=codes.Body(stmts[i + 1].line, stmts[i + 1].column, stmts[i + 1:])
+                )]
+                break
+
+        match stmts[-1] if stmts else None:
+            case codes.Return(value=codes.Call(func=codes.Id(value=called), args=args))\
+                    if called == name and len(args.args if args else []) == len(params)\
+                    and all(arg.name is None for arg in (args.args if args else [])):
+                return stmts[:-1] + self.rebind(stmts[-1], params)
+            case codes.If():
+                stmt = stmts[-1]
+                then = self.tail_block(stmt.then.stmts, name, params)
+                chain = [
+                    (condition, self.tail_block(body.stmts, name, params))
+                    for condition, body in stmt.elseif_chain or ()
+                ]
+                otherwise = self.tail_block(stmt.otherwise.stmts, name, params)\
+                    if stmt.otherwise is not None else None
+
+                if then is None and otherwise is None and all(body is None for _, body in chain):
+                    return None
+
+                return stmts[:-1] + [stmt._replace(
+                    then=stmt.then._replace(stmts=then) if then is not None else stmt.then,
+                    elseif_chain=[
+                        (condition, body._replace(stmts=looped) if looped is not None else body)
+                        for (condition, looped), (_, body) in zip(chain, stmt.elseif_chain)
+                    ] if stmt.elseif_chain else stmt.elseif_chain,
+                    otherwise=stmt.otherwise._replace(stmts=otherwise)
+                    if otherwise is not None else stmt.otherwise
+                )]
+
+        return None
+
+    def rebind(self, stmt: codes.Return, params: list[str]) -> list:
+        """Assigns the arguments of a returned call of the function to its parameters, all of
+        them are evaluated before any is assigned"""
+
+        args = [arg.value for arg in stmt.value.args.args] if stmt.value.args else []
+        changed = [
+            (param, arg) for param, arg in zip(params, args)
+            if not (isinstance(arg, codes.Id) and arg.value == param)
+        ]
+        if len(changed) == 1:
+            (param, arg), = changed
+            return [codes.Assign(arg.line, arg.column, param, arg, False, '', 'any')]
+
+        temps = [self.temporary('tail') for _ in changed]
+        return [
+            codes.Assign(arg.line, arg.column, temp, arg, False, '', 'any')
+            for temp, (_, arg) in zip(temps, changed)
+        ] + [
+            codes.Assign(arg.line, arg.column, param, codes.Id(arg.line, arg.column, temp), False,
+                         '', 'any')
+            for temp, (param, arg) in zip(temps, changed)
+        ]
+
+    def module(self, stmts) -> list:
+        optimized = []
+        returned = False
+        for stmt in stmts:
+            # VM.run calls main before the rest of the module, even after a return
+            if returned and not (isinstance(stmt, codes.FuncDef) and stmt.name.value == 'main'):
+                continue
+
+            for stmt in self.eliminate(self.optimize(stmt)):
+                optimized += self.hoist(stmt)
+                self.track(stmt)
+
+            returned = returned or bool(optimized) and always_returns(optimized[-1])
+
+        return optimized
+
+    def track(self, stmt) -> None:
+        """Keeps track of the constants and inlinable functions an optimized statement of the
+        module defines"""
+
+        # A constant is only propagated into the code run after it's assigned
+        if isinstance(stmt, codes.Assign) and stmt.constant and isinstance(stmt.value, foldable)\
+                and self.bindings.get(stmt.name) == 1:
+            self.consts[stmt.name] = stmt.value
+
+        # Like a constant, a function is only inlined into the code run after it's defined
+        if self.inline and isinstance(stmt, codes.FuncDef) and stmt.name.value != 'main'\
+                and self.bindings.get(stmt.name.value) == 1:
+            expr = inlinable(stmt)
+            if expr is not None:
+                params = stmt.params.params if stmt.params else []
+                self.inlinable[stmt.name.value] = ([param.name for param in params], expr)
+
+
+def optimize(code: codes.Code, inline: bool = True, inlined: list | None = None) -> codes.Code:
+    """Optimizes the parsed code of a file
+
+    Args:
+        code (codes.Code): The parsed code
+        inline (bool, optional): Whether calls of small functions are inlined. Defaults to True.
+        inlined (list | None, optional): If given, the names and positions of the inlined calls
+            are added to it. Defaults to None.
+
+    Returns:
+        codes.Code: The optimized code
+    """
+
+    optimizer = Optimizer(code.stmts, inline)
+    code = code._replace(stmts=optimizer.module(code.stmts))
+
+    if inlined is not None:
+        inlined.extend(optimizer.inlined)
+
+    return code
@@ -4,21 +4,31 @@ parser.py
 
 Parses the tokenized source code into bytecode to be run by the Virtual Machine
 
+The LALR table of the grammar is generated into sapling/parsetable.py, so it isn't built every
+time the parser is imported. The table is only used while the grammar hashes the same as when it
+was generated, otherwise RPLY builds it (and caches it itself). Run python -m sapling.parser to
+generate it again after changing the grammar.
+
 """
 
 
 from sys import exit as sys_exit
 from typing import NoReturn
+from pathlib import Path
+import json
 
 from rply import ParserGenerator, LexingError, ParsingError
-from rply.lexer import LexerStream
+from rply.parser import LRParser
+from rply.parsergenerator import LRTable
 from rply.token import Token
 
 from sapling.constants import TOKENS, PRECEDENCE
+from sapling.lexer import TokenStream
+from sapling.parsetable import GRAMMAR_HASH, TABLE
 from sapling.codes import *
 
 
-pg = ParserGenerator(TOKENS, PRECEDENCE)
+pg = ParserGenerator(TOKENS, PRECEDENCE, cache_id='sapling')
 
 
 get_pos = lambda rule: [rule.source_pos.lineno, rule.source_pos.colno]\
@@ -46,7 +56,12 @@ code = pg.production('code : stmts')(lambda p: Code(0, 0, p[0]))
 @pg.production('stmts : stmt')
 @pg.production('stmts : stmts stmt')
 def stmts(p) -> list:
-    return [p[0]] if len(p) == 1 else p[0] + [p[1]]
+    if len(p) == 1:
+        return [p[0]]
+
+    # Lists are added to in place, copying one for each item would take quadratic time
+    p[0].append(p[1])
+    return p[0]
 
 
 expr = pg.production('stmt : expr')(lambda p: p[0])
@@ -105,6 +120,9 @@ if_else_stmt = pg.production('stmt : If expr body Else body')(lambda p:
 while_stmt = pg.production('stmt : While expr body')(lambda p:
     While(*get_pos(p[0]), p[1], p[2])
 )
+for_stmt = pg.production('stmt : For Id In expr body')(lambda p:
+    For(*get_pos(p[0]), p[1].value, p[3], p[4])
+)
 
 @pg.production('stmt : If expr body elseif_chain')
 @pg.production('stmt : If expr body elseif_chain Else body')
@@ -146,13 +164,21 @@ struct_def = pg.production('struct_def : Id Id')(lambda p:
 @pg.production('struct_defs : struct_def')
 @pg.production('struct_defs : struct_defs struct_def')
 def struct_defs(p) -> list:
-    return [p[0]] if len(p) == 1 else p[0] + [p[1]]
+    if len(p) == 1:
+        return [p[0]]
+
+    p[0].append(p[1])
+    return p[0]
 
 
 @pg.production('enum_defs : enum_def')
 @pg.production('enum_defs : enum_defs enum_def')
 def enum_defs(p) -> list:
-    return [p[0]] if len(p) == 1 else p[0] + [p[1]]
+    if len(p) == 1:
+        return [p[0]]
+
+    p[0].append(p[1])
+    return p[0]
 
 
 @pg.production('body : { }')
@@ -164,13 +190,21 @@ def body(p) -> Body:
 @pg.production('import_list : String')
 @pg.production('import_list : import_list , String')
 def import_list(p) -> list:
-    return [p[0].value] if len(p) == 1 else p[0] + [p[2].value]
+    if len(p) == 1:
+        return [p[0].value]
+
+    p[0].append(p[2].value)
+    return p[0]
 
 
 @pg.production('elseif_chain : Else If expr body')
 @pg.production('elseif_chain : elseif_chain Else If expr body')
 def elseif_chain(p) -> list:
-    return [(p[2], p[3])] if len(p) == 4 else p[0] + [(p[3], p[4])]
+    if len(p) == 4:
+        return [(p[2], p[3])]
+
+    p[0].append((p[3], p[4]))
+    return p[0]
 
 
 @pg.production('arg : expr')
@@ -182,7 +216,11 @@ def arg(p):
 @pg.production('args : arg')
 @pg.production('args : args , arg')
 def args(p) -> Args:
-    return Args(*get_pos(p[0]), [p[0]] if len(p) == 1 else p[0].args + [p[2]])
+    if len(p) == 1:
+        return Args(*get_pos(p[0]), [p[0]])
+
+    p[0].args.append(p[2])
+    return p[0]
 
 
 param = pg.production('param : Id')(lambda p:
@@ -207,12 +245,20 @@ def default_param(p) -> Param:
 @pg.production('params : param')
 @pg.production('params : params , param')
 def params(p) -> Params:
-    return Params(*get_pos(p[0]), [p[0]] if len(p) == 1 else p[0].params + [p[2]])
+    if len(p) == 1:
+        return Params(*get_pos(p[0]), [p[0]])
+
+    p[0].params.append(p[2])
+    return p[0]
 
 @pg.production('dictionary_items : expr : expr')
 @pg.production('dictionary_items : dictionary_items , expr : expr')
 def dictionary_items(p) -> dict:
-    return {p[0]: p[2]} if len(p) == 3 else p[0] + {p[2]: p[4]}
+    if len(p) == 3:
+        return {p[0]: p[2]}
+
+    p[0][p[2]] = p[4]
+    return p[0]
 
 
 @pg.production('attr : expr . Id')
@@ -308,9 +354,52 @@ array_comp = pg.production('expr : { expr : Id In expr }')(lambda p:
 )
 
 
-parser = pg.build()
+def build_parser() -> LRParser:
+    """Builds the parser from the generated table, or has RPLY build the table if the grammar has
+    changed since it was generated
+
+    Returns:
+        LRParser: The parser
+    """
+
+    grammar = pg.build_grammar()
+    if GRAMMAR_HASH != pg.compute_grammar_hash(grammar) or not pg.data_is_valid(grammar, TABLE):
+        return pg.build()
+
+    return LRParser(LRTable.from_cache(grammar, TABLE), pg.error_handler)
+
+
+def generate_table() -> None:
+    """Generates sapling/parsetable.py, with the table of the grammar"""
+
+    parser = pg.build()
+    grammar = parser.lr_table.grammar
+
+    # The table is kept as JSON, a literal of it would take far longer to load than parsing it
+    table = json.dumps(pg.serialize_table(parser.lr_table), separators=(',', ':'))
+    chunks = '\n'.join(f'    {table[i:i + 90]!r}' for i in range(0, len(table), 90))
+    Path(__file__).with_name('parsetable.py').write_text(
+        '"""\n'
+        'parsetable.py\n'
+        '-------------\n'
+        '\n'
+        'The LALR table of the grammar in sapling/parser.py, generated by python -m sapling.parser\n'
+        '\n'
+        '"""\n'
+        '\n'
+        'import json\n'
+        '\n'
+        '\n'
+        f'GRAMMAR_HASH = {pg.compute_grammar_hash(grammar)!r}\n'
+        '\n'
+        f'TABLE = json.loads(\n{chunks}\n)\n',
+        'utf-8'
+    )
+
 
-def parse(tokens: LexerStream) -> Code:
+parser = build_parser()
+
+def parse(tokens: TokenStream) -> Code:
     try:
         return parser.parse(tokens)
     except ParsingError as e:
@@ -319,7 +408,7 @@ def parse(tokens: LexerStream) -> Code:
         return lex_error(e, tokens)
 
 
-def parsing_error(e: ParsingError, tokens: LexerStream) -> NoReturn:
+def parsing_error(e: ParsingError, tokens: TokenStream) -> NoReturn:
     pos = e.source_pos
     src = tokens.s.splitlines()
 
@@ -335,11 +424,15 @@ def parsing_error(e: ParsingError, tokens: LexerStream) -> NoReturn:
     sys_exit(1)
 
 
-def lex_error(e: LexingError, tokens: LexerStream) -> NoReturn:
+def lex_error(e: LexingError, tokens: TokenStream) -> NoReturn:
     pos = e.source_pos
     src = tokens.s.splitlines()[pos.lineno - 1]
 
     print(src)
-    print(' ' * pos.idx + '^')
-    print(f'SyntaxError: Unexpected syntax \'{src[pos.idx]}\'')
+    print(' ' * (pos.colno - 1) + '^')
+    print(f'SyntaxError: Unexpected syntax \'{src[pos.colno - 1]}\'')
     sys_exit(1)
+
+
+if __name__ == '__main__':
+    generate_table()
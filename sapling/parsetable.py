@@ -0,0 +1,483 @@
+"""
+parsetable.py
+-------------
+
+The LALR table of the grammar in sapling/parser.py, generated by python -m sapling.parser
+
+"""
+
+import json
+
+
+GRAMMAR_HASH = 'b8dce206486b473b8733ead0e60849c2afdc3221'
+
+TABLE = json.loads(
+    '{"lr_action":[{"$end":-1,"Id":19,"Const":3,"Func":8,"If":2,"While":16,"For":1,"Import":14,'
+    '"Repeat":10,"Return":13,"Enum":22,"Struct":4,"Regex":15,"Float":21,"String":11,"Hex":18,"N'
+    'il":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":27},{"Id":28,"Regex":15,"Float":21,"S'
+    'tring":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":30},{"Id":31},{"'
+    'OR":-83,"AND":-83,">=":-83,"<=":-83,">":-83,"<":-83,"!=":-83,"==":-83,"%":-83,"/":-83,"*":'
+    '-83,"-":-83,"+":-83,"(":-83,"[":-83,".":-83,"Id":-83,"Const":-83,"Func":-83,"If":-83,"Whil'
+    'e":-83,"For":-83,"Import":-83,"Repeat":-83,"Return":-83,"Enum":-83,"Struct":-83,"Regex":-8'
+    '3,"Float":-83,"String":-83,"Hex":-83,"Nil":-83,"Bool":-83,"Int":-83,"{":-83,"!":-83,"New":'
+    '-83,"$end":-83,"}":-83,":":-83,",":-83,"]":-83,")":-83},{"Id":28,"Regex":15,"Float":21,"St'
+    'ring":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":28,"Regex":15,"Fl'
+    'oat":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":34},{"'
+    'OR":-61,"AND":-61,">=":-61,"<=":-61,">":-61,"<":-61,"!=":-61,"==":-61,"%":-61,"/":-61,"*":'
+    '-61,"-":-61,"+":-61,"(":-61,"[":-61,".":-61,"Id":-61,"Const":-61,"Func":-61,"If":-61,"Whil'
+    'e":-61,"For":-61,"Import":-61,"Repeat":-61,"Return":-61,"Enum":-61,"Struct":-61,"Regex":-6'
+    '1,"Float":-61,"String":-61,"Hex":-61,"Nil":-61,"Bool":-61,"Int":-61,"{":-61,"!":-61,"New":'
+    '-61,"$end":-61,"}":-61,":":-61,",":-61,"]":-61,")":-61},{"{":36},{"OR":-59,"AND":-59,">=":'
+    '-59,"<=":-59,">":-59,"<":-59,"!=":-59,"==":-59,"%":-59,"/":-59,"*":-59,"-":-59,"+":-59,"("'
+    ':-59,"[":-59,".":-59,"Id":-59,"Const":-59,"Func":-59,"If":-59,"While":-59,"For":-59,"Impor'
+    't":-59,"Repeat":-59,"Return":-59,"Enum":-59,"Struct":-59,"Regex":-59,"Float":-59,"String":'
+    '-59,"Hex":-59,"Nil":-59,"Bool":-59,"Int":-59,"{":-59,"!":-59,"New":-59,"$end":-59,"}":-59,'
+    '":":-59,",":-59,"]":-59,")":-59},{"OR":-62,"AND":-62,">=":-62,"<=":-62,">":-62,"<":-62,"!='
+    '":-62,"==":-62,"%":-62,"/":-62,"*":-62,"-":-62,"+":-62,"(":-62,"[":-62,".":-62,"Id":-62,"C'
+    'onst":-62,"Func":-62,"If":-62,"While":-62,"For":-62,"Import":-62,"Repeat":-62,"Return":-62'
+    ',"Enum":-62,"Struct":-62,"Regex":-62,"Float":-62,"String":-62,"Hex":-62,"Nil":-62,"Bool":-'
+    '62,"Int":-62,"{":-62,"!":-62,"New":-62,"$end":-62,"}":-62,":":-62,",":-62,"]":-62,")":-62}'
+    ',{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!"'
+    ':6,"New":7},{"String":38},{"OR":-57,"AND":-57,">=":-57,"<=":-57,">":-57,"<":-57,"!=":-57,"'
+    '==":-57,"%":-57,"/":-57,"*":-57,"-":-57,"+":-57,"(":-57,"[":-57,".":-57,"Id":-57,"Const":-'
+    '57,"Func":-57,"If":-57,"While":-57,"For":-57,"Import":-57,"Repeat":-57,"Return":-57,"Enum"'
+    ':-57,"Struct":-57,"Regex":-57,"Float":-57,"String":-57,"Hex":-57,"Nil":-57,"Bool":-57,"Int'
+    '":-57,"{":-57,"!":-57,"New":-57,"$end":-57,"}":-57,":":-57,",":-57,"]":-57,")":-57},{"Id":'
+    '28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New'
+    '":7},{"$end":-2,"Id":19,"Const":3,"Func":8,"If":2,"While":16,"For":1,"Import":14,"Repeat":'
+    '10,"Return":13,"Enum":22,"Struct":4,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bo'
+    'ol":12,"Int":20,"{":26,"!":6,"New":7},{"OR":-60,"AND":-60,">=":-60,"<=":-60,">":-60,"<":-6'
+    '0,"!=":-60,"==":-60,"%":-60,"/":-60,"*":-60,"-":-60,"+":-60,"(":-60,"[":-60,".":-60,"Id":-'
+    '60,"Const":-60,"Func":-60,"If":-60,"While":-60,"For":-60,"Import":-60,"Repeat":-60,"Return'
+    '":-60,"Enum":-60,"Struct":-60,"Regex":-60,"Float":-60,"String":-60,"Hex":-60,"Nil":-60,"Bo'
+    'ol":-60,"Int":-60,"{":-60,"!":-60,"New":-60,"$end":-60,"}":-60,":":-60,",":-60,"]":-60,")"'
+    ':-60},{"=":43,"Id":46,"%":42,"/":48,"*":45,"-":44,"+":47,"OR":-56,"AND":-56,">=":-56,"<=":'
+    '-56,">":-56,"<":-56,"!=":-56,"==":-56,"(":-56,"[":-56,".":-56,"Const":-56,"Func":-56,"If":'
+    '-56,"While":-56,"For":-56,"Import":-56,"Repeat":-56,"Return":-56,"Enum":-56,"Struct":-56,"'
+    'Regex":-56,"Float":-56,"String":-56,"Hex":-56,"Nil":-56,"Bool":-56,"Int":-56,"{":-56,"!":-'
+    '56,"New":-56,"$end":-56,"}":-56},{"OR":-63,"AND":-63,">=":-63,"<=":-63,">":-63,"<":-63,"!='
+    '":-63,"==":-63,"%":-63,"/":-63,"*":-63,"-":-63,"+":-63,"(":-63,"[":-63,".":-63,"Id":-63,"C'
+    'onst":-63,"Func":-63,"If":-63,"While":-63,"For":-63,"Import":-63,"Repeat":-63,"Return":-63'
+    ',"Enum":-63,"Struct":-63,"Regex":-63,"Float":-63,"String":-63,"Hex":-63,"Nil":-63,"Bool":-'
+    '63,"Int":-63,"{":-63,"!":-63,"New":-63,"$end":-63,"}":-63,":":-63,",":-63,"]":-63,")":-63}'
+    ',{"OR":-58,"AND":-58,">=":-58,"<=":-58,">":-58,"<":-58,"!=":-58,"==":-58,"%":-58,"/":-58,"'
+    '*":-58,"-":-58,"+":-58,"(":-58,"[":-58,".":-58,"Id":-58,"Const":-58,"Func":-58,"If":-58,"W'
+    'hile":-58,"For":-58,"Import":-58,"Repeat":-58,"Return":-58,"Enum":-58,"Struct":-58,"Regex"'
+    ':-58,"Float":-58,"String":-58,"Hex":-58,"Nil":-58,"Bool":-58,"Int":-58,"{":-58,"!":-58,"Ne'
+    'w":-58,"$end":-58,"}":-58,":":-58,",":-58,"]":-58,")":-58},{"Id":49},{"$end":0},{"Id":-5,"'
+    'Const":-5,"Func":-5,"If":-5,"While":-5,"For":-5,"Import":-5,"Repeat":-5,"Return":-5,"Enum"'
+    ':-5,"Struct":-5,"Regex":-5,"Float":-5,"String":-5,"Hex":-5,"Nil":-5,"Bool":-5,"Int":-5,"{"'
+    ':-5,"!":-5,"New":-5,"$end":-5,"}":-5,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":5'
+    '5,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Id":-4,"Const":-4,"Fu'
+    'nc":-4,"If":-4,"While":-4,"For":-4,"Import":-4,"Repeat":-4,"Return":-4,"Enum":-4,"Struct":'
+    '-4,"Regex":-4,"Float":-4,"String":-4,"Hex":-4,"Nil":-4,"Bool":-4,"Int":-4,"{":-4,"!":-4,"N'
+    'ew":-4,"$end":-4,"}":-4},{"}":67,"Id":68,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":'
+    '9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"In":72},{"OR":-56,"AND":-56,">=":-56,"<=":-56'
+    ',">":-56,"<":-56,"!=":-56,"==":-56,"%":-56,"/":-56,"*":-56,"-":-56,"+":-56,"(":-56,"[":-56'
+    ',".":-56,"{":-56,"Id":-56,"Const":-56,"Func":-56,"If":-56,"While":-56,"For":-56,"Import":-'
+    '56,"Repeat":-56,"Return":-56,"Enum":-56,"Struct":-56,"Regex":-56,"Float":-56,"String":-56,'
+    '"Hex":-56,"Nil":-56,"Bool":-56,"Int":-56,"!":-56,"New":-56,"$end":-56,"}":-56,":":-56,",":'
+    '-56,"]":-56,")":-56},{"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":5'
+    '9,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52,"{":36},{"Id":75,"=":74},{"{":76},{"OR"'
+    ':60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+"'
+    ':64,"(":65,"[":62,".":52,"Id":-80,"Const":-80,"Func":-80,"If":-80,"While":-80,"For":-80,"I'
+    'mport":-80,"Repeat":-80,"Return":-80,"Enum":-80,"Struct":-80,"Regex":-80,"Float":-80,"Stri'
+    'ng":-80,"Hex":-80,"Nil":-80,"Bool":-80,"Int":-80,"{":-80,"!":-80,"New":-80,"$end":-80,"}":'
+    '-80,":":-80,",":-80,"]":-80,")":-80},{"(":77,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":6'
+    '1,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"[":62,".":52},{"(":79,".":78},{"Unti'
+    'l":80},{"}":81,"Id":19,"Const":3,"Func":8,"If":2,"While":16,"For":1,"Import":14,"Repeat":1'
+    '0,"Return":13,"Enum":22,"Struct":4,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Boo'
+    'l":12,"Int":20,"{":26,"!":6,"New":7},{"Id":-28,"Const":-28,"Func":-28,"If":-28,"While":-28'
+    ',"For":-28,"Import":-28,"Repeat":-28,"Return":-28,"Enum":-28,"Struct":-28,"Regex":-28,"Flo'
+    'at":-28,"String":-28,"Hex":-28,"Nil":-28,"Bool":-28,"Int":-28,"{":-28,"!":-28,"New":-28,"$'
+    'end":-28,"}":-28,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/"'
+    ':58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Id":-26,"Const":-26,"Func":-26,"If":-26,"'
+    'While":-26,"For":-26,"Import":-26,"Repeat":-26,"Return":-26,"Enum":-26,"Struct":-26,"Regex'
+    '":-26,"Float":-26,"String":-26,"Hex":-26,"Nil":-26,"Bool":-26,"Int":-26,"{":-26,"!":-26,"N'
+    'ew":-26,"$end":-26,"}":-26,"From":-40,",":-40},{"From":84,",":83},{"OR":60,"AND":51,">=":5'
+    '7,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,"'
+    '.":52,"{":36},{"Id":-3,"Const":-3,"Func":-3,"If":-3,"While":-3,"For":-3,"Import":-3,"Repea'
+    't":-3,"Return":-3,"Enum":-3,"Struct":-3,"Regex":-3,"Float":-3,"String":-3,"Hex":-3,"Nil":-'
+    '3,"Bool":-3,"Int":-3,"{":-3,"!":-3,"New":-3,"$end":-3,"}":-3},{"=":86},{"Id":28,"Regex":15'
+    ',"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"=":88}'
+    ',{"=":89},{"=":90},{"=":91},{"=":92},{"{":93},{"Id":28,"Regex":15,"Float":21,"String":11,"'
+    'Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":28,"Regex":15,"Float":21,"S'
+    'tring":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":96},{"Id":28,"Re'
+    'gex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{'
+    '"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6'
+    ',"New":7},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"'
+    '{":26,"!":6,"New":7},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12'
+    ',"Int":20,"{":26,"!":6,"New":7},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":'
+    '9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex'
+    '":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":28,"Regex":15,"Float":21,"Stri'
+    'ng":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":28,"Regex":15,"Floa'
+    't":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":28,"Rege'
+    'x":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"I'
+    'd":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"'
+    'New":7},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{"'
+    ':26,"!":6,"New":7},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"'
+    'Int":20,"{":26,"!":6,"New":7},{")":109,"Id":110,"Regex":15,"Float":21,"String":11,"Hex":18'
+    ',"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"}":114,",":113},{"OR":-65,"AND":-65,">'
+    '=":-65,"<=":-65,">":-65,"<":-65,"!=":-65,"==":-65,"%":-65,"/":-65,"*":-65,"-":-65,"+":-65,'
+    '"(":-65,"[":-65,".":-65,"Id":-65,"Const":-65,"Func":-65,"If":-65,"While":-65,"For":-65,"Im'
+    'port":-65,"Repeat":-65,"Return":-65,"Enum":-65,"Struct":-65,"Regex":-65,"Float":-65,"Strin'
+    'g":-65,"Hex":-65,"Nil":-65,"Bool":-65,"Int":-65,"{":-65,"!":-65,"New":-65,"$end":-65,"}":-'
+    '65,":":-65,",":-65,"]":-65,")":-65},{":":-56,"OR":-56,"AND":-56,">=":-56,"<=":-56,">":-56,'
+    '"<":-56,"!=":-56,"==":-56,"%":-56,"/":-56,"*":-56,"-":-56,"+":-56,"(":-56,"[":-56,".":-56,'
+    '"}":-56,",":-56},{"}":117,",":116},{"}":-46,",":-46,")":-46},{":":118,"OR":60,"AND":51,">='
+    '":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":6'
+    '2,"}":-44,",":-44,".":52},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Boo'
+    'l":12,"Int":20,"{":26,"!":6,"New":7},{"Id":-19,"Const":-19,"Func":-19,"If":-19,"While":-19'
+    ',"For":-19,"Import":-19,"Repeat":-19,"Return":-19,"Enum":-19,"Struct":-19,"Regex":-19,"Flo'
+    'at":-19,"String":-19,"Hex":-19,"Nil":-19,"Bool":-19,"Int":-19,"{":-19,"!":-19,"New":-19,"$'
+    'end":-19,"}":-19,"Else":121},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"'
+    'Bool":12,"Int":20,"{":26,"!":6,"New":7},{"=":123},{"Id":124},{")":127,"Id":110,"Regex":15,'
+    '"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":129'
+    '},{")":133,"Id":132},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12'
+    ',"Int":20,"{":26,"!":6,"New":7},{"Until":-38,"Else":-38,"Id":-38,"Const":-38,"Func":-38,"I'
+    'f":-38,"While":-38,"For":-38,"Import":-38,"Repeat":-38,"Return":-38,"Enum":-38,"Struct":-3'
+    '8,"Regex":-38,"Float":-38,"String":-38,"Hex":-38,"Nil":-38,"Bool":-38,"Int":-38,"{":-38,"!'
+    '":-38,"New":-38,"$end":-38,"}":-38},{"}":135,"Id":19,"Const":3,"Func":8,"If":2,"While":16,'
+    '"For":1,"Import":14,"Repeat":10,"Return":13,"Enum":22,"Struct":4,"Regex":15,"Float":21,"St'
+    'ring":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"String":136},{"String'
+    '":137},{"Id":-21,"Const":-21,"Func":-21,"If":-21,"While":-21,"For":-21,"Import":-21,"Repea'
+    't":-21,"Return":-21,"Enum":-21,"Struct":-21,"Regex":-21,"Float":-21,"String":-21,"Hex":-21'
+    ',"Nil":-21,"Bool":-21,"Int":-21,"{":-21,"!":-21,"New":-21,"$end":-21,"}":-21},{"Id":28,"Re'
+    'gex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{'
+    '"Id":-6,"Const":-6,"Func":-6,"If":-6,"While":-6,"For":-6,"Import":-6,"Repeat":-6,"Return":'
+    '-6,"Enum":-6,"Struct":-6,"Regex":-6,"Float":-6,"String":-6,"Hex":-6,"Nil":-6,"Bool":-6,"In'
+    't":-6,"{":-6,"!":-6,"New":-6,"$end":-6,"}":-6,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":'
+    '61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Id":28,"Rege'
+    'x":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"I'
+    'd":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"'
+    'New":7},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{"'
+    ':26,"!":6,"New":7},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"'
+    'Int":20,"{":26,"!":6,"New":7},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,'
+    '"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":144},{"OR":-70,"AND":-70,">=":-70,"<=":-70,'
+    '">":-70,"<":-70,"!=":-70,"==":-70,"%":59,"/":58,"*":63,"-":54,"+":64,"(":-70,"[":-70,".":-'
+    '70,"Id":-70,"Const":-70,"Func":-70,"If":-70,"While":-70,"For":-70,"Import":-70,"Repeat":-7'
+    '0,"Return":-70,"Enum":-70,"Struct":-70,"Regex":-70,"Float":-70,"String":-70,"Hex":-70,"Nil'
+    '":-70,"Bool":-70,"Int":-70,"{":-70,"!":-70,"New":-70,"$end":-70,"}":-70,":":-70,",":-70,"]'
+    '":-70,")":-70},{"OR":-68,"AND":-68,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/'
+    '":58,"*":63,"-":54,"+":64,"(":-68,"[":-68,".":-68,"Id":-68,"Const":-68,"Func":-68,"If":-68'
+    ',"While":-68,"For":-68,"Import":-68,"Repeat":-68,"Return":-68,"Enum":-68,"Struct":-68,"Reg'
+    'ex":-68,"Float":-68,"String":-68,"Hex":-68,"Nil":-68,"Bool":-68,"Int":-68,"{":-68,"!":-68,'
+    '"New":-68,"$end":-68,"}":-68,":":-68,",":-68,"]":-68,")":-68},{"OR":-55,"AND":-55,">=":-55'
+    ',"<=":-55,">":-55,"<":-55,"!=":-55,"==":-55,"%":-55,"/":-55,"*":-55,"-":-55,"+":-55,"(":-5'
+    '5,"[":-55,".":-55,"Id":-55,"Const":-55,"Func":-55,"If":-55,"While":-55,"For":-55,"Import":'
+    '-55,"Repeat":-55,"Return":-55,"Enum":-55,"Struct":-55,"Regex":-55,"Float":-55,"String":-55'
+    ',"Hex":-55,"Nil":-55,"Bool":-55,"Int":-55,"{":-55,"!":-55,"New":-55,"$end":-55,"}":-55,":"'
+    ':-55,",":-55,"]":-55,")":-55},{"OR":-71,"AND":-71,">=":-71,"<=":-71,">":-71,"<":-71,"!=":-'
+    '71,"==":-71,"%":59,"/":58,"*":63,"-":54,"+":64,"(":-71,"[":-71,".":-71,"Id":-71,"Const":-7'
+    '1,"Func":-71,"If":-71,"While":-71,"For":-71,"Import":-71,"Repeat":-71,"Return":-71,"Enum":'
+    '-71,"Struct":-71,"Regex":-71,"Float":-71,"String":-71,"Hex":-71,"Nil":-71,"Bool":-71,"Int"'
+    ':-71,"{":-71,"!":-71,"New":-71,"$end":-71,"}":-71,":":-71,",":-71,"]":-71,")":-71},{"OR":-'
+    '78,"AND":-78,">=":-78,"<=":-78,">":-78,"<":-78,"!=":-78,"==":-78,"%":59,"/":58,"*":63,"-":'
+    '-78,"+":-78,"(":-78,"[":-78,".":-78,"Id":-78,"Const":-78,"Func":-78,"If":-78,"While":-78,"'
+    'For":-78,"Import":-78,"Repeat":-78,"Return":-78,"Enum":-78,"Struct":-78,"Regex":-78,"Float'
+    '":-78,"String":-78,"Hex":-78,"Nil":-78,"Bool":-78,"Int":-78,"{":-78,"!":-78,"New":-78,"$en'
+    'd":-78,"}":-78,":":-78,",":-78,"]":-78,")":-78},{"OR":-73,"AND":-73,">=":-73,"<=":-73,">":'
+    '-73,"<":-73,"!=":-73,"==":-73,"%":59,"/":58,"*":63,"-":54,"+":64,"(":-73,"[":-73,".":-73,"'
+    'Id":-73,"Const":-73,"Func":-73,"If":-73,"While":-73,"For":-73,"Import":-73,"Repeat":-73,"R'
+    'eturn":-73,"Enum":-73,"Struct":-73,"Regex":-73,"Float":-73,"String":-73,"Hex":-73,"Nil":-7'
+    '3,"Bool":-73,"Int":-73,"{":-73,"!":-73,"New":-73,"$end":-73,"}":-73,":":-73,",":-73,"]":-7'
+    '3,")":-73},{"OR":-74,"AND":-74,">=":-74,"<=":-74,">":-74,"<":-74,"!=":-74,"==":-74,"%":59,'
+    '"/":58,"*":63,"-":54,"+":64,"(":-74,"[":-74,".":-74,"Id":-74,"Const":-74,"Func":-74,"If":-'
+    '74,"While":-74,"For":-74,"Import":-74,"Repeat":-74,"Return":-74,"Enum":-74,"Struct":-74,"R'
+    'egex":-74,"Float":-74,"String":-74,"Hex":-74,"Nil":-74,"Bool":-74,"Int":-74,"{":-74,"!":-7'
+    '4,"New":-74,"$end":-74,"}":-74,":":-74,",":-74,"]":-74,")":-74},{"OR":-69,"AND":-69,">=":-'
+    '69,"<=":-69,">":-69,"<":-69,"!=":-69,"==":-69,"%":59,"/":58,"*":63,"-":54,"+":64,"(":-69,"'
+    '[":-69,".":-69,"Id":-69,"Const":-69,"Func":-69,"If":-69,"While":-69,"For":-69,"Import":-69'
+    ',"Repeat":-69,"Return":-69,"Enum":-69,"Struct":-69,"Regex":-69,"Float":-69,"String":-69,"H'
+    'ex":-69,"Nil":-69,"Bool":-69,"Int":-69,"{":-69,"!":-69,"New":-69,"$end":-69,"}":-69,":":-6'
+    '9,",":-69,"]":-69,")":-69},{"OR":-76,"AND":-76,">=":-76,"<=":-76,">":-76,"<":-76,"!=":-76,'
+    '"==":-76,"%":-76,"/":-76,"*":-76,"-":-76,"+":-76,"(":-76,"[":-76,".":-76,"Id":-76,"Const":'
+    '-76,"Func":-76,"If":-76,"While":-76,"For":-76,"Import":-76,"Repeat":-76,"Return":-76,"Enum'
+    '":-76,"Struct":-76,"Regex":-76,"Float":-76,"String":-76,"Hex":-76,"Nil":-76,"Bool":-76,"In'
+    't":-76,"{":-76,"!":-76,"New":-76,"$end":-76,"}":-76,":":-76,",":-76,"]":-76,")":-76},{"OR"'
+    ':-75,"AND":-75,">=":-75,"<=":-75,">":-75,"<":-75,"!=":-75,"==":-75,"%":-75,"/":-75,"*":-75'
+    ',"-":-75,"+":-75,"(":-75,"[":-75,".":-75,"Id":-75,"Const":-75,"Func":-75,"If":-75,"While":'
+    '-75,"For":-75,"Import":-75,"Repeat":-75,"Return":-75,"Enum":-75,"Struct":-75,"Regex":-75,"'
+    'Float":-75,"String":-75,"Hex":-75,"Nil":-75,"Bool":-75,"Int":-75,"{":-75,"!":-75,"New":-75'
+    ',"$end":-75,"}":-75,":":-75,",":-75,"]":-75,")":-75},{"OR":-67,"AND":-67,">=":57,"<=":50,"'
+    '>":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":-67,"[":-67,".":-67,"I'
+    'd":-67,"Const":-67,"Func":-67,"If":-67,"While":-67,"For":-67,"Import":-67,"Repeat":-67,"Re'
+    'turn":-67,"Enum":-67,"Struct":-67,"Regex":-67,"Float":-67,"String":-67,"Hex":-67,"Nil":-67'
+    ',"Bool":-67,"Int":-67,"{":-67,"!":-67,"New":-67,"$end":-67,"}":-67,":":-67,",":-67,"]":-67'
+    ',")":-67},{"OR":-72,"AND":-72,">=":-72,"<=":-72,">":-72,"<":-72,"!=":-72,"==":-72,"%":59,"'
+    '/":58,"*":63,"-":54,"+":64,"(":-72,"[":-72,".":-72,"Id":-72,"Const":-72,"Func":-72,"If":-7'
+    '2,"While":-72,"For":-72,"Import":-72,"Repeat":-72,"Return":-72,"Enum":-72,"Struct":-72,"Re'
+    'gex":-72,"Float":-72,"String":-72,"Hex":-72,"Nil":-72,"Bool":-72,"Int":-72,"{":-72,"!":-72'
+    ',"New":-72,"$end":-72,"}":-72,":":-72,",":-72,"]":-72,")":-72},{"]":147,"OR":60,"AND":51,"'
+    '>=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"["'
+    ':62,".":52},{"OR":-77,"AND":-77,">=":-77,"<=":-77,">":-77,"<":-77,"!=":-77,"==":-77,"%":-7'
+    '7,"/":-77,"*":-77,"-":-77,"+":-77,"(":-77,"[":-77,".":-77,"Id":-77,"Const":-77,"Func":-77,'
+    '"If":-77,"While":-77,"For":-77,"Import":-77,"Repeat":-77,"Return":-77,"Enum":-77,"Struct":'
+    '-77,"Regex":-77,"Float":-77,"String":-77,"Hex":-77,"Nil":-77,"Bool":-77,"Int":-77,"{":-77,'
+    '"!":-77,"New":-77,"$end":-77,"}":-77,":":-77,",":-77,"]":-77,")":-77},{"OR":-79,"AND":-79,'
+    '">=":-79,"<=":-79,">":-79,"<":-79,"!=":-79,"==":-79,"%":59,"/":58,"*":63,"-":-79,"+":-79,"'
+    '(":-79,"[":-79,".":-79,"Id":-79,"Const":-79,"Func":-79,"If":-79,"While":-79,"For":-79,"Imp'
+    'ort":-79,"Repeat":-79,"Return":-79,"Enum":-79,"Struct":-79,"Regex":-79,"Float":-79,"String'
+    '":-79,"Hex":-79,"Nil":-79,"Bool":-79,"Int":-79,"{":-79,"!":-79,"New":-79,"$end":-79,"}":-7'
+    '9,":":-79,",":-79,"]":-79,")":-79},{"OR":-82,"AND":-82,">=":-82,"<=":-82,">":-82,"<":-82,"'
+    '!=":-82,"==":-82,"%":-82,"/":-82,"*":-82,"-":-82,"+":-82,"(":-82,"[":-82,".":-82,"Id":-82,'
+    '"Const":-82,"Func":-82,"If":-82,"While":-82,"For":-82,"Import":-82,"Repeat":-82,"Return":-'
+    '82,"Enum":-82,"Struct":-82,"Regex":-82,"Float":-82,"String":-82,"Hex":-82,"Nil":-82,"Bool"'
+    ':-82,"Int":-82,"{":-82,"!":-82,"New":-82,"$end":-82,"}":-82,":":-82,",":-82,"]":-82,")":-8'
+    '2},{":":115,"OR":-56,"AND":-56,">=":-56,"<=":-56,">":-56,"<":-56,"!=":-56,"==":-56,"%":-56'
+    ',"/":-56,"*":-56,"-":-56,"+":-56,"(":-56,"[":-56,".":-56,")":-56,",":-56,"}":-56},{")":148'
+    ',",":116},{")":-44,",":-44,"}":-44,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,'
+    '"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Id":28,"Regex":15,"Floa'
+    't":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"OR":-66,"AND'
+    '":-66,">=":-66,"<=":-66,">":-66,"<":-66,"!=":-66,"==":-66,"%":-66,"/":-66,"*":-66,"-":-66,'
+    '"+":-66,"(":-66,"[":-66,".":-66,"Id":-66,"Const":-66,"Func":-66,"If":-66,"While":-66,"For"'
+    ':-66,"Import":-66,"Repeat":-66,"Return":-66,"Enum":-66,"Struct":-66,"Regex":-66,"Float":-6'
+    '6,"String":-66,"Hex":-66,"Nil":-66,"Bool":-66,"Int":-66,"{":-66,"!":-66,"New":-66,"$end":-'
+    '66,"}":-66,":":-66,",":-66,"]":-66,")":-66},{"Id":28,"Regex":15,"Float":21,"String":11,"He'
+    'x":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":110,"Regex":15,"Float":21,"St'
+    'ring":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"OR":-64,"AND":-64,">='
+    '":-64,"<=":-64,">":-64,"<":-64,"!=":-64,"==":-64,"%":-64,"/":-64,"*":-64,"-":-64,"+":-64,"'
+    '(":-64,"[":-64,".":-64,"Id":-64,"Const":-64,"Func":-64,"If":-64,"While":-64,"For":-64,"Imp'
+    'ort":-64,"Repeat":-64,"Return":-64,"Enum":-64,"Struct":-64,"Regex":-64,"Float":-64,"String'
+    '":-64,"Hex":-64,"Nil":-64,"Bool":-64,"Int":-64,"{":-64,"!":-64,"New":-64,"$end":-64,"}":-6'
+    '4,":":-64,",":-64,"]":-64,")":-64},{"Id":152,"Regex":15,"Float":21,"String":11,"Hex":18,"N'
+    'il":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"OR":60,"AND":51,">=":57,"<=":50,">":53,"<'
+    '":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52,"{":36},{"Els'
+    'e":155,"Id":-24,"Const":-24,"Func":-24,"If":-24,"While":-24,"For":-24,"Import":-24,"Repeat'
+    '":-24,"Return":-24,"Enum":-24,"Struct":-24,"Regex":-24,"Float":-24,"String":-24,"Hex":-24,'
+    '"Nil":-24,"Bool":-24,"Int":-24,"{":-24,"!":-24,"New":-24,"$end":-24,"}":-24},{"If":156,"{"'
+    ':36},{"Id":-9,"Const":-9,"Func":-9,"If":-9,"While":-9,"For":-9,"Import":-9,"Repeat":-9,"Re'
+    'turn":-9,"Enum":-9,"Struct":-9,"Regex":-9,"Float":-9,"String":-9,"Hex":-9,"Nil":-9,"Bool":'
+    '-9,"Int":-9,"{":-9,"!":-9,"New":-9,"$end":-9,"}":-9,"OR":60,"AND":51,">=":57,"<=":50,">":5'
+    '3,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Id":28'
+    ',"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":'
+    '7},{"Id":159},{"}":160,"Id":124},{"}":-34,"Id":-34},{"OR":-82,"AND":-82,">=":-82,"<=":-82,'
+    '">":-82,"<":-82,"!=":-82,"==":-82,"%":-82,"/":-82,"*":-82,"-":-82,"+":-82,"(":-82,"[":-82,'
+    '".":-82,"Id":-86,"Const":-86,"Func":-86,"If":-86,"While":-86,"For":-86,"Import":-86,"Repea'
+    't":-86,"Return":-86,"Enum":-86,"Struct":-86,"Regex":-86,"Float":-86,"String":-86,"Hex":-86'
+    ',"Nil":-86,"Bool":-86,"Int":-86,"{":-86,"!":-86,"New":-86,"$end":-86,"}":-86,":":-86,",":-'
+    '86,"]":-86,")":-86},{")":162,",":116},{"(":163},{")":-52,",":-52},{")":165,",":164},{")":-'
+    '47,",":-47,"Id":167,"=":166},{"{":36},{"Id":-27,"Const":-27,"Func":-27,"If":-27,"While":-2'
+    '7,"For":-27,"Import":-27,"Repeat":-27,"Return":-27,"Enum":-27,"Struct":-27,"Regex":-27,"Fl'
+    'oat":-27,"String":-27,"Hex":-27,"Nil":-27,"Bool":-27,"Int":-27,"{":-27,"!":-27,"New":-27,"'
+    '$end":-27,"}":-27,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/'
+    '":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Until":-37,"Else":-37,"Id":-37,"Const":-'
+    '37,"Func":-37,"If":-37,"While":-37,"For":-37,"Import":-37,"Repeat":-37,"Return":-37,"Enum"'
+    ':-37,"Struct":-37,"Regex":-37,"Float":-37,"String":-37,"Hex":-37,"Nil":-37,"Bool":-37,"Int'
+    '":-37,"{":-37,"!":-37,"New":-37,"$end":-37,"}":-37},{"From":-39,",":-39},{"Id":-25,"Const"'
+    ':-25,"Func":-25,"If":-25,"While":-25,"For":-25,"Import":-25,"Repeat":-25,"Return":-25,"Enu'
+    'm":-25,"Struct":-25,"Regex":-25,"Float":-25,"String":-25,"Hex":-25,"Nil":-25,"Bool":-25,"I'
+    'nt":-25,"{":-25,"!":-25,"New":-25,"$end":-25,"}":-25},{"Id":-10,"Const":-10,"Func":-10,"If'
+    '":-10,"While":-10,"For":-10,"Import":-10,"Repeat":-10,"Return":-10,"Enum":-10,"Struct":-10'
+    ',"Regex":-10,"Float":-10,"String":-10,"Hex":-10,"Nil":-10,"Bool":-10,"Int":-10,"{":-10,"!"'
+    ':-10,"New":-10,"$end":-10,"}":-10,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"'
+    '==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Id":-13,"Const":-13,"Fun'
+    'c":-13,"If":-13,"While":-13,"For":-13,"Import":-13,"Repeat":-13,"Return":-13,"Enum":-13,"S'
+    'truct":-13,"Regex":-13,"Float":-13,"String":-13,"Hex":-13,"Nil":-13,"Bool":-13,"Int":-13,"'
+    '{":-13,"!":-13,"New":-13,"$end":-13,"}":-13,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61'
+    ',"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Id":-12,"Const'
+    '":-12,"Func":-12,"If":-12,"While":-12,"For":-12,"Import":-12,"Repeat":-12,"Return":-12,"En'
+    'um":-12,"Struct":-12,"Regex":-12,"Float":-12,"String":-12,"Hex":-12,"Nil":-12,"Bool":-12,"'
+    'Int":-12,"{":-12,"!":-12,"New":-12,"$end":-12,"}":-12,"OR":60,"AND":51,">=":57,"<=":50,">"'
+    ':53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Id":'
+    '-7,"Const":-7,"Func":-7,"If":-7,"While":-7,"For":-7,"Import":-7,"Repeat":-7,"Return":-7,"E'
+    'num":-7,"Struct":-7,"Regex":-7,"Float":-7,"String":-7,"Hex":-7,"Nil":-7,"Bool":-7,"Int":-7'
+    ',"{":-7,"!":-7,"New":-7,"$end":-7,"}":-7,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!'
+    '=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Id":-14,"Const":-'
+    '14,"Func":-14,"If":-14,"While":-14,"For":-14,"Import":-14,"Repeat":-14,"Return":-14,"Enum"'
+    ':-14,"Struct":-14,"Regex":-14,"Float":-14,"String":-14,"Hex":-14,"Nil":-14,"Bool":-14,"Int'
+    '":-14,"{":-14,"!":-14,"New":-14,"$end":-14,"}":-14,"OR":60,"AND":51,">=":57,"<=":50,">":53'
+    ',"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Id":-11'
+    ',"Const":-11,"Func":-11,"If":-11,"While":-11,"For":-11,"Import":-11,"Repeat":-11,"Return":'
+    '-11,"Enum":-11,"Struct":-11,"Regex":-11,"Float":-11,"String":-11,"Hex":-11,"Nil":-11,"Bool'
+    '":-11,"Int":-11,"{":-11,"!":-11,"New":-11,"$end":-11,"}":-11,"OR":60,"AND":51,">=":57,"<="'
+    ':50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52}'
+    ',{"=":169},{"}":170,"Id":144},{"}":-36,"Id":-36},{"OR":-84,"AND":-84,">=":-84,"<=":-84,">"'
+    ':-84,"<":-84,"!=":-84,"==":-84,"%":-84,"/":-84,"*":-84,"-":-84,"+":-84,"(":-84,"[":-84,"."'
+    ':-84,"Id":-84,"Const":-84,"Func":-84,"If":-84,"While":-84,"For":-84,"Import":-84,"Repeat":'
+    '-84,"Return":-84,"Enum":-84,"Struct":-84,"Regex":-84,"Float":-84,"String":-84,"Hex":-84,"N'
+    'il":-84,"Bool":-84,"Int":-84,"{":-84,"!":-84,"New":-84,"$end":-84,"}":-84,":":-84,",":-84,'
+    '"]":-84,")":-84},{"OR":-81,"AND":-81,">=":-81,"<=":-81,">":-81,"<":-81,"!=":-81,"==":-81,"'
+    '%":-81,"/":-81,"*":-81,"-":-81,"+":-81,"(":-81,"[":-81,".":-81,"Id":-81,"Const":-81,"Func"'
+    ':-81,"If":-81,"While":-81,"For":-81,"Import":-81,"Repeat":-81,"Return":-81,"Enum":-81,"Str'
+    'uct":-81,"Regex":-81,"Float":-81,"String":-81,"Hex":-81,"Nil":-81,"Bool":-81,"Int":-81,"{"'
+    ':-81,"!":-81,"New":-81,"$end":-81,"}":-81,":":-81,",":-81,"]":-81,")":-81},{":":172,"OR":6'
+    '0,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":6'
+    '4,"(":65,"[":62,".":52},{"}":-43,",":-43,")":-43,"OR":60,"AND":51,">=":57,"<=":50,">":53,"'
+    '<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"}":-45,",'
+    '":-45,")":-45},{"In":173,"OR":-56,"AND":-56,">=":-56,"<=":-56,">":-56,"<":-56,"!=":-56,"=='
+    '":-56,"%":-56,"/":-56,"*":-56,"-":-56,"+":-56,"(":-56,"[":-56,".":-56,"}":-56,",":-56},{"}'
+    '":-54,",":-54,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58'
+    ',"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"Id":-22,"Const":-22,"Func":-22,"If":-22,"Whi'
+    'le":-22,"For":-22,"Import":-22,"Repeat":-22,"Return":-22,"Enum":-22,"Struct":-22,"Regex":-'
+    '22,"Float":-22,"String":-22,"Hex":-22,"Nil":-22,"Bool":-22,"Int":-22,"{":-22,"!":-22,"New"'
+    ':-22,"$end":-22,"}":-22},{"If":174,"{":36},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex'
+    '":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":-20,"Const":-20,"Func":-20,"If'
+    '":-20,"While":-20,"For":-20,"Import":-20,"Repeat":-20,"Return":-20,"Enum":-20,"Struct":-20'
+    ',"Regex":-20,"Float":-20,"String":-20,"Hex":-20,"Nil":-20,"Bool":-20,"Int":-20,"{":-20,"!"'
+    ':-20,"New":-20,"$end":-20,"}":-20},{"Id":-8,"Const":-8,"Func":-8,"If":-8,"While":-8,"For":'
+    '-8,"Import":-8,"Repeat":-8,"Return":-8,"Enum":-8,"Struct":-8,"Regex":-8,"Float":-8,"String'
+    '":-8,"Hex":-8,"Nil":-8,"Bool":-8,"Int":-8,"{":-8,"!":-8,"New":-8,"$end":-8,"}":-8,"OR":60,'
+    '"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,'
+    '"(":65,"[":62,".":52},{"}":-32,"Id":-32},{"Id":-31,"Const":-31,"Func":-31,"If":-31,"While"'
+    ':-31,"For":-31,"Import":-31,"Repeat":-31,"Return":-31,"Enum":-31,"Struct":-31,"Regex":-31,'
+    '"Float":-31,"String":-31,"Hex":-31,"Nil":-31,"Bool":-31,"Int":-31,"{":-31,"!":-31,"New":-3'
+    '1,"$end":-31,"}":-31},{"}":-33,"Id":-33},{"OR":-81,"AND":-81,">=":-81,"<=":-81,">":-81,"<"'
+    ':-81,"!=":-81,"==":-81,"%":-81,"/":-81,"*":-81,"-":-81,"+":-81,"(":-81,"[":-81,".":-81,"Id'
+    '":-85,"Const":-85,"Func":-85,"If":-85,"While":-85,"For":-85,"Import":-85,"Repeat":-85,"Ret'
+    'urn":-85,"Enum":-85,"Struct":-85,"Regex":-85,"Float":-85,"String":-85,"Hex":-85,"Nil":-85,'
+    '"Bool":-85,"Int":-85,"{":-85,"!":-85,"New":-85,"$end":-85,"}":-85,":":-85,",":-85,"]":-85,'
+    '")":-85},{")":178,"Id":132},{"Id":132},{"{":36},{"Id":28,"Regex":15,"Float":21,"String":11'
+    ',"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{")":-48,",":-48,"=":182},{"Id"'
+    ':-16,"Const":-16,"Func":-16,"If":-16,"While":-16,"For":-16,"Import":-16,"Repeat":-16,"Retu'
+    'rn":-16,"Enum":-16,"Struct":-16,"Regex":-16,"Float":-16,"String":-16,"Hex":-16,"Nil":-16,"'
+    'Bool":-16,"Int":-16,"{":-16,"!":-16,"New":-16,"$end":-16,"}":-16},{"Id":28,"Regex":15,"Flo'
+    'at":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"Id":-29,"Co'
+    'nst":-29,"Func":-29,"If":-29,"While":-29,"For":-29,"Import":-29,"Repeat":-29,"Return":-29,'
+    '"Enum":-29,"Struct":-29,"Regex":-29,"Float":-29,"String":-29,"Hex":-29,"Nil":-29,"Bool":-2'
+    '9,"Int":-29,"{":-29,"!":-29,"New":-29,"$end":-29,"}":-29},{"}":-35,"Id":-35},{"Id":28,"Reg'
+    'ex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,"New":7},{"'
+    'Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{":26,"!":6,'
+    '"New":7},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":12,"Int":20,"{'
+    '":26,"!":6,"New":7},{"Id":-23,"Const":-23,"Func":-23,"If":-23,"While":-23,"For":-23,"Impor'
+    't":-23,"Repeat":-23,"Return":-23,"Enum":-23,"Struct":-23,"Regex":-23,"Float":-23,"String":'
+    '-23,"Hex":-23,"Nil":-23,"Bool":-23,"Int":-23,"{":-23,"!":-23,"New":-23,"$end":-23,"}":-23}'
+    ',{"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":'
+    '54,"+":64,"(":65,"[":62,".":52,"{":36},{")":188,",":164},{"{":36},{")":-51,",":-51},{"Id":'
+    '-15,"Const":-15,"Func":-15,"If":-15,"While":-15,"For":-15,"Import":-15,"Repeat":-15,"Retur'
+    'n":-15,"Enum":-15,"Struct":-15,"Regex":-15,"Float":-15,"String":-15,"Hex":-15,"Nil":-15,"B'
+    'ool":-15,"Int":-15,"{":-15,"!":-15,"New":-15,"$end":-15,"}":-15},{")":-50,",":-50,"OR":60,'
+    '"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,'
+    '"(":65,"[":62,".":52},{"Id":28,"Regex":15,"Float":21,"String":11,"Hex":18,"Nil":9,"Bool":1'
+    '2,"Int":20,"{":26,"!":6,"New":7},{"}":-30,"Id":-30,"OR":60,"AND":51,">=":57,"<=":50,">":53'
+    ',"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"}":-53,'
+    '",":-53,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":6'
+    '3,"-":54,"+":64,"(":65,"[":62,".":52},{"}":191,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<"'
+    ':61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"OR":60,"AND'
+    '":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%":59,"/":58,"*":63,"-":54,"+":64,"(":'
+    '65,"[":62,".":52,"{":36},{"Else":-42,"Id":-42,"Const":-42,"Func":-42,"If":-42,"While":-42,'
+    '"For":-42,"Import":-42,"Repeat":-42,"Return":-42,"Enum":-42,"Struct":-42,"Regex":-42,"Floa'
+    't":-42,"String":-42,"Hex":-42,"Nil":-42,"Bool":-42,"Int":-42,"{":-42,"!":-42,"New":-42,"$e'
+    'nd":-42,"}":-42},{"{":36},{"Id":-18,"Const":-18,"Func":-18,"If":-18,"While":-18,"For":-18,'
+    '"Import":-18,"Repeat":-18,"Return":-18,"Enum":-18,"Struct":-18,"Regex":-18,"Float":-18,"St'
+    'ring":-18,"Hex":-18,"Nil":-18,"Bool":-18,"Int":-18,"{":-18,"!":-18,"New":-18,"$end":-18,"}'
+    '":-18},{")":-49,",":-49,"OR":60,"AND":51,">=":57,"<=":50,">":53,"<":61,"!=":55,"==":56,"%"'
+    ':59,"/":58,"*":63,"-":54,"+":64,"(":65,"[":62,".":52},{"OR":-87,"AND":-87,">=":-87,"<=":-8'
+    '7,">":-87,"<":-87,"!=":-87,"==":-87,"%":-87,"/":-87,"*":-87,"-":-87,"+":-87,"(":-87,"[":-8'
+    '7,".":-87,"Id":-87,"Const":-87,"Func":-87,"If":-87,"While":-87,"For":-87,"Import":-87,"Rep'
+    'eat":-87,"Return":-87,"Enum":-87,"Struct":-87,"Regex":-87,"Float":-87,"String":-87,"Hex":-'
+    '87,"Nil":-87,"Bool":-87,"Int":-87,"{":-87,"!":-87,"New":-87,"$end":-87,"}":-87,":":-87,","'
+    ':-87,"]":-87,")":-87},{"Else":-41,"Id":-41,"Const":-41,"Func":-41,"If":-41,"While":-41,"Fo'
+    'r":-41,"Import":-41,"Repeat":-41,"Return":-41,"Enum":-41,"Struct":-41,"Regex":-41,"Float":'
+    '-41,"String":-41,"Hex":-41,"Nil":-41,"Bool":-41,"Int":-41,"{":-41,"!":-41,"New":-41,"$end"'
+    ':-41,"}":-41},{"Id":-17,"Const":-17,"Func":-17,"If":-17,"While":-17,"For":-17,"Import":-17'
+    ',"Repeat":-17,"Return":-17,"Enum":-17,"Struct":-17,"Regex":-17,"Float":-17,"String":-17,"H'
+    'ex":-17,"Nil":-17,"Bool":-17,"Int":-17,"{":-17,"!":-17,"New":-17,"$end":-17,"}":-17}],"lr_'
+    'goto":[{"stmts":17,"attr":5,"code":23,"expr":24,"stmt":25},{},{"attr":5,"expr":29},{},{},{'
+    '},{"expr":32,"attr":5},{"expr":33,"attr":5},{},{},{"body":35},{},{},{"expr":37,"attr":5},{'
+    '"import_list":39},{},{"attr":5,"expr":40},{"attr":5,"expr":24,"stmt":41},{},{},{},{},{},{}'
+    ',{},{},{"dictionary_items":66,"attr":5,"args":69,"arg":70,"expr":71},{},{},{"body":73},{},'
+    '{},{},{},{},{},{"stmts":82,"attr":5,"expr":24,"stmt":25},{},{},{},{"body":85},{},{},{"expr'
+    '":87,"attr":5},{},{},{},{},{},{},{"expr":94,"attr":5},{"expr":95,"attr":5},{},{"expr":97,"'
+    'attr":5},{"expr":98,"attr":5},{"expr":99,"attr":5},{"expr":100,"attr":5},{"expr":101,"attr'
+    '":5},{"expr":102,"attr":5},{"expr":103,"attr":5},{"expr":104,"attr":5},{"expr":105,"attr":'
+    '5},{"expr":106,"attr":5},{"expr":107,"attr":5},{"expr":108,"attr":5},{"attr":5,"args":111,'
+    '"arg":70,"expr":112},{},{},{},{},{},{},{"attr":5,"expr":119},{"elseif_chain":120},{"expr":'
+    '122,"attr":5},{},{"struct_defs":125,"struct_def":126},{"attr":5,"args":128,"arg":70,"expr"'
+    ':112},{},{"param":130,"params":131},{"attr":5,"expr":134},{},{"attr":5,"expr":24,"stmt":41'
+    '},{},{},{},{"expr":138,"attr":5},{},{"expr":139,"attr":5},{"expr":140,"attr":5},{"expr":14'
+    '1,"attr":5},{"expr":142,"attr":5},{"expr":143,"attr":5},{"enum_defs":145,"enum_def":146},{'
+    '},{},{},{},{},{},{},{},{},{},{},{},{},{},{},{},{},{},{},{"expr":149,"attr":5},{},{"expr":1'
+    '50,"attr":5},{"attr":5,"arg":151,"expr":112},{},{"expr":153,"attr":5},{"body":154},{},{"bo'
+    'dy":157},{},{"expr":158,"attr":5},{},{"struct_def":161},{},{},{},{},{},{},{},{"body":168},'
+    '{},{},{},{},{},{},{},{},{},{},{},{"enum_def":171},{},{},{},{},{},{},{},{},{},{"body":175},'
+    '{"attr":5,"expr":176},{},{},{},{},{},{},{"param":130,"params":177},{"param":179},{"body":1'
+    '80},{"expr":181,"attr":5},{},{},{"expr":183,"attr":5},{},{},{"expr":184,"attr":5},{"expr":'
+    '185,"attr":5},{"attr":5,"expr":186},{},{"body":187},{},{"body":189},{},{},{},{"expr":190,"'
+    'attr":5},{},{},{},{"body":192},{},{"body":193},{},{},{},{},{}],"sr_conflicts":[[32,"\'OR\'",'
+    '"shift"],[32,"\'AND\'","shift"],[32,"\'>=\'","shift"],[32,"\'<=\'","shift"],[32,"\'>\'","shift"],['
+    '32,"\'<\'","shift"],[32,"\'!=\'","shift"],[32,"\'==\'","shift"],[32,"\'%\'","shift"],[32,"\'/\'","sh'
+    'ift"],[32,"\'*\'","shift"],[32,"\'-\'","shift"],[32,"\'+\'","shift"],[32,"\'(\'","shift"],[32,"\'[\''
+    '","shift"],[32,"\'.\'","shift"]],"rr_conflicts":[[127,"Production(expr -> expr ( ))","Produc'
+    'tion(expr -> New expr ( ))"],[127,"Production(expr -> expr ( ))","Production(expr -> New e'
+    'xpr ( ))"],[127,"Production(expr -> expr ( ))","Production(expr -> New expr ( ))"],[127,"P'
+    'roduction(expr -> expr ( ))","Production(expr -> New expr ( ))"],[127,"Production(expr -> '
+    'expr ( ))","Production(expr -> New expr ( ))"],[127,"Production(expr -> expr ( ))","Produc'
+    'tion(expr -> New expr ( ))"],[127,"Production(expr -> expr ( ))","Production(expr -> New e'
+    'xpr ( ))"],[127,"Production(expr -> expr ( ))","Production(expr -> New expr ( ))"],[127,"P'
+    'roduction(expr -> expr ( ))","Production(expr -> New expr ( ))"],[127,"Production(expr -> '
+    'expr ( ))","Production(expr -> New expr ( ))"],[127,"Production(expr -> expr ( ))","Produc'
+    'tion(expr -> New expr ( ))"],[127,"Production(expr -> expr ( ))","Production(expr -> New e'
+    'xpr ( ))"],[127,"Production(expr -> expr ( ))","Production(expr -> New expr ( ))"],[127,"P'
+    'roduction(expr -> expr ( ))","Production(expr -> New expr ( ))"],[127,"Production(expr -> '
+    'expr ( ))","Production(expr -> New expr ( ))"],[127,"Production(expr -> expr ( ))","Produc'
+    'tion(expr -> New expr ( ))"],[162,"Production(expr -> expr ( args ))","Production(expr -> '
+    'New expr ( args ))"],[162,"Production(expr -> expr ( args ))","Production(expr -> New expr'
+    ' ( args ))"],[162,"Production(expr -> expr ( args ))","Production(expr -> New expr ( args '
+    '))"],[162,"Production(expr -> expr ( args ))","Production(expr -> New expr ( args ))"],[16'
+    '2,"Production(expr -> expr ( args ))","Production(expr -> New expr ( args ))"],[162,"Produ'
+    'ction(expr -> expr ( args ))","Production(expr -> New expr ( args ))"],[162,"Production(ex'
+    'pr -> expr ( args ))","Production(expr -> New expr ( args ))"],[162,"Production(expr -> ex'
+    'pr ( args ))","Production(expr -> New expr ( args ))"],[162,"Production(expr -> expr ( arg'
+    's ))","Production(expr -> New expr ( args ))"],[162,"Production(expr -> expr ( args ))","P'
+    'roduction(expr -> New expr ( args ))"],[162,"Production(expr -> expr ( args ))","Productio'
+    'n(expr -> New expr ( args ))"],[162,"Production(expr -> expr ( args ))","Production(expr -'
+    '> New expr ( args ))"],[162,"Production(expr -> expr ( args ))","Production(expr -> New ex'
+    'pr ( args ))"],[162,"Production(expr -> expr ( args ))","Production(expr -> New expr ( arg'
+    's ))"],[162,"Production(expr -> expr ( args ))","Production(expr -> New expr ( args ))"],['
+    '162,"Production(expr -> expr ( args ))","Production(expr -> New expr ( args ))"]],"default'
+    '_reductions":[0,0,0,0,0,-83,0,0,0,-61,0,-59,-62,0,0,-57,0,0,-60,0,-63,-58,0,0,0,-4,0,0,-56'
+    ',0,0,0,0,0,0,0,0,0,0,0,0,-3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-65,-56,0,-4'
+    '6,0,0,0,0,0,0,0,0,0,0,-38,0,0,0,-21,0,0,0,0,0,0,0,0,0,0,-55,0,0,0,0,0,-76,-75,0,0,0,-77,0,'
+    '-82,0,0,0,0,-66,0,0,-64,0,0,0,0,0,0,0,0,-34,0,0,0,-52,0,0,0,0,-37,-39,-25,0,0,0,0,0,0,0,0,'
+    '-36,-84,-81,0,0,-45,0,0,-22,0,0,-20,0,-32,-31,-33,0,0,0,0,0,0,-16,0,-29,-35,0,0,0,-23,0,0,'
+    '0,-51,-15,0,0,0,0,0,0,-42,0,-18,0,-87,-41,-17],"start":"code","terminals":["!","!=","%","('
+    '",")","*","+",",","-",".","/",":","<","<=","=","==",">",">=","AND","Bool","Const","Else","'
+    'Enum","Float","For","From","Func","Hex","Id","If","Import","In","Int","New","Nil","OR","Re'
+    'gex","Repeat","Return","String","Struct","Until","While","[","]","error","{","}"],"precede'
+    'nce":{"Id":["left",1],"AND":["left",2],"OR":["left",2],"NOT":["right",3],"==":["left",4],"'
+    '!=":["left",4],">=":["left",4],">":["left",4],"<":["left",4],"<=":["left",4],"+":["left",5'
+    '],"-":["left",5],"*":["left",6],"/":["left",6],"%":["left",6],"=":["left",7]},"productions'
+    '":[["S\'",["code"],["right",0]],["code",[],["right",0]],["code",["stmts"],["right",0]],["st'
+    'mts",["stmts","stmt"],["right",0]],["stmts",["stmt"],["right",0]],["stmt",["expr"],["right'
+    '",0]],["stmt",["Id","=","expr"],["left",7]],["stmt",["Id","Id","=","expr"],["left",7]],["s'
+    'tmt",["Const","Id","Id","=","expr"],["left",7]],["stmt",["Const","Id","=","expr"],["left",'
+    '7]],["stmt",["Id","%","=","expr"],["left",7]],["stmt",["Id","/","=","expr"],["left",7]],["'
+    'stmt",["Id","*","=","expr"],["left",7]],["stmt",["Id","-","=","expr"],["left",7]],["stmt",'
+    '["Id","+","=","expr"],["left",7]],["stmt",["Func","Id","(","params",")","body"],["right",0'
+    ']],["stmt",["Func","Id","(",")","body"],["right",0]],["stmt",["Func","Id",".","Id","(","pa'
+    'rams",")","body"],["right",0]],["stmt",["Func","Id",".","Id","(",")","body"],["right",0]],'
+    '["stmt",["If","expr","body"],["right",0]],["stmt",["If","expr","body","Else","body"],["rig'
+    'ht",0]],["stmt",["While","expr","body"],["right",0]],["stmt",["For","Id","In","expr","body'
+    '"],["right",0]],["stmt",["If","expr","body","elseif_chain","Else","body"],["right",0]],["s'
+    'tmt",["If","expr","body","elseif_chain"],["right",0]],["stmt",["Import","import_list","Fro'
+    'm","String"],["right",0]],["stmt",["Import","String"],["right",0]],["stmt",["Repeat","body'
+    '","Until","expr"],["right",0]],["stmt",["Return","expr"],["right",0]],["stmt",["Enum","Id"'
+    ',"{","enum_defs","}"],["right",0]],["enum_def",["Id","=","expr"],["left",7]],["stmt",["Str'
+    'uct","Id","{","struct_defs","}"],["right",0]],["struct_def",["Id","Id"],["left",1]],["stru'
+    'ct_defs",["struct_defs","struct_def"],["right",0]],["struct_defs",["struct_def"],["right",'
+    '0]],["enum_defs",["enum_defs","enum_def"],["right",0]],["enum_defs",["enum_def"],["right",'
+    '0]],["body",["{","stmts","}"],["right",0]],["body",["{","}"],["right",0]],["import_list",['
+    '"import_list",",","String"],["right",0]],["import_list",["String"],["right",0]],["elseif_c'
+    'hain",["elseif_chain","Else","If","expr","body"],["right",0]],["elseif_chain",["Else","If"'
+    ',"expr","body"],["right",0]],["arg",["Id",":","expr"],["right",0]],["arg",["expr"],["right'
+    '",0]],["args",["args",",","arg"],["right",0]],["args",["arg"],["right",0]],["param",["Id"]'
+    ',["left",1]],["param",["Id","Id"],["left",1]],["param",["Id","Id","=","expr"],["left",7]],'
+    '["param",["Id","=","expr"],["left",7]],["params",["params",",","param"],["right",0]],["par'
+    'ams",["param"],["right",0]],["dictionary_items",["dictionary_items",",","expr",":","expr"]'
+    ',["right",0]],["dictionary_items",["expr",":","expr"],["right",0]],["attr",["expr",".","Id'
+    '"],["left",1]],["expr",["Id"],["left",1]],["expr",["Regex"],["right",0]],["expr",["Float"]'
+    ',["right",0]],["expr",["String"],["right",0]],["expr",["Hex"],["right",0]],["expr",["Nil"]'
+    ',["right",0]],["expr",["Bool"],["right",0]],["expr",["Int"],["right",0]],["expr",["{","arg'
+    's","}"],["right",0]],["expr",["{","}"],["right",0]],["expr",["{","dictionary_items","}"],['
+    '"right",0]],["expr",["expr","OR","expr"],["left",2]],["expr",["expr","AND","expr"],["left"'
+    ',2]],["expr",["expr",">=","expr"],["left",4]],["expr",["expr","<=","expr"],["left",4]],["e'
+    'xpr",["expr",">","expr"],["left",4]],["expr",["expr","<","expr"],["left",4]],["expr",["exp'
+    'r","!=","expr"],["left",4]],["expr",["expr","==","expr"],["left",4]],["expr",["expr","%","'
+    'expr"],["left",6]],["expr",["expr","/","expr"],["left",6]],["expr",["expr","*","expr"],["l'
+    'eft",6]],["expr",["expr","-","expr"],["left",5]],["expr",["expr","+","expr"],["left",5]],['
+    '"expr",["!","expr"],["right",0]],["expr",["expr","(","args",")"],["right",0]],["expr",["ex'
+    'pr","(",")"],["right",0]],["expr",["attr"],["right",0]],["expr",["expr","[","expr","]"],["'
+    'right",0]],["expr",["New","expr","(","args",")"],["right",0]],["expr",["New","expr","(",")'
+    '"],["right",0]],["expr",["{","expr",":","Id","In","expr","}"],["right",0]]]}'
+)
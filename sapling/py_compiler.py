@@ -0,0 +1,733 @@
+"""
+py_compiler.py
+--------------
+
+Translates the bytecode tree produced by the parser into Python source code. Sapling
+functions become Python functions, while and repeat loops become Python while loops, for loops
+become Python for loops and operators call the operator methods of sapling.objects directly, so
+the looping is done by CPython's own interpreter. The source is compiled with compile() and cached.
+
+Variables bound in a module or function live in Python local variables. Constants, structs,
+enums and anything else are stored in the env of the VM, like the other engines do.
+
+Ints, floats, strings and bools are raw Python values in the generated code, they are only
+boxed when they leave it (see sapling.objects.box). Operators on two ints are applied inline,
+so arithmetic on them runs at the speed of CPython itself.
+
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pickle import dumps, HIGHEST_PROTOCOL
+from types import CodeType
+from typing import Callable, Iterator
+
+import sapling.codes as codes
+from sapling.constants import __version__
+from sapling.error import SError, STypeError, SNameError
+from sapling.vmutils import operator_error
+from sapling.objects import Array, Var, box, resolve_operator
+from sapling.opcodes import operators
+
+
+# The value of a local variable that hasn't been assigned yet, reading it falls back to the env
+UNBOUND = object()
+
+
+def load_name(vm, name: str, line: int, column: int):
+    value = vm.env.get(name)
+    if value is None:
+        value = vm.lookup(name)
+        if value is None:
+            vm.error(SNameError(name, [line, column]))
+
+    return value.value if value.__class__ is Var else value
+
+
+def store_names(vm, names: dict) -> None:
+    """Stores the variables of a module in the env once it has run, so a file importing it can
+    read them"""
+
+    for name, value in names.items():
+        if value is not UNBOUND:
+            vm.env[name] = Var(name, box(value), False)
+
+
+def locate(error: SError, default: list | None = None) -> None:
+    """Gives an error raised in generated code the position of the statement it was raised in,
+    found in the line table of the innermost generated module the traceback goes through
+
+    Args:
+        error (SError): The error
+        default (list | None, optional): The position if it wasn't raised in generated code.
+            Defaults to None.
+    """
+
+    if error.pos is not None:
+        return
+
+    error.pos = default
+    traceback = error.__traceback__
+    while traceback is not None:
+        positions = traceback.tb_frame.f_globals.get('_positions')
+        if positions is not None and traceback.tb_lineno in positions:
+            error.pos = positions[traceback.tb_lineno]
+
+        traceback = traceback.tb_next
+
+
+def call(vm, func, args: list, line: int, column: int):
+    try:
+        return vm.call(func, args)
+    except SError as error:
+        locate(error, [line, column])
+        raise
+
+
+def check_type(vm, value, annotation: str, line: int, column: int):
+    if value.type != annotation:
+        vm.error(STypeError(
+            f'Assignment does not match annotated type \'{annotation}\'', [line, column]
+        ))
+
+    return value
+
+
+def array_comp(vm, arr, func: Callable):
+    if arr.type != 'array':
+        vm.error(STypeError('Expected \'array\' for array comprehension'))
+
+    return Array.from_py_iter(map(func, arr.value))
+
+
+def binary_operator(op: str) -> Callable:
+    """Makes the function one place in generated code calls to apply an operator. It keeps the
+    implementation of the operator for the classes of the operands it was last called with.
+
+    Args:
+        op (str): The operator, a key of sapling.opcodes.operators
+
+    Returns:
+        Callable: The function, taking the VM, both operands and the position of the operator
+    """
+
+    left_cls = right_cls = operator = None
+
+    def apply(vm, left, right, line: int, column: int):
+        nonlocal left_cls, right_cls, operator
+        if left.__class__ is not left_cls or right.__class__ is not right_cls:
+            left_cls, right_cls = left.__class__, right.__class__
+            operator = resolve_operator(op, left_cls, right_cls)
+
+        try:
+            out = operator(left, right)
+        except TypeError:
+            out = None
+        except ZeroDivisionError:
+            vm.error(STypeError('Cannot divide by zero', [line, column]))
+
+        if out is None:
+            operator_error(vm, left, op, right, [line, column])
+
+        return out
+
+    return apply
+
+
+# The operators applied inline to two ints, as Python gives the same result as Sapling for them
+inline_operators = {
+    '+': '+', '-': '-', '*': '*', '==': '==', '!=': '!=', '>': '>', '<': '<', '>=': '>=', '<=': '<='
+}
+
+# The operators that always give a bool, so a condition using one doesn't need truthy
+bool_operators = {'==', '!=', '>', '<', '>=', '<=', 'AND', 'OR'}
+
+raw_literals = (codes.Int, codes.Float, codes.String, codes.Bool)
+
+
+@dataclass(slots=True)
+class PythonCode:
+    """A block of Sapling code translated to a Python module"""
+
+    name: str
+    source: str
+    code: CodeType
+    namespace: dict | None = field(default=None)
+
+    def __call__(self, vm):
+        if self.namespace is None:
+            self.namespace = {'__name__': f'sapling.generated.{self.name}'}
+            exec(self.code, self.namespace)
+
+        try:
+            return self.namespace['_module'](vm)
+        except SError as error:
+            locate(error)
+            raise
+
+
+@lru_cache(maxsize=128)
+def compile_source(source: str, name: str) -> CodeType:
+    return compile(source, f'<sapling {name}>', 'exec')
+
+
+def walk(stmts, into_functions: bool) -> Iterator:
+    """Yields the statements and the statements in their bodies
+
+    Args:
+        stmts (list): The statements
+        into_functions (bool): Whether to yield the statements in function bodies
+    """
+
+    for stmt in stmts:
+        yield stmt
+
+        match stmt:
+            case codes.If():
+                yield from walk(stmt.then.stmts, into_functions)
+                for _, body in stmt.elseif_chain or ():
+                    yield from walk(body.stmts, into_functions)
+
+                if stmt.otherwise is not None:
+                    yield from walk(stmt.otherwise.stmts, into_functions)
+            case codes.While() | codes.Repeat() | codes.For():
+                yield from walk(stmt.body.stmts, into_functions)
+            case codes.FuncDef() | codes.AttrFuncDef() if into_functions:
+                yield from walk(stmt.body.stmts, into_functions)
+
+
+def bound_names(stmts) -> set[str]:
+    """Gets the names a block binds with assignments and function definitions"""
+
+    names = set()
+    for stmt in walk(stmts, False):
+        match stmt:
+            case codes.Assign():
+                names.add(stmt.name)
+            case codes.For():
+                names.add(stmt.ident)
+            case codes.FuncDef():
+                names.add(stmt.name.value)
+
+    return names
+
+
+def env_names(stmts) -> set[str]:
+    """Gets the names that have to be stored in the env: constants, structs and enums"""
+
+    names = set()
+    for stmt in walk(stmts, True):
+        match stmt:
+            case codes.Assign(constant=True):
+                names.add(stmt.name)
+            case codes.Struct() | codes.Enum():
+                names.add(stmt.name)
+
+    return names
+
+
+class Scope:
+    """The Sapling names a generated Python function stores in its local variables"""
+
+    def __init__(self, names: set[str], parent: 'Scope | None' = None, assigned=()):
+        self.names = names
+        self.parent = parent
+
+        # Names that are certainly assigned, so reading them doesn't need to check for UNBOUND
+        self.assigned = set(assigned)
+
+    def is_local(self, name: str) -> bool:
+        """Whether the name is a Python local of this function or of one enclosing it"""
+
+        scope = self
+        while scope is not None:
+            if name in scope.names:
+                return True
+
+            scope = scope.parent
+
+        return False
+
+
+class Generator:
+    """Generates the Python source for one module or function body"""
+
+    def __init__(self, name: str, stmts):
+        self.name = name
+        self.env_names = env_names(stmts)
+        self.lines = []
+        self.nodes = []
+
+        # The position of the statement being generated and of the statement each line is from
+        self.position = None
+        self.positions = []
+        self.operators = {}
+        self.attributes = {}
+        self.consts = {}
+        self.temps = 0
+
+        # The variables of the module, stored in the env when it imports a file and once it ends
+        self.exported = []
+
+    def write(self, indent: int, line: str) -> None:
+        self.lines.append('    ' * indent + line)
+        self.positions.append(self.position)
+
+    def add_node(self, node) -> str:
+        """Stores a node in the generated module, for the code that is run by the VM"""
+
+        self.nodes.append(node)
+        return f'_nodes[{len(self.nodes) - 1}]'
+
+    def const(self, source: str) -> str:
+        """Makes a literal a module level constant, so its object is only made once"""
+
+        return self.consts.setdefault(source, f'_c{len(self.consts)}')
+
+    def operator(self, op: str) -> str:
+        """Makes a new place applying the operator, each one caches the implementation it uses"""
+
+        name = f'op_{operators[op].__name__}{len(self.operators)}'
+        self.operators[name] = op
+        return name
+
+    def attribute(self, attr: str, null_safe: bool, line: int, column: int) -> str:
+        """Makes a new place getting the attribute, each one caches where it found it"""
+
+        name = f'attr{attr}{len(self.attributes)}'
+        self.attributes[name] = attr, null_safe, [line, column]
+        return name
+
+    def store_names(self) -> str:
+        """Generates the statement storing the variables of the module in the env"""
+
+        return f'store_names(vm, {{{", ".join(f"{n!r}: v_{n}" for n in self.exported)}}})'
+
+    def temp(self) -> str:
+        """Makes a new local variable for an intermediate value of an expression"""
+
+        self.temps += 1
+        return f'_t{self.temps}'
+
+    def block(self, stmts, scope: Scope, indent: int, mode: str) -> None:
+        """Generates a list of statements
+
+        Args:
+            stmts (list): The statements
+            scope (Scope): The scope the statements run in
+            indent (int): The indentation level
+            mode (str): 'module', 'function' or 'body' (the body of an if/while/repeat)
+        """
+
+        start = len(self.lines)
+        outer = self.position
+        for stmt in stmts:
+            self.position = (stmt.line, stmt.column)
+            if not isinstance(stmt, codes.Return):
+                self.stmt(stmt, scope, indent, mode != 'body')
+                continue
+
+            # A return ends the function the block is in (or the module), wherever it is nested
+            self.write(indent, f'return {self.boxed(stmt.value, scope)}')
+            break
+
+        self.position = outer
+        if len(self.lines) == start:
+            self.write(indent, 'pass')
+
+    def stmt(self, stmt, scope: Scope, indent: int, top_level: bool) -> None:
+        match stmt:
+            case codes.Assign():
+                self.assign(stmt, scope, indent, top_level)
+            case codes.FuncDef():
+                self.func_def(stmt, scope, indent, top_level)
+            case codes.AttrFuncDef():
+                func = self.function(stmt.params, stmt.body, scope, indent)
+                self.write(indent, f'vm.execute_attr_func({self.add_node(stmt)}, '
+                                   f'{func}_params, {func})')
+            case codes.If():
+                keyword = 'if'
+                branches = [(stmt.condition, stmt.then)] + list(stmt.elseif_chain or ())
+                for condition, body in branches:
+                    self.write(indent, f'{keyword} {self.condition(condition, scope)}:')
+                    self.block(body.stmts, scope, indent + 1, 'body')
+                    keyword = 'elif'
+
+                if stmt.otherwise is not None:
+                    self.write(indent, 'else:')
+                    self.block(stmt.otherwise.stmts, scope, indent + 1, 'body')
+            case codes.While():
+                self.write(indent, f'while {self.condition(stmt.condition, scope)}:')
+                self.block(stmt.body.stmts, scope, indent + 1, 'body')
+            case codes.Repeat():
+                self.write(indent, f'while not {self.condition(stmt.condition, scope)}:')
+                self.block(stmt.body.stmts, scope, indent + 1, 'body')
+            case codes.For():
+                self.for_loop(stmt, scope, indent)
+            case codes.Enum():
+                properties = ', '.join(
+                    f'{f"_{prop.name}"!r}: {self.boxed(prop.value, scope)}'
+                    for prop in stmt.properties
+                )
+                self.write(indent, f'vm.env[{stmt.name!r}] = Class({stmt.name!r}, {{{properties}}})')
+            case codes.Import() | codes.Struct():
+                if isinstance(stmt, codes.Import) and scope.parent is None and self.exported:
+                    # The imported file runs with the env of this one, so it can read its variables
+                    self.write(indent, self.store_names())
+
+                self.write(indent, f'vm.execute({self.add_node(stmt)})')
+            case _:
+                self.write(indent, self.expr(stmt, scope))
+
+    def store(self, name: str, value: str, scope: Scope, indent: int, top_level: bool) -> None:
+        if name in self.env_names or not scope.is_local(name):
+            self.write(indent, f'vm.env[{name!r}] = {value}')
+            return
+
+        self.write(indent, f'v_{name} = {value}')
+        if top_level and name in scope.names:
+            scope.assigned.add(name)
+
+    def assign(self, stmt: codes.Assign, scope: Scope, indent: int, top_level: bool) -> None:
+        name = stmt.name
+        if stmt.constant or name in self.env_names or not scope.is_local(name):
+            self.write(indent, f'vm.assign({self.add_node(stmt)}, {self.boxed(stmt.value, scope)})')
+            return
+
+        pos = f'{stmt.line}, {stmt.column}'
+        if stmt.operation != '':
+            value = f'{self.operator(stmt.operation)}(vm, {self.load(name, scope, stmt)}, '\
+                    f'{self.expr(stmt.value, scope)}, {pos})'
+        elif stmt.type != 'any':
+            value = f'check_type(vm, {self.boxed(stmt.value, scope)}, {stmt.type!r}, {pos})'
+        else:
+            value = self.expr(stmt.value, scope)
+
+        self.store(name, value, scope, indent, top_level)
+
+    def for_loop(self, stmt: codes.For, scope: Scope, indent: int) -> None:
+        values = f'iterate(vm, {self.expr(stmt.iterable, scope)})'
+        name = stmt.ident
+        if name in self.env_names or not scope.is_local(name):
+            value = self.temp()
+            binding = codes.Assign(stmt.line, stmt.column, name, None, False, '', 'any')
+            self.write(indent, f'for {value} in {values}:')
+            self.write(indent + 1, f'vm.assign({self.add_node(binding)}, {value})')
+        else:
+            self.write(indent, f'for v_{name} in map(unbox, {values}):')
+
+        self.block(stmt.body.stmts, scope, indent + 1, 'body')
+
+    def function(self, params_node, body: codes.Body, scope: Scope, indent: int) -> str:
+        """Generates a Python function running the body of a Sapling function, nested in the
+        function of the scope so it reads the variables of the scopes enclosing it
+
+        Returns:
+            str: The name of the Python function, its parameters are in {name}_params
+        """
+
+        params = [param.name for param in params_node.params] if params_node else []
+        assigned = bound_names(body.stmts) - self.env_names - set(params)
+
+        # Like the other engines, assigning to a variable of an enclosing scope updates it
+        outer = sorted(n for n in assigned if scope.is_local(n))
+        inner = sorted(assigned - set(outer))
+        func_scope = Scope(set(params) | set(inner), scope, params)
+
+        func = f'_f{len(self.nodes)}'
+        self.write(indent, f'{func}_params = vm.execute_params({self.add_node(params_node)})'
+                   if params else f'{func}_params = []')
+        if params:
+            self.write(indent, f'{func}_bind = param_binder({func}_params)')
+
+        self.write(indent, f'def {func}(_, args):')
+        if outer:
+            self.write(indent + 1, f'nonlocal {", ".join(f"v_{n}" for n in outer)}')
+
+        if params:
+            # Binding the arguments isn't part of the body, its errors are at the call
+            position, self.position = self.position, None
+            self.write(indent + 1, f'{"".join(f"v_{n}, " for n in params)}= '
+                                   f'map(unbox, {func}_bind(vm, args))')
+            self.position = position
+
+        if inner:
+            self.write(indent + 1, f'{" = ".join(f"v_{n}" for n in inner)} = UNBOUND')
+
+        self.block(body.stmts, func_scope, indent + 1, 'function')
+        if not any(isinstance(stmt, codes.Return) for stmt in body.stmts):
+            self.write(indent + 1, 'return NIL')
+
+        return func
+
+    def func_def(self, stmt: codes.FuncDef, scope: Scope, indent: int, top_level: bool) -> None:
+        name = stmt.name.value
+        func = self.function(stmt.params, stmt.body, scope, indent)
+        self.store(name, f'Func({name!r}, {func}_params, func={func})',
+                   scope, indent, top_level)
+
+    def load(self, name: str, scope: Scope, node) -> str:
+        pos = f'{node.line}, {node.column}'
+        if name in self.env_names or not scope.is_local(name):
+            return f'load_name(vm, {name!r}, {pos})'
+
+        if name in scope.assigned:
+            return f'v_{name}'
+
+        return f'(v_{name} if v_{name} is not UNBOUND else load_name(vm, {name!r}, {pos}))'
+
+    def args(self, args, scope: Scope) -> str:
+        return ', '.join(
+            f'Arg({self.boxed(arg.value, scope)}, {arg.name!r})' for arg in (args.args if args else [])
+        )
+
+    def is_raw(self, expr, scope: Scope) -> bool:
+        """Whether the value of an expression may be raw, anything else gives an object"""
+
+        if isinstance(expr, codes.Id):
+            return expr.value not in self.env_names and scope.is_local(expr.value)
+
+        return isinstance(expr, (codes.BinaryOp, *raw_literals))
+
+    def boxed(self, expr, scope: Scope) -> str:
+        """Generates an expression for where its value leaves the generated code, so it's boxed"""
+
+        if isinstance(expr, raw_literals):
+            return self.const(f'{type(expr).__name__}({expr.value!r})')
+
+        source = self.expr(expr, scope)
+        return f'box({source})' if self.is_raw(expr, scope) else source
+
+    def condition(self, expr, scope: Scope) -> str:
+        source = self.expr(expr, scope)
+        if isinstance(expr, codes.BinaryOp) and expr.op in bool_operators:
+            return source
+
+        return f'truthy({source})'
+
+    def binary_op(self, expr: codes.BinaryOp, scope: Scope) -> str:
+        operator, pos = self.operator(expr.op), f'{expr.line}, {expr.column}'
+        left, right = self.expr(expr.left, scope), self.expr(expr.right, scope)
+
+        symbol = inline_operators.get(expr.op)
+        if symbol is None:
+            return f'{operator}(vm, {left}, {right}, {pos})'
+
+        # Operands are kept in temporaries, so they're only evaluated once. A variable can be used
+        # directly unless evaluating the right operand may assign it.
+        simple_right = isinstance(expr.right, (codes.Id, *raw_literals))
+        checks = []
+        operands = []
+        for node, source in ((expr.left, left), (expr.right, right)):
+            if isinstance(node, codes.Int):
+                operands.append(source)
+            elif source.isidentifier() and (node is expr.right or simple_right):
+                checks.append(f'{source}.__class__')
+                operands.append(source)
+            else:
+                temp = self.temp()
+                checks.append(f'({temp} := {source}).__class__')
+                operands.append(temp)
+
+        if not checks:
+            return f'{operator}(vm, {left}, {right}, {pos})'
+
+        left, right = operands
+        return f'({left} {symbol} {right} if {" is ".join(checks)} is int '\
+               f'else {operator}(vm, {left}, {right}, {pos}))'
+
+    def expr(self, expr, scope: Scope) -> str:
+        pos = f'{expr.line}, {expr.column}'
+
+        match expr:
+            case codes.Id():
+                return self.load(expr.value, scope, expr)
+            case codes.Int() | codes.Float() if expr.value < 0:
+                return f'({expr.value!r})'
+            case codes.Int() | codes.Float() | codes.String() | codes.Bool():
+                return repr(expr.value)
+            case codes.Hex():
+                return self.const(f'Hex({expr.value!r})')
+            case codes.Nil():
+                return 'NIL'
+            case codes.Regex():
+                return self.const(f'Regex(re_compile({expr.value!r}))')
+            case codes.BinaryOp():
+                return self.binary_op(expr, scope)
+            case codes.Call():
+                return f'call(vm, {self.boxed(expr.func, scope)}, [{self.args(expr.args, scope)}], {pos})'
+            case codes.Attribute():
+                attribute = self.attribute(expr.attr, expr.null_safe, expr.line, expr.column)
+                return f'{attribute}(vm, {self.expr(expr.base, scope)})'
+            case codes.Index():
+                return f'vm.index({self.boxed(expr.expr, scope)}, {self.boxed(expr.item, scope)})'
+            case codes.Array():
+                return f'Array([{", ".join(self.boxed(arg.value, scope) for arg in expr.value)}])'
+            case codes.Dictionary():
+                items = ', '.join(
+                    f'{self.boxed(key, scope)}: {self.boxed(value, scope)}'
+                    for key, value in expr.value.items()
+                )
+                return f'Dictionary({{{items}}})'
+            case codes.ArrayComp():
+                comp_scope = Scope({expr.ident}, scope, (expr.ident,))
+                return f'array_comp(vm, {self.boxed(expr.arr, scope)}, '\
+                       f'lambda v_{expr.ident}: {self.boxed(expr.expr, comp_scope)})'
+            case codes.New():
+                return f'vm.instantiate({self.boxed(expr.name, scope)}, [{self.args(expr.args, scope)}])'
+            case _:
+                # Anything without its own translation is run by the tree walking handlers
+                return f'vm.execute({self.add_node(expr)})'
+
+    def module(self, stmts, names: set[str], mode: str) -> str:
+        """Generates the source of the whole Python module
+
+        Args:
+            stmts (list): The statements of the module or function body
+            names (set[str]): The names stored in Python local variables at the top level
+            mode (str): 'module' or 'function'
+
+        Returns:
+            str: The Python source
+        """
+
+        names = sorted(names - self.env_names)
+        scope = Scope(set(names))
+
+        if names:
+            self.write(1, f'{" = ".join(f"v_{n}" for n in names)} = UNBOUND')
+
+        # The variables of a module are Python locals, they're stored in the env once it has run
+        self.exported = names if mode == 'module' else []
+        if self.exported:
+            self.write(1, 'try:')
+
+        self.block(stmts, scope, 2 if self.exported else 1, mode)
+        if self.exported:
+            self.write(1, 'finally:')
+            self.write(2, self.store_names())
+
+        body, self.lines = self.lines, []
+        body_positions, self.positions = self.positions, []
+
+        main = next((
+            stmt for stmt in stmts
+            if mode == 'module' and isinstance(stmt, codes.FuncDef) and stmt.name.value == 'main'
+        ), None)
+        if main is not None:
+            main = self.add_node(main)
+
+        self.write(0, '"""')
+        self.write(0, f'{self.name} translated to Python by Sapling {__version__}')
+        self.write(0, '"""')
+        self.write(0, '')
+        self.write(0, 'from pickle import loads')
+        self.write(0, 'from re import compile as re_compile')
+        self.write(0, '')
+        self.write(0, 'from sapling.vm import VM')
+        self.write(0, 'from sapling.py_compiler import (')
+        self.write(1, 'UNBOUND, load_name, store_names, call, check_type, array_comp, '
+                      'binary_operator, compile_function, locate')
+        self.write(0, ')')
+        self.write(0, 'from sapling.objects import Int, Float, String, Bool, Hex, Regex, Array, '
+                      'Dictionary, Func, Class, NIL, box, unbox, truthy, iterate, attribute_getter')
+        self.write(0, 'from sapling.vmutils import Arg, param_binder')
+        self.write(0, 'from sapling.error import SError')
+        self.write(0, '')
+        self.write(0, '')
+
+        for name, op in self.operators.items():
+            self.write(0, f'{name} = binary_operator({op!r})')
+
+        for name, (attr, null_safe, pos) in self.attributes.items():
+            self.write(0, f'{name} = attribute_getter({attr!r}, {null_safe}, {pos})')
+
+        self.write(0, f'_nodes = loads({dumps(self.nodes, HIGHEST_PROTOCOL)!r})')
+        for source, name in self.consts.items():
+            self.write(0, f'{name} = {source}')
+
+        # The line table, filled in once it's known which lines the body ends up on
+        table = len(self.lines)
+        self.write(0, '_positions = {}')
+        self.write(0, '')
+        self.write(0, '')
+        self.write(0, 'def _module(vm):')
+
+        start = len(self.lines) + 1
+        self.lines[table] = '_positions = ' + repr({
+            start + i: list(position) for i, position in enumerate(body_positions)
+            if position is not None
+        })
+        self.lines += body
+        self.positions += body_positions
+        self.write(0, '')
+        self.write(0, '')
+        self.write(0, 'def run(vm=None):')
+        self.write(1, '"""Runs the module, on a new VM if one isn\'t given"""')
+        self.write(0, '')
+        self.write(1, 'if vm is None:')
+        self.write(2, 'vm = VM(None, engine=\'python\')')
+        self.write(0, '')
+
+        self.write(1, 'try:')
+        if main is not None:
+            # Like VM.run, the main function is defined and called before the rest of the file
+            self.write(2, f'main = {main}')
+            self.write(2, 'vm.execute_func(main._replace(body=compile_function(\'main\', main.body)))')
+            self.write(2, 'call(vm, vm.env[\'main\'], [], main.line, main.column)')
+
+        self.write(2, 'return _module(vm)')
+        self.write(1, 'except SError as error:')
+        self.write(2, 'locate(error)')
+        self.write(2, 'vm.report(error)')
+        self.write(0, '')
+        self.write(0, '')
+        self.write(0, 'if __name__ == \'__main__\':')
+        self.write(1, 'run()')
+
+        return '\n'.join(self.lines) + '\n'
+
+
+def generate_module(code: codes.Code, name: str = '<module>') -> str:
+    """Translates the parsed code of a file into the source of a Python module. Importing the
+    module doesn't run it, its run() function does (running it as a script also does).
+
+    Args:
+        code (codes.Code): The parsed code
+        name (str, optional): The name of the module. Defaults to '<module>'.
+
+    Returns:
+        str: The Python source
+    """
+
+    return Generator(name, code.stmts).module(code.stmts, bound_names(code.stmts), 'module')
+
+
+def compile_code(code: codes.Code) -> PythonCode:
+    """Compiles the parsed code of a file
+
+    Args:
+        code (codes.Code): The parsed code
+
+    Returns:
+        PythonCode: The compiled module code
+    """
+
+    source = generate_module(code)
+    return PythonCode('<module>', source, compile_source(source, '<module>'))
+
+
+def compile_function(name: str, body: codes.Body) -> PythonCode:
+    """Compiles the body of a function run by the VM on its own, like main, in the frame of its
+    call, so its variables are stored in the locals of that frame
+
+    Args:
+        name (str): The name of the function
+        body (codes.Body): The body of the function
+
+    Returns:
+        PythonCode: The compiled function code
+    """
+
+    source = Generator(name, body.stmts).module(body.stmts, set(), 'function')
+    return PythonCode(name, source, compile_source(source, name))
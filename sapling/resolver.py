@@ -0,0 +1,218 @@
+"""
+resolver.py
+-----------
+
+Resolves the names used in a function body at compile time. Local variables only the body
+itself uses are given slot indexes, so they are stored in a list preallocated for each call.
+Names that can only be globals or builtins (which are stored in the globals) are read from
+the globals directly and anything else is looked up by name through the frames.
+
+"""
+
+from dataclasses import dataclass, field
+
+import sapling.codes as codes
+from sapling.std import public_funcs, public_classes, variables
+
+
+FAST = 0  # A local variable stored in a slot of its frame
+GLOBAL = 1  # A global or a builtin, read from the globals
+NAME = 2  # Looked up by name in the running frame, the frames it was defined in, then the globals
+
+builtins = frozenset(public_funcs) | frozenset(public_classes) | frozenset(variables)
+
+# The nodes the compilers translate themselves, any other node is run by the tree walking
+# handlers of the VM, which look the names inside it up by name
+native_exprs = (
+    codes.Id, codes.BinaryOp, codes.Call, codes.Attribute, codes.Index, codes.Array,
+    codes.Dictionary, codes.Int, codes.Float, codes.String, codes.Bool, codes.Nil, codes.Hex,
+    codes.Regex
+)
+
+
+@dataclass(slots=True)
+class Scope:
+    """The names of a module or a function body"""
+
+    bound: set[str]
+    parent: 'Scope | None' = field(default=None)
+    fast: dict[str, int] = field(default_factory=dict)
+
+    # Set when the body binds names that aren't known at compile time (with imports)
+    dynamic: bool = field(default=False)
+
+    def resolve(self, name: str) -> int:
+        """Resolves where a name used in the body is stored
+
+        Args:
+            name (str): The name
+
+        Returns:
+            int: FAST, GLOBAL or NAME
+        """
+
+        if name in self.fast:
+            return FAST
+
+        # The top level of a module runs in the globals, its names are always looked up by name
+        if self.parent is None or self.dynamic or name in self.bound:
+            return NAME
+
+        scope = self.parent
+        while scope.parent is not None:
+            if scope.dynamic or name in scope.bound:
+                return NAME
+
+            scope = scope.parent
+
+        return GLOBAL if name in scope.bound or name in builtins else NAME
+
+
+def names_in(node, names: set[str]) -> set[str]:
+    """Adds every name used or bound anywhere in the node to the set"""
+
+    match node:
+        case codes.Id(value=name):
+            names.add(name)
+        case str() | None:
+            pass
+        case dict():
+            for key, value in node.items():
+                names_in(key, names)
+                names_in(value, names)
+        case tuple() | list():
+            if isinstance(getattr(node, 'name', None), str):
+                names.add(node.name)
+            elif isinstance(node, codes.For):
+                names.add(node.ident)
+
+            for item in node:
+                names_in(item, names)
+
+    return names
+
+
+class Resolver:
+    """Collects the names a body binds, and which of them are used by nodes it doesn't compile"""
+
+    def __init__(self):
+        self.bound = set()
+        self.captured = set()
+        self.dynamic = False
+
+        # Constant and annotated variables need the checks of VM.assign
+        self.checked = set()
+
+    def block(self, stmts) -> None:
+        for stmt in stmts:
+            match stmt:
+                case codes.Assign():
+                    self.bound.add(stmt.name)
+                    if stmt.constant or stmt.type != 'any':
+                        self.checked.add(stmt.name)
+
+                    self.expr(stmt.value)
+                case codes.If():
+                    self.expr(stmt.condition)
+                    self.block(stmt.then.stmts)
+                    for condition, body in stmt.elseif_chain or ():
+                        self.expr(condition)
+                        self.block(body.stmts)
+
+                    if stmt.otherwise is not None:
+                        self.block(stmt.otherwise.stmts)
+                case codes.While() | codes.Repeat():
+                    self.expr(stmt.condition)
+                    self.block(stmt.body.stmts)
+                case codes.For():
+                    self.bound.add(stmt.ident)
+                    self.expr(stmt.iterable)
+                    self.block(stmt.body.stmts)
+                case codes.Return():
+                    self.expr(stmt.value)
+                case codes.FuncDef():
+                    self.bound.add(stmt.name.value)
+                    names_in(stmt, self.captured)
+                case codes.Struct() | codes.Enum():
+                    self.bound.add(stmt.name)
+                    names_in(stmt, self.captured)
+                case codes.Import():
+                    self.dynamic = True
+                case codes.AttrFuncDef():
+                    names_in(stmt, self.captured)
+                case _:
+                    self.expr(stmt)
+
+    def expr(self, expr) -> None:
+        match expr:
+            case codes.BinaryOp():
+                self.expr(expr.left)
+                self.expr(expr.right)
+            case codes.Call():
+                self.expr(expr.func)
+                for arg in expr.args.args if expr.args else ():
+                    self.expr(arg.value)
+            case codes.Attribute():
+                self.expr(expr.base)
+            case codes.Index():
+                self.expr(expr.expr)
+                self.expr(expr.item)
+            case codes.Array():
+                for arg in expr.value:
+                    self.expr(arg.value)
+            case codes.Dictionary():
+                for key, value in expr.value.items():
+                    self.expr(key)
+                    self.expr(value)
+            case _ if not isinstance(expr, native_exprs):
+                names_in(expr, self.captured)
+
+
+def resolve_module(stmts) -> Scope:
+    """Resolves the names bound at the top level of a module
+
+    Args:
+        stmts (list): The statements of the module
+
+    Returns:
+        Scope: The scope of the module
+    """
+
+    resolver = Resolver()
+    resolver.block(stmts)
+    return Scope(resolver.bound, dynamic=resolver.dynamic)
+
+
+def resolve_function(params: list[str], stmts, parent: Scope) -> Scope:
+    """Resolves the names of a function body, giving its local variables slots. Parameters come
+    first, a local variable can't be stored in a slot if it's used by a nested function or a
+    node run by the tree walking handlers, is constant or annotated, or may be a variable of an
+    enclosing scope (assigning to it would update that variable).
+
+    Args:
+        params (list[str]): The names of the parameters
+        stmts (list): The statements of the body
+        parent (Scope): The scope the function is defined in
+
+    Returns:
+        Scope: The scope of the function
+    """
+
+    resolver = Resolver()
+    resolver.block(stmts)
+
+    enclosing = set()
+    scope = parent
+    while scope is not None:
+        enclosing |= scope.bound
+        scope = scope.parent
+
+    excluded = resolver.captured | resolver.checked
+    names = [name for name in params if name not in excluded] + sorted(
+        resolver.bound - set(params) - excluded - enclosing
+    )
+
+    return Scope(
+        resolver.bound | set(params), parent, {name: i for i, name in enumerate(names)},
+        resolver.dynamic
+    )
@@ -1,4 +1,4 @@
-from sapling.vmutils import Param, verify_params
+from sapling.vmutils import Param, param_binder
 from functools import wraps
 from typing import Callable
 
@@ -7,6 +7,8 @@ def call_decorator(params: dict = None, is_attr: bool = True, req_vm: bool = Tru
     params = [Param(k, v.get('type'), v.get('default')) for k, v in params.items()]\
         if params is not None else []
 
+    bind = param_binder(params)
+
     def decorator(func: Callable) -> Callable:
         setattr(func, 'params', params)
 
@@ -15,14 +17,11 @@ def call_decorator(params: dict = None, is_attr: bool = True, req_vm: bool = Tru
             if is_attr and obj is not None:
                 vm, args, obj = args, obj, vm
 
-            args = verify_params(vm, args, params)
-            if req_vm:
-                args.insert(0, vm)
-
+            args = bind(vm, args)
             if is_attr:
-                args.insert(0, obj)
-            
-            return func(*args)
+                return func(obj, vm, *args) if req_vm else func(obj, *args)
+
+            return func(vm, *args) if req_vm else func(*args)
 
         return wrapper
 
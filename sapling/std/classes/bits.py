@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from sapling.std.call_decorator import call_decorator
 from sapling.error import STypeError, SOverflowError
-from sapling.objects import Int, String
+from sapling.objects import Int, String, register_operators
 
 
 @dataclass(unsafe_hash=True, slots=True)
@@ -23,46 +23,58 @@ class Bit(Int):
 
     def __sub__(self, other):
         if other.type == 'int':
-            return Bit(self.line, self.column, self.value - other.value)
+            return Bit(self.value - other.value)
     
     def __and__(self, other):
         if other.type == 'Bit':
-            return Bit(self.line, self.column, self.value & other.value)
+            return Bit(self.value & other.value)
     
     def __or__(self, other):
         if other.type == 'Bit':
-            return Bit(self.line, self.column, self.value | other.value)
+            return Bit(self.value | other.value)
     
     def __xor__(self, other):
         if other.type == 'Bit':
-            return Bit(self.line, self.column, self.value ^ other.value)
+            return Bit(self.value ^ other.value)
     
     def __lshift__(self, other):
         if other.type == 'int':
-            return Bit(self.line, self.column, self.value << other.value)
+            return Bit(self.value << other.value)
     
     def __rshift__(self, other):
         if other.type == 'int':
-            return Bit(self.line, self.column, self.value >> other.value)
+            return Bit(self.value >> other.value)
 
     def __ge__(self, other):
         if other.type == 'Bit':
-            return Bit(self.line, self.column, self.value >= other.value)
+            return Bit(self.value >= other.value)
 
     def __le__(self, other):
         if other.type == 'Bit':
-            return Bit(self.line, self.column, self.value <= other.value)
+            return Bit(self.value <= other.value)
 
     def __gt__(self, other):
         if other.type == 'Bit':
-            return Bit(self.line, self.column, self.value > other.value)
+            return Bit(self.value > other.value)
 
     def __lt__(self, other):
         if other.type == 'Bit':
-            return Bit(self.line, self.column, self.value < other.value)
+            return Bit(self.value < other.value)
     
     def __invert__(self):
-        return Bit(self.line, self.column, ~self.value)
+        return Bit(~self.value)
+
+
+# The operators Sapling code can apply to bits, an int operand is given as a raw value
+register_operators({
+    ('-', 'Bit', 'int'): lambda left, right: Bit(left.value - right),
+    ('AND', 'Bit', 'Bit'): Bit.__and__,
+    ('OR', 'Bit', 'Bit'): Bit.__or__,
+    ('>=', 'Bit', 'Bit'): Bit.__ge__,
+    ('<=', 'Bit', 'Bit'): Bit.__le__,
+    ('>', 'Bit', 'Bit'): Bit.__gt__,
+    ('<', 'Bit', 'Bit'): Bit.__lt__,
+})
 
 
 class Bits:
@@ -70,14 +82,14 @@ class Bits:
     
     @call_decorator({'x': {'type': 'string'}}, req_vm=False)
     def _to_bit(self, x: String):
-        return Bit(x.line, x.column, x.value)
+        return Bit(x.value)
     
     @call_decorator({'x': {'type': 'string'}})
     def _bin_to_int(self, vm, x: String) -> Int:
         try:
-            return Int(x.line, x.column, int(x.value, 2))
+            return Int(int(x.value, 2))
         except ValueError:
-            vm.error(STypeError(f'Invalid binary literal \'{x.value}\'', [x.line, x.column]))
+            vm.error(STypeError(f'Invalid binary literal \'{x.value}\''))
     
     @call_decorator({'left': {'type': 'Bit'}, 'right': {'type': 'Bit'}}, req_vm=False)
     def _bit_and(self, left: Bit, right: Bit) -> Bit:
@@ -98,36 +110,36 @@ class Bits:
     @call_decorator({'x': {'type': 'Bit'}, 'shift': {'type': 'Bit', 'default': (Bit, '1')}})
     def _bit_left_shift(self, vm, x: Bit, shift: Bit) -> Bit:
         if out := x << shift is None:
-            vm.error(SOverflowError('Shift value is too large', [x.line, x.column]))
+            vm.error(SOverflowError('Shift value is too large'))
         
         return out
     
     @call_decorator({'x': {'type': 'Bit'}, 'shift': {'type': 'Bit', 'default': (Bit, '1')}})
     def _bit_right_shift(self, vm, x: Bit, shift: Bit) -> Bit:
         if out := x >> shift is None:
-            vm.error(SOverflowError('Shift value is too large', [x.line, x.column]))
+            vm.error(SOverflowError('Shift value is too large'))
         
         return out
     
     @call_decorator({'x': {'type': 'Bit'}, 'position': {'type': 'Bit'}}, req_vm=False)
     def _bit_set(self, x: Bit, position: Bit) -> Bit:
-        if position >= Int(x.line, x.column, 8):
-            return x.value | (Int(x.line, x.column, 1) << (position - Int(x.line, x.column, 8)))
+        if position >= Int(8):
+            return x.value | (Int(1) << (position - Int(8)))
         
-        return x | (Int(x.line, x.column, 1) << position)
+        return x | (Int(1) << position)
     
     @call_decorator({'x': {'type': 'Bit'}, 'position': {'type': 'Bit'}}, req_vm=False)
     def _bit_clear(self, x: Bit, position: Bit) -> Bit:
-        if position >= Int(x.line, x.column, 8):
-            return Bit(x.line, x.column, x.value & ~(Int(x.line, x.column, 1) << (
-                    position - Int(x.line, x.column, 8)
+        if position >= Int(8):
+            return Bit(x.value & ~(Int(1) << (
+                    position - Int(8)
             )))
         
-        return x & ~(Int(x.line, x.column, 1) << position)
+        return x & ~(Int(1) << position)
     
     @call_decorator({'x': {'type': 'Bit'}, 'position': {'type': 'Bit'}}, req_vm=False)
     def _bit_toggle(self, x: Bit, position: Bit) -> Bit:
-        if position >= Int(x.line, x.column, 8):
-            return x ^ (Int(x.line, x.column, 1) << (position - Int(x.line, x.column, 8)))
+        if position >= Int(8):
+            return x ^ (Int(1) << (position - Int(8)))
         
-        return x ^ (Int(x.line, x.column, 1) << position)
+        return x ^ (Int(1) << position)
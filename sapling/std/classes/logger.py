@@ -35,11 +35,11 @@ class Logger:
     type = 'Logger'
     
     
-    _DEBUG = Int(-1, -1, DEBUG)
-    _INFO = Int(-1, -1, INFO)
-    _WARNING = Int(-1, -1, WARNING)
-    _ERROR = Int(-1, -1, ERROR)
-    _CRITICAL = Int(-1, -1, CRITICAL)
+    _DEBUG = Int(DEBUG)
+    _INFO = Int(INFO)
+    _WARNING = Int(WARNING)
+    _ERROR = Int(ERROR)
+    _CRITICAL = Int(CRITICAL)
     
     
     @call_decorator(req_vm=False)
@@ -49,24 +49,24 @@ class Logger:
     @call_decorator({'msg': {'type': 'string'}}, req_vm=False)
     def _debug(self, msg: String) -> Nil:
         log(__name__, DEBUG, msg.value)
-        return Nil(msg.line, msg.column)
+        return Nil()
     
     @call_decorator({'msg': {'type': 'string'}}, req_vm=False)
     def _info(self, msg: String) -> Nil:
         log(__name__, INFO, msg.value)
-        return Nil(msg.line, msg.column)
+        return Nil()
     
     @call_decorator({'msg': {'type': 'string'}}, req_vm=False)
     def _warning(self, msg: String) -> Nil:
         log(__name__, WARNING, msg.value)
-        return Nil(msg.line, msg.column)
+        return Nil()
     
     @call_decorator({'msg': {'type': 'string'}}, req_vm=False)
     def _error(self, msg: String) -> Nil:
         log(__name__, ERROR, msg.value)
-        return Nil(msg.line, msg.column)
+        return Nil()
     
     @call_decorator({'msg': {'type': 'string'}}, req_vm=False)
     def _critical(self, msg: String) -> Nil:
         log(__name__, CRITICAL, msg.value)
-        return Nil(msg.line, msg.column)
+        return Nil()
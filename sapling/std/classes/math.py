@@ -19,8 +19,8 @@ suffixes = [
 class Math:
     type = 'Math'
 
-    _PI = Float(-1, -1, pi)
-    _E = Float(-1, -1, e)
+    _PI = Float(pi)
+    _E = Float(e)
     
     @call_decorator({'num': {'type': ('int', 'float')}}, req_vm=False)
     def _snum(self, num: Int | Float) -> String:
@@ -31,79 +31,77 @@ class Math:
             magnitude += 1
             x /= 1000.0
         
-        return String(num.line, num.column, f'{x:.1f}{suffixes[magnitude]}')
+        return String(f'{x:.1f}{suffixes[magnitude]}')
     
     @call_decorator({'array': {'type': 'array'}}, req_vm=False)
     def _mean(self, array: Array) -> Float:
-        return Float(array.line, array.column, mean(array.to_py_list()))
+        return Float(mean(array.to_py_list()))
     
     @call_decorator({'array': {'type': 'array'}, 'r': {'type': 'int'}}, req_vm=False)
     def _permutations(self, array: Array, r: Int) -> Array:
         return Array.from_py_iter(
-            [list(x) for x in permutations(array.value, r.value)],
-            array.line,
-            array.column
+            [list(x) for x in permutations(array.value, r.value)]
         )
     
     @call_decorator({'x': {'type': 'int'}}, req_vm=False)
     def _factorial(self, x: Int) -> Int:
-        return Int(x.line, x.column, factorial(x.value))
+        return Int(factorial(x.value))
     
     @call_decorator({'arg1': {'type': ('int', 'float')}, 'arg2': {'type': ('int', 'float')}},
                     req_vm=False)
     def _min(self, arg1: Int | Float, arg2: Int | Float) -> Int | Float:
         if arg1.type == 'float' or arg2.type == 'float':
-            return Float(arg1.line, arg1.column, min(arg1.value, arg2.value))
+            return Float(min(arg1.value, arg2.value))
 
-        return Int(arg1.line, arg1.column, min(arg1.value, arg2.value))
+        return Int(min(arg1.value, arg2.value))
     
     @call_decorator({'arg1': {'type': ('int', 'float')}, 'arg2': {'type': ('int', 'float')}},
                     req_vm=False)
     def _max(self, arg1: Int | Float, arg2: Int | Float) -> Int | Float:
         if arg1.type == 'float' or arg2.type == 'float':
-            return Float(arg1.line, arg1.column, max(arg1.value, arg2.value))
+            return Float(max(arg1.value, arg2.value))
 
-        return Int(arg1.line, arg1.column, max(arg1.value, arg2.value))
+        return Int(max(arg1.value, arg2.value))
     
     @call_decorator({'fahrenheit': {'type': ('int', 'float')}}, req_vm=False)
     def _to_celsius(self, fahrenheit: Int | Float) -> Float:
-        return Float(fahrenheit.line, fahrenheit.column, (fahrenheit.value - 32) * 5/9)
+        return Float((fahrenheit.value - 32) * 5/9)
     
     @call_decorator({'celsius': {'type': ('int', 'float')}}, req_vm=False)
     def _to_fahrenheit(self, celsius: Int | Float) -> Float:
-        return Float(celsius.line, celsius.column, (celsius.value * 9/5) + 32)
+        return Float((celsius.value * 9/5) + 32)
     
     @call_decorator({'x': {'type': ('int', 'float')}}, req_vm=False)
     def _sqrt(self, x: Int | Float) -> Float:
-        return Float(x.line, x.column, sqrt(x.value))
+        return Float(sqrt(x.value))
 
     @call_decorator({'x': {'type': ('int', 'float')}}, req_vm=False)
     def _sine(self, x: Int | Float) -> Float:
-        return Float(x.line, x.column, sin(x.value))
+        return Float(sin(x.value))
     
     @call_decorator({'x': {'type': ('int', 'float')}}, req_vm=False)
     def _cosine(self, x: Int | Float) -> Float:
-        return Float(x.line, x.column, cos(x.value))
+        return Float(cos(x.value))
     
     @call_decorator({'x': {'type': ('int', 'float')}}, req_vm=False)
     def _tangent(self, x: Int | Float) -> Float:
-        return Float(x.line, x.column, tan(x.value))
+        return Float(tan(x.value))
     
     @call_decorator({'x': {'type': ('int', 'float')}}, req_vm=False)
     def _logarithm(self, x: Int | Float) -> Float:
-        return Float(x.line, x.column, log(x.value))
+        return Float(log(x.value))
     
     @call_decorator({'x': {'type': ('int', 'float')}}, req_vm=False)
     def _log2(self, x: Int | Float) -> Float:
-        return Float(x.line, x.column, log2(x.value))
+        return Float(log2(x.value))
     
     @call_decorator({'x': {'type': ('int', 'float')}}, req_vm=False)
     def _log10(self, x: Int | Float) -> Float:
-        return Float(x.line, x.column, log10(x.value))
+        return Float(log10(x.value))
     
     @call_decorator({'x': {'type': 'int'}, 'y': {'type': 'int'}}, req_vm=False)
     def _random_int(self, x: Int, y: Int) -> Int:
-        return Int(x.line, x.column, randint(x.value, y.value))
+        return Int(randint(x.value, y.value))
         
     @call_decorator({'x': {'type': 'array'}}, req_vm=False)
     def _random_array(self, x: Array):
@@ -111,35 +109,35 @@ class Math:
     
     @call_decorator({'x': {'type': ('int', 'float')}}, req_vm=False)
     def _to_degrees(self, x: Int | Float) -> Float:
-        return Float(x.line, x.column, degrees(x.value))
+        return Float(degrees(x.value))
     
     @call_decorator({'x': {'type': ('int', 'float')}}, req_vm=False)
     def _to_radians(self, x: Int | Float) -> Float:
-        return Float(x.line, x.column, radians(x.value))
+        return Float(radians(x.value))
         
     @call_decorator({'x': {'type': 'float'}}, req_vm=False)
     def _round_up(self, x: Float) -> Float:
-        return Float(x.line, x.column, ceil(x.value))
+        return Float(ceil(x.value))
     
     @call_decorator({'x': {'type': 'float'}}, req_vm=False)
     def _round_down(self, x: Float) -> Float:
-        return Float(x.line, x.column, floor(x.value))
+        return Float(floor(x.value))
     
     @call_decorator({'x': {'type': 'float'}}, req_vm=False)
     def _round(self, x: Float) -> Int:
-        return Int(x.line, x.column, round(x.value))
+        return Int(round(x.value))
     
     @call_decorator({'x': {'type': ('int', 'float')}}, req_vm=False)
     def _truncate(self, x: Int | Float) -> Float:
-        return Float(x.line, x.column, trunc(x.value))
+        return Float(trunc(x.value))
     
     @call_decorator({'x': {'type': ('int', 'float')}, 'y': {'type': ('int', 'float')}})
     def _power(self, vm, x: Int | Float, y: Int | Float) -> Float:
         try:
-            return Float(x.line, x.column, x.value ** y.value)
+            return Float(x.value ** y.value)
         except OverflowError:
-            vm.error(STypeError('Loaded power number is too large', [x.line, x.column - 7]))
+            vm.error(STypeError('Loaded power number is too large'))
     
     @call_decorator({'x': {'type': ('int', 'float')}}, req_vm=False)
     def _absolute(self, x: Int | Float) -> Float:
-        return Float(x.line, x.column, abs(x.value))
+        return Float(abs(x.value))
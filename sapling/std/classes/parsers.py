@@ -29,13 +29,13 @@ class Parsers:
             f = Path(file.value)
             if not f.is_file():
                 if not f.exists():
-                    vm.error(SFileError(file.value, vm.loose_pos))
+                    vm.error(SFileError(file.value))
                 else:
-                    vm.error(STypeError(f'\'{file.value}\' is not a file', vm.loose_pos))
+                    vm.error(STypeError(f'\'{file.value}\' is not a file'))
             
             with open(f, newline='') as csv:
                 r = reader(csv, delimiter=delimiter.value, quotechar=quotechar.value)
-                return Array.from_py_iter(list(r), file.line, file.column)
+                return Array.from_py_iter(list(r))
 
         @call_decorator({
             'file': {'type': 'string'},
@@ -49,13 +49,13 @@ class Parsers:
                 if not f.exists():
                     f.touch()
                 else:
-                    vm.error(STypeError(f'\'{file.value}\' is not a file', vm.loose_pos))
+                    vm.error(STypeError(f'\'{file.value}\' is not a file'))
             
             with open(f, 'w', newline='') as csv:
                 w = writer(csv, delimiter=delimiter.value, quotechar=quotechar.value)
                 w.writerows(data.to_py_list())
             
-            return Nil(*vm.loose_pos)
+            return Nil()
     
     class _Json:
         line = -1
@@ -72,11 +72,11 @@ class Parsers:
             f = Path(file.value)
             if not f.is_file():
                 if not f.exists():
-                    vm.error(SFileError(file.value, vm.loose_pos))
+                    vm.error(SFileError(file.value))
                 else:
-                    vm.error(STypeError(f'\'{file.value}\' is not a file', vm.loose_pos))
+                    vm.error(STypeError(f'\'{file.value}\' is not a file'))
             
-            return Dictionary.from_py_dict(json_load(f.read_text()), *vm.loose_pos)
+            return Dictionary.from_py_dict(json_load(f.read_text()))
         
         @call_decorator({'file': {'type': 'string'}, 'content': {'type': 'dictionary'}})
         def _write(self, vm, file: String, content: Dictionary) -> Nil:
@@ -85,10 +85,10 @@ class Parsers:
                 if not path.exists():
                     path.touch()
                 else:
-                    vm.error(STypeError(f'\'{file.value}\' is not a file', vm.loose_pos))
+                    vm.error(STypeError(f'\'{file.value}\' is not a file'))
             
             d = content.to_py_dict()
             with open(file.value, 'w') as fp:
                 json_dump(d, fp)
             
-            return Nil(*vm.loose_pos)
+            return Nil()
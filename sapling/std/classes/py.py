@@ -8,4 +8,4 @@ class Py:
     @call_decorator({'code': {'type': 'string'}}, req_vm=False)
     def _execute(self, code: String) -> Nil:
         exec(code.value)
-        return Nil(code.line, code.column)
+        return Nil()
@@ -12,10 +12,10 @@ class Runtime:
         
         bytecode = get_bytecode(code.value)
         
-        new_vm = VM(code.value, vm.env)
+        new_vm = VM(code.value, vm.globals | vm.env, vm.engine)
         new_vm.run(bytecode)
         
-        return Nil(code.line, code.column)
+        return Nil()
     
     class _Env:
         type = 'Env'
@@ -28,13 +28,14 @@ class Runtime:
         
         @call_decorator({'name': {'type': 'string'}})
         def _get(self, vm, name: String):
-            return vm.env.get(name.value, Nil(name.line, name.column))
+            value = vm.lookup(name.value)
+            return value if value is not None else Nil()
         
         @call_decorator({'name': {'type': 'string'}, 'value': {}})
         def _set(self, vm, name: String, value: object):
             vm.env[name.value] = value
-            return Nil(name.line, name.column)
+            return Nil()
         
         @call_decorator()
         def _all(self, vm):
-            return Array(*vm.loose_pos, vm.env.values())
+            return Array((vm.globals | vm.env).values())
@@ -15,95 +15,95 @@ class System:
     @call_decorator({'key': {'type': 'string'}}, req_vm=False)
     def _block_key(self, key: String) -> Nil:
         block_key(key.value)
-        return Nil(key.line, key.column)
+        return Nil()
 
     @call_decorator({'key': {'type': 'string'}}, req_vm=False)
     def _unblock_key(self, key: String) -> Nil:
         unblock_key(key.value)
-        return Nil(key.line, key.column)
+        return Nil()
     
     @call_decorator({'command': {'type': 'string'}}, req_vm=False)
     def _shell(self, command: String):
-        return Int(command.line, command.column, shell(command.value))
+        return Int(shell(command.value))
     
     @call_decorator(req_vm=False)
     def _cpu_count(self) -> Int:
-        return Int(-1, -1, cpu_count())
+        return Int(cpu_count())
     
     @call_decorator({'text': {'type': 'string'}}, req_vm=False)
     def _copy(self, text: String) -> Nil:
         copy(text.value)
-        return Nil(text.line, text.column)
+        return Nil()
     
     @call_decorator()
     def _paste(self, vm) -> String:
-        return String(*vm.loose_pos, paste())
+        return String(paste())
     
     @call_decorator({'x': {'type': 'int'}, 'y': {'type': 'int'}}, req_vm=False)
     def _mouse_to(self, x: Int, y: Int) -> Nil:
         moveTo(x.value, y.value)
-        return Nil(x.line, x.column)
+        return Nil()
     
     @call_decorator({'key': {'type': 'string'}}, req_vm=False)
     def _key_down(self, key: String) -> Nil:
         keyDown(key.value)
-        return Nil(key.line, key.column)
+        return Nil()
     
     @call_decorator({'key': {'type': 'string'}}, req_vm=False)
     def _key_up(self, key: String) -> Nil:
         keyUp(key.value)
-        return Nil(key.line, key.column)
+        return Nil()
         
     @call_decorator({'x': {'type': 'int'}, 'y': {'type': 'int'}}, req_vm=False)
     def _left_click(self, x: Int, y: Int) -> Nil:
         leftClick(x.value, y.value)
-        return Nil(x.line, x.column)
+        return Nil()
     
     @call_decorator({'x': {'type': 'int'}, 'y': {'type': 'int'}}, req_vm=False)
     def _right_click(self, x: Int, y: Int) -> Nil:
         rightClick(x.value, y.value)
-        return Nil(x.line, x.column)
+        return Nil()
     
     @call_decorator({'x': {'type': 'int'}, 'y': {'type': 'int'}}, req_vm=False)
     def _middle_click(self, x: Int, y: Int) -> Nil:
         middleClick(x.value, y.value)
-        return Nil(x.line, x.column)
+        return Nil()
     
     @call_decorator()
     def _cd(self, vm) -> String:
-        return String(*vm.loose_pos, getcwd())
+        return String(getcwd())
     
     @call_decorator()
     def _architecture(self, vm) -> Array:
-        return Array.from_py_iter(architecture(), *vm.loose_pos)
+        return Array.from_py_iter(architecture())
     
     @call_decorator()
     def _machine(self, vm) -> String:
-        return String(*vm.loose_pos, machine())
+        return String(machine())
     
     @call_decorator()
     def _device_name(self, vm) -> String:
-        return String(*vm.loose_pos, node())
+        return String(node())
     
     @call_decorator()
     def _platform(self, vm) -> String:
-        return String(*vm.loose_pos, platform())
+        return String(platform())
     
     @call_decorator()
     def _processor(self, vm) -> String:
-        return String(*vm.loose_pos, processor())
+        return String(processor())
     
     @call_decorator()
     def _release(self, vm) -> String:
-        return String(*vm.loose_pos, release())
+        return String(release())
     
     @call_decorator()
     def _version(self, vm) -> String:
-        return String(*vm.loose_pos, version())
+        return String(version())
     
     @call_decorator({'name': {'type': 'string'}}, req_vm=False)
     def _getenv(self, name: String) -> String | Nil:
         if getenv(name.value) is None:
-            return Nil(name.line, name.column)
+            return Nil()
         
-        return String(name.line, name.column, getenv(name.value))
+        return String(getenv(name.value))
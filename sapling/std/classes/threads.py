@@ -18,7 +18,7 @@ class Thread:
     @call_decorator()
     def _run(self, vm):
         self.t.start()
-        return Nil(*vm.loose_pos)
+        return Nil()
 
 
 class Threads:
@@ -26,7 +26,7 @@ class Threads:
     
     @call_decorator()
     def _active(self, vm):
-        return Int(active_count(), *vm.loose_pos)
+        return Int(active_count())
     
     @call_decorator({
         'f': {'type': 'func'},
@@ -34,4 +34,7 @@ class Threads:
         'name': {'type': 'string', 'default': (String, '')},
     })
     def _thread(self, vm, f: Func, args: Array, name: String | Nil) -> Class:
-        return Class.from_py_cls(Thread(target=f, args=(vm, args.value), name=name.value), f.line, f.column)
+        # The thread gets a VM of its own, the frames of its calls would replace the running ones
+        return Class.from_py_cls(
+            Thread(target=f, args=(vm.fork(), args.value), name=name.value)
+        )
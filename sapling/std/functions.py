@@ -2,7 +2,7 @@ from pickle import dumps, loads, HIGHEST_PROTOCOL
 from types import MethodType
 from getpass import getpass
 
-from sapling.objects import Nil, Int, String, Node, Func, Array, Float, Bool, Class, StrBytes
+from sapling.objects import Nil, Int, String, Node, Func, Memo, Array, Float, Bool, Class, StrBytes
 from sapling.vmutils import py_to_sap, Param, invalid_cast_type
 from sapling.std.call_decorator import call_decorator
 from sapling.error import STypeError, SAttributeError
@@ -11,52 +11,52 @@ from sapling.error import STypeError, SAttributeError
 @call_decorator({'x': {}}, req_vm=False, is_attr=False)
 def _print(x: Node):
     print(x.repr(None))
-    return Nil(x.line, x.column)
+    return Nil()
 
 
 @call_decorator({'x': {}}, req_vm=False, is_attr=False)
 def _type(x: Node):
-    return String(x.line, x.column, x.type)
+    return String(x.type)
 
 
 @call_decorator({'x': {}}, False)
 def _len(vm, x: Node):
     try:
-        return Int(x.line, x.column, len(x))
+        return Int(len(x))
     except TypeError:
-        vm.error(STypeError(f'Cannot find length of type \'{x.type}\'', [x.line, x.column]))
+        vm.error(STypeError(f'Cannot find length of type \'{x.type}\''))
 
 
 @call_decorator({'x': {}}, False, False)
 def _attrs(x: Node):
     return Array.from_py_iter([
         obj[1:] for obj in dir(x) if not obj.startswith('__') and obj.startswith('_')
-    ], x.line, x.column)
+    ])
 
 
 @call_decorator({'obj': {'func': {'type': 'func'}}}, False)
 def _args_of(vm, obj: Func):
     if not callable(obj):
-        vm.error(STypeError(f'{obj.type} is not callable', [obj.line, obj.column]))
+        vm.error(STypeError(f'{obj.type} is not callable'))
 
     if isinstance(obj, MethodType):
-        return Array.from_py_iter(obj.params, *vm.loose_pos)
+        return Array.from_py_iter(obj.params)
 
-    return Array.from_py_iter(obj.params, obj.line, obj.column)
+    return Array.from_py_iter(obj.params)
 
 
 @call_decorator({'obj': {}, 'name': {'type': 'string'}}, False)
 def _get(vm, obj: Node, attr: String):
     try:
-        return py_to_sap(getattr(obj, f'_{attr.value}'), *vm.loose_pos)
+        return py_to_sap(getattr(obj, f'_{attr.value}'))
     except AttributeError:
-        vm.error(SAttributeError(obj.type, attr.value, [obj.line, obj.column]))
+        vm.error(SAttributeError(obj.type, attr.value))
 
 
 @call_decorator({'obj': {}, 'name': {'type': 'string'}, 'value': {}}, False, False)
 def _set(obj: Node, attr: String, value: Node) -> Nil:
     setattr(obj, f'_{attr.value}', value)
-    return Nil(obj.line, obj.column)
+    return Nil()
 
 @call_decorator({
     'start': {'type': 'int'},
@@ -64,7 +64,7 @@ def _set(obj: Node, attr: String, value: Node) -> Nil:
     'increment': {'type': 'int', 'default': (Int, 1)},
 }, False, False)
 def _range(start: Int, end: Int, increment: Int) -> Array:
-    return Array.from_py_iter(range(start.value, end.value, increment.value), start.line, start.column)
+    return Array.from_py_iter(range(start.value, end.value, increment.value))
 
 @call_decorator({'obj': {}}, is_attr=False)
 def _to_int(vm, obj: Node) -> Int:
@@ -72,7 +72,7 @@ def _to_int(vm, obj: Node) -> Int:
         if int(obj).__class__ != int:
             invalid_cast_type(vm, 'int')
         
-        return Int(obj.line, obj.column, int(obj))
+        return Int(int(obj))
     except ValueError:
         invalid_cast_type(vm, 'int')
 
@@ -82,7 +82,7 @@ def _to_float(vm, obj: Node) -> Float:
         if float(obj).__class__ != float:
             invalid_cast_type(vm, 'float')
         
-        return Float(obj.line, obj.column, float(obj))
+        return Float(float(obj))
     except ValueError:
         invalid_cast_type(vm, 'float')
 
@@ -92,7 +92,7 @@ def _to_string(vm, obj: Node) -> String:
         if str(obj).__class__ != str:
             invalid_cast_type(vm, 'string')
         
-        return String(obj.line, obj.column, str(obj))
+        return String(str(obj))
     except ValueError:
         invalid_cast_type(vm, 'string')
 
@@ -102,56 +102,64 @@ def _to_bool(vm, obj: Node) -> Bool:
         if bool(obj).__class__ != bool:
             invalid_cast_type(vm, 'bool')
         
-        return Bool(obj.line, obj.column, bool(obj))
+        return Bool(bool(obj))
     except ValueError:
         invalid_cast_type(vm, 'bool')
 
 @call_decorator({'prompt': {'type': 'string', 'default': (String, '')}}, req_vm=False, is_attr=False)
 def _input(prompt: String) -> String:
-    return String(prompt.line, prompt.column, getpass(prompt.value))
+    return String(getpass(prompt.value))
 
 @call_decorator({'obj': {}}, req_vm=False, is_attr=False)
 def _is_callable(obj: Node) -> Bool:
-    return Bool(obj.line, obj.column, callable(obj))
+    return Bool(callable(obj))
 
 @call_decorator({'obj': {}}, req_vm=False, is_attr=False)
 def _is_class(obj: Node) -> Bool:
-    return Bool(obj.line, obj.column, isinstance(obj, Class))
+    return Bool(isinstance(obj, Class))
 
 @call_decorator({'obj': {}}, req_vm=False, is_attr=False)
 def _serialize(obj: Node) -> StrBytes:
-    return StrBytes(obj.line, obj.column, dumps(obj, HIGHEST_PROTOCOL))
+    return StrBytes(dumps(obj, HIGHEST_PROTOCOL))
 
 @call_decorator({'bytes': {'type': 'strbytes'}}, req_vm=False, is_attr=False)
 def _deserialize(b: StrBytes) -> Node:
     return loads(b.value)
 
+@call_decorator({
+    'func': {'type': 'func'},
+    'max_size': {'type': 'int', 'default': (Int, 128)},
+}, req_vm=False, is_attr=False)
+def _memo(func: Func, max_size: Int) -> Memo:
+    return Memo(func.name, func.params, wrapped=func, max_size=max_size.value)
+
 
 # @call_decorator({'obj': {}}, is_attr=False)
 # def _object_position(vm, obj: Node):
 #     try:
 #         return Array.from_py_list([obj.line, obj.column])
 #     except TypeError:
-#         return Array.from_py_list(vm.loose_pos, *vm.loose_pos)
+#         return Array.from_py_list(vm.loose_pos)
 
 
 public_funcs = {
-    'print': Func(-1, -1, 'print', _print.params, func=_print),
-    'type': Func(-1, -1, 'type', _type.params, func=_type),
-    'len': Func(-1, -1, 'len', _len.params, func=_len),
-    'attrs': Func(-1, -1, 'attrs', [Param('obj')], func=_attrs),
-    'get': Func(-1, -1, 'get', _get.params, func=_get),
-    'set': Func(-1, -1, 'set', _set.params, func=_set),
-    'args_of': Func(-1, -1, 'args_of', _args_of.params, func=_args_of),
-    # 'object_position': Func(-1, -1, 'object_position', _object_position.params, func=_object_position),
-    'range': Func(-1, -1, 'range', _range.params, func=_range),
-    'to_int': Func(-1, -1, 'to_int', _to_int.params, func=_to_int),
-    'to_float': Func(-1, -1, 'to_float', _to_float.params, func=_to_float),
-    'to_string': Func(-1, -1, 'to_string', _to_string.params, func=_to_string),
-    'to_bool': Func(-1, -1, 'to_bool', _to_bool.params, func=_to_bool),
-    'input': Func(-1, -1, 'input', _input.params, func=_input),
-    'is_callable': Func(-1, -1, 'is_callable', _is_callable.params, func=_is_callable),
-    'is_class': Func(-1, -1, 'is_class', _is_class.params, func=_is_class),
-    'serialize': Func(-1, -1, 'serialize', _serialize.params, func=_serialize),
-    'deserialize': Func(-1, -1, 'deserialize', _deserialize.params, func=_deserialize),
+    'print': Func('print', _print.params, func=_print),
+    'type': Func('type', _type.params, func=_type),
+    'len': Func('len', _len.params, func=_len),
+    'attrs': Func('attrs', [Param('obj')], func=_attrs),
+    'get': Func('get', _get.params, func=_get),
+    'set': Func('set', _set.params, func=_set),
+    'args_of': Func('args_of', _args_of.params, func=_args_of),
+    # 'object_position': Func('object_position', _object_position.params, func=_object_position),
+    'range': Func('range', _range.params, func=_range),
+    'to_int': Func('to_int', _to_int.params, func=_to_int),
+    'to_float': Func('to_float', _to_float.params, func=_to_float),
+    'to_string': Func('to_string', _to_string.params, func=_to_string),
+    'to_bool': Func('to_bool', _to_bool.params, func=_to_bool),
+    'input': Func('input', _input.params, func=_input),
+    'is_callable': Func('is_callable', _is_callable.params, func=_is_callable),
+    'is_class': Func('is_class', _is_class.params, func=_is_class),
+    'serialize': Func('serialize', _serialize.params, func=_serialize),
+    'deserialize': Func('deserialize', _deserialize.params, func=_deserialize),
+    'memo': Func('memo', _memo.params, func=_memo),
 }
@@ -0,0 +1,90 @@
+"""
+lazy.py
+-------
+
+Registries of the standard libraries and classes that don't import them until they're used. A
+library's module is imported the first time a file imports it and a class's the first time it's
+used, so the packages of the ones a file doesn't use (pyautogui, requests, customtkinter...) are
+never imported.
+"""
+
+from collections.abc import Mapping
+from importlib import import_module
+
+from sapling.objects import Class, versions
+
+
+def load(path: str):
+    """Imports the object at a path
+
+    Args:
+        path (str): The path, the module and the name in it, like 'sapling.std.libs.time:time'
+
+    Returns:
+        The object
+    """
+
+    module, name = path.split(':')
+    return getattr(import_module(module), name)
+
+
+class LazyLibs(Mapping):
+    """Maps the names of the libraries to their Python classes, importing each one the first time
+    it's got"""
+
+    def __init__(self, paths: dict[str, str]):
+        self.paths = paths
+        self.libs = {}
+
+    def __getitem__(self, name: str):
+        if name not in self.libs:
+            self.libs[name] = load(self.paths[name])
+
+        return self.libs[name]
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __contains__(self, name) -> bool:
+        return name in self.paths
+
+
+class LazyClass(Class):
+    """A standard class converted from its Python class the first time it's used, its name,
+    objects, type and repr are those of the converted class"""
+
+    __slots__ = ('path', 'converted')
+
+    def __init__(self, path: str):
+        self.path = path
+        self.converted = None
+        self.version = next(versions)
+
+    def load(self) -> Class:
+        if self.converted is None:
+            self.converted = Class.from_py_cls(load(self.path))
+
+        return self.converted
+
+    name = property(lambda self: self.load().name)
+    objects = property(lambda self: self.load().objects)
+    repr_func = property(lambda self: self.load().repr_func)
+    type = property(lambda self: self.load().type)
+    python_class = property(lambda self: self.load().python_class)
+
+
+def lazy_class(name: str, module: str) -> LazyClass:
+    """Makes a standard class whose module is imported the first time it's used
+
+    Args:
+        name (str): The name of its Python class in the module
+        module (str): The module of the Python class
+
+    Returns:
+        LazyClass: The Sapling Class
+    """
+
+    return LazyClass(f'{module}:{name}')
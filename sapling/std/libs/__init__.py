@@ -1,24 +1,16 @@
-from .networking import networking
-# from .bytecode import bytecode
-from .fstream import fstream
-from .sound import sound
-from .knock import knock
-from .time import time
-from .sapX import sapX
-from .mem import mem
-# from .ai import ai
-from .ui import ui
+from sapling.std.lazy import LazyLibs
 
 
-public_libs = {
-    'networking': networking,
-    # 'bytecode': bytecode,
-    'fstream': fstream,
-    'sound': sound,
-    'knock': knock,
-    'time': time,
-    'sapX': sapX,
-    'mem': mem,
-    # 'ai': ai,
-    'ui': ui,
-}
+# The modules are imported by the first file importing the library, see sapling.std.lazy
+public_libs = LazyLibs({
+    'networking': 'sapling.std.libs.networking:networking',
+    # 'bytecode': 'sapling.std.libs.bytecode:bytecode',
+    'fstream': 'sapling.std.libs.fstream:fstream',
+    'sound': 'sapling.std.libs.sound:sound',
+    'knock': 'sapling.std.libs.knock:knock',
+    'time': 'sapling.std.libs.time:time',
+    'sapX': 'sapling.std.libs.sapX:sapX',
+    'mem': 'sapling.std.libs.mem:mem',
+    # 'ai': 'sapling.std.libs.ai:ai',
+    'ui': 'sapling.std.libs.ui:ui',
+})
@@ -25,7 +25,7 @@ class Model:
     @call_decorator()
     def _test(self, vm) -> Float:
         y_pred = self.model.predict(self.X_test)
-        return Float(*vm.loose_pos, accuracy_score(self.y_test, y_pred))
+        return Float(accuracy_score(self.y_test, y_pred))
 
 
 class ai:
@@ -34,7 +34,7 @@ class ai:
     @call_decorator({'data': {'type': 'array'}, 'labels': {'type': 'array'}}, is_attr=False)
     def _train(vm, data: Array, labels: Array) -> Class:
         if len(data) != len(labels):
-            vm.error(STypeError('data and labels must have the same length', vm.loose_pos))
+            vm.error(STypeError('data and labels must have the same length'))
         
         vectorizer = CountVectorizer()
         X = vectorizer.fit_transform(data.to_py_list())
@@ -42,4 +42,4 @@ class ai:
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         model = MultinomialNB()
         model.fit(X_train, y_train)
-        return Class.from_py_cls(Model(model, X_test, y_test), data.line, data.column)
+        return Class.from_py_cls(Model(model, X_test, y_test))
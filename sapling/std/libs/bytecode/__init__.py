@@ -6,13 +6,13 @@ import sapling.codes as codes
 from .nodes import *
 
 
-def get_bytecode_class(node, pos: list, node_pos: list[Int, Int]):
+def get_bytecode_class(node, node_pos: list[Int, Int]):
     if isinstance(node, codes.Call):
-        args = ArgsNode(*node_pos, Array(*pos, [ArgNode(*node_pos, arg) for arg in node.args]))
+        args = ArgsNode(*node_pos, Array([ArgNode(*node_pos, arg) for arg in node.args]))
         
         return CallNode(
             *node_pos,
-            String(*pos, node.func.value),
+            String(node.func.value),
             args
         )
 
@@ -26,17 +26,10 @@ class bytecode:
         
         stmts = bc.stmts
         for i, stmt in enumerate(stmts):
-            stmts[i] = get_bytecode_class(
-                stmt,
-                vm.loose_pos,
-                [
-                    Int(*vm.loose_pos, vm.loose_pos[0]),
-                    Int(*vm.loose_pos, vm.loose_pos[1])
-                ]
-            )
+            stmts[i] = get_bytecode_class(stmt, [Int(stmt.line), Int(stmt.column)])
         
         return Class.from_py_cls(CodeNode(
-            Int(*vm.loose_pos, 0),
-            Int(*vm.loose_pos, 0),
-            Array.from_py_iter(stmts, *vm.loose_pos)
-        ), *vm.loose_pos)
+            Int(0),
+            Int(0),
+            Array.from_py_iter(stmts)
+        ))
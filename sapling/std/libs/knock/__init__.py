@@ -10,7 +10,7 @@ from sapling.error import SError
 
 
 class SRequestError(SError):
-    def __init__(self, err: MissingSchema, pos: list):
+    def __init__(self, err: MissingSchema, pos: list | None = None):
         self.err = err
 
         self.pos = pos
@@ -27,6 +27,6 @@ class knock:
     @call_decorator({'url': {'type': 'string'}})
     def _knock(self, vm, url: String):
         try:
-            return Class.from_py_cls(WebResponse(vm, get(url.value)), url.line, url.column)
+            return Class.from_py_cls(WebResponse(vm, get(url.value)))
         except MissingSchema as e:
-            vm.error(SRequestError(e, vm.loose_pos))
+            vm.error(SRequestError(e))
@@ -18,9 +18,9 @@ class WebResponse:
         return f'WebResponse(status: {self._status_code.value}, url: {self._url.value})'
     
     def __init__(self, vm, response: Response) -> None:
-        self._html = String(-1, -1, response.text)
-        self._url = String(-1, -1, response.url)
-        self._status_code = Int(-1, -1, response.status_code)
+        self._html = String(response.text)
+        self._url = String(response.url)
+        self._status_code = Int(response.status_code)
 
         self.response = response
         self.vm = vm
@@ -31,14 +31,14 @@ class WebResponse:
     @call_decorator()
     def _to_json(self, vm):
         try:
-            return Dictionary.from_py_dict(self.response.json(), *vm.loose_pos)
+            return Dictionary.from_py_dict(self.response.json())
         except JSONDecodeError:
-            vm.error(SDecodeError('Cannot convert page to JSON', vm.loose_pos))
+            vm.error(SDecodeError('Cannot convert page to JSON'))
 
     # @call_decorator({'name': {'type': 'string'}, 'recursive': {'type': 'bool', 'default': (Bool, False)}})
     # def _find(self, vm, name: String, recursive: Bool):
-    #     return py_to_sap(self.soup.find(name.value, recursive=recursive.value), *vm.loose_pos)
+    #     return py_to_sap(self.soup.find(name.value, recursive=recursive.value))
     #
     # @call_decorator({'name': {'type': 'string'}, 'recursive': {'type': 'bool', 'default': (Bool, False)}})
     # def _find_all(self, vm, name: String, recursive: Bool):
-    #     return py_to_sap(self.soup.find_all(name.value, recursive=recursive.value), *vm.loose_pos)
+    #     return py_to_sap(self.soup.find_all(name.value, recursive=recursive.value))
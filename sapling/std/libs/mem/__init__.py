@@ -9,4 +9,4 @@ class mem:
     
     @call_decorator({'name': {'type': ('int', 'string')}})
     def _open_process(self, vm, name: String | Int) -> Class:
-        return Class.from_py_cls(Process(vm, name.value), name.line, name.column)
+        return Class.from_py_cls(Process(vm, name.value))
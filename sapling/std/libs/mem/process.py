@@ -27,33 +27,33 @@ class Process:
     
     @property
     def _name(self) -> String:
-        return String(*self.vm.loose_pos, self.process.name)
+        return String(self.process.name)
     
     @property
     def _pid(self) -> Int:
-        return Int(*self.vm.loose_pos, self.process.pid)
+        return Int(self.process.pid)
     
     @property
     def _handle(self) -> Int:
-        return py_to_sap(self.process.handle, *self.vm.loose_pos)
+        return py_to_sap(self.process.handle)
     
     
     @call_decorator({'base_addr': {'type': 'hex'}})
     def _read(self, vm, base_addr: Hex):
-        return py_to_sap(self.process.read(base_addr.value), *vm.loose_pos)
+        return py_to_sap(self.process.read(base_addr.value))
     
     @call_decorator({'base_addr': {'type': 'hex'}, 'value': {'type': 'hex'}})
     def _write(self, vm, base_addr: Hex, value: Hex):
         try:
             self.process.write(base_addr.value, value.value)
-            return Bool(*vm.loose_pos, True)
+            return Bool(True)
         except ReadWriteMemoryError:
-            return Bool(*vm.loose_pos, False)
+            return Bool(False)
     
     @call_decorator({'base_addr': {'type': 'hex'}, 'offsets': {'type': 'array'}})
     def _get_pointer(self, vm, base_addr: Hex, offsets: Array):
-        return Int(*vm.loose_pos, self.process.get_pointer(base_addr.value, offsets.to_py_list()))
+        return Int(self.process.get_pointer(base_addr.value, offsets.to_py_list()))
     
     @call_decorator()
     def _close(self, vm):
-        return Int(*vm.loose_pos, self.process.close())
+        return Int(self.process.close())
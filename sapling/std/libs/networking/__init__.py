@@ -19,8 +19,8 @@ class networking:
     type = 'networking'
     
     
-    _AF_INET = Int(-1, -1, 1)
-    _SOCK_STREAM = Int(-1, -1, -1)
+    _AF_INET = Int(1)
+    _SOCK_STREAM = Int(-1)
     
     
     @call_decorator({'family': {'type': 'int'}, 'types': {'type': 'int'}})
@@ -29,9 +29,9 @@ class networking:
         typ = types.get(t.value)
         
         if fam is None:
-            vm.error(STypeError(f'Invalid family \'{family.value}\'', *vm.loose_pos))
+            vm.error(STypeError(f'Invalid family \'{family.value}\''))
         
         if typ is None:
-            vm.error(STypeError(f'Invalid type \'{t.value}\'', *vm.loose_pos))
+            vm.error(STypeError(f'Invalid type \'{t.value}\''))
         
-        return Class.from_py_cls(Connection(socket(fam, typ)), *vm.loose_pos)
+        return Class.from_py_cls(Connection(socket(fam, typ)))
@@ -19,30 +19,30 @@ class Connection:
     @call_decorator()
     def _accept(self, vm) -> Array:
         s, addr = self.s.accept()
-        return Array(*vm.loose_pos, [Connection(s), py_to_sap(addr, *vm.loose_pos)])
+        return Array([Connection(s), py_to_sap(addr)])
     
     @call_decorator({'info': {'type': 'string'}}, req_vm=False)
     def _send(self, info: String) -> Int:
-        return Int(info.line, info.column, self.s.send(info.value.encode('utf-8')))
+        return Int(self.s.send(info.value.encode('utf-8')))
     
     @call_decorator({'port': {'type': 'int'}, 'address': {'type': 'string', 'default': (String, '')}},
                     req_vm=False)
     def _bind(self, port: Int, address: String) -> Nil:
         self.s.bind((address.value, port.value))
-        return Nil(port.line, port.column)
+        return Nil()
     
     @call_decorator({'port': {'type': 'int'}, 'address': {'type': 'string', 'default': (String, '')}},
                     req_vm=False)
     def _connect(self, port: Int, address: String) -> Nil:
         self.s.connect((address.value, port.value))
-        return Nil(port.line, port.column)
+        return Nil()
     
     @call_decorator({'size': {'type': 'int'}}, req_vm=False)
     def _listen(self, size: Int) -> Nil:
         self.s.listen(size.value)
-        return Nil(size.line, size.column)
+        return Nil()
     
     @call_decorator()
     def _close(self, vm) -> Nil:
         self.s.close()
-        return Nil(*vm.loose_pos)
+        return Nil()
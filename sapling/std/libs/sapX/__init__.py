@@ -9,8 +9,8 @@ class sapX:
     
     @call_decorator({'src': {'type': 'string'}}, req_vm=False)
     def _lexer(self, src: String) -> Class:
-        return Class.from_py_cls(Lexer(src.value), src.line, src.column)
+        return Class.from_py_cls(Lexer(src.value))
     
     @call_decorator({'stream': {'type': 'tokens'}, 'tokens': {'type': 'array'}}, req_vm=False)
     def _parser(self, stream: Class, tokens: Array) -> Class:
-        return Class.from_py_cls(Parser(stream, tokens.to_py_list()), stream.line, stream.column)
+        return Class.from_py_cls(Parser(stream, tokens.to_py_list()))
@@ -10,7 +10,7 @@ from sapling.error import SError
 
 
 class SLexError(SError):
-    def __init__(self, msg: str, pos: list) -> None:
+    def __init__(self, msg: str, pos: list | None = None) -> None:
         self.msg = msg
         
         self.pos = pos
@@ -35,11 +35,11 @@ class Token:
     
     @property
     def _name(self) -> String:
-        return String(*self.vm.loose_pos, self.t.name)
+        return String(self.t.name)
     
     @property
     def _value(self) -> String:
-        return String(*self.vm.loose_pos, self.t.value)
+        return String(self.t.value)
 
 
 class Tokens:
@@ -53,10 +53,10 @@ class Tokens:
         
         try:
             self.as_list = [
-                Class.from_py_cls(Token(x, vm), *vm.loose_pos) for x in list(self.stream)
+                Class.from_py_cls(Token(x, vm)) for x in list(self.stream)
             ]
         except LexingError as e:
-            vm.error(SLexError(e.message, vm.loose_pos))
+            vm.error(SLexError(e.message))
     
     def repr(self, _) -> str:
         return '{' + ', '.join([x.repr(self) for x in self.as_list]) + '}'
@@ -64,7 +64,7 @@ class Tokens:
     
     @property
     def _tokens(self) -> Array:
-        return Array.from_py_iter(self.as_list, *self.vm.loose_pos)
+        return Array.from_py_iter(self.as_list)
     
     @property
     def _stream(self) -> LexerStream:
@@ -87,13 +87,13 @@ class Lexer:
     @call_decorator({'pattern': {'type': 'regex'}}, req_vm=False)
     def _skip(self, pattern: Regex) -> Nil:
         self.lg.ignore(pattern.value)
-        return Nil(pattern.line, pattern.column)
+        return Nil()
     
     @call_decorator({'name': {'type': 'string'}, 'pattern': {'type': 'regex'}}, req_vm=False)
     def _tok(self, name: String, pattern: Regex) -> Nil:
         self.lg.add(name.value, pattern.value)
-        return Nil(pattern.line, pattern.column)
+        return Nil()
     
     @call_decorator()
     def _tokenize(self, vm) -> Class:
-        return Class.from_py_cls(Tokens(self.lg.build().lex(self.src), vm), *vm.loose_pos)
+        return Class.from_py_cls(Tokens(self.lg.build().lex(self.src), vm))
@@ -8,7 +8,7 @@ from sapling.error import SError
 
 
 class SParserError(SError):
-    def __init__(self, msg: str, pos: list):
+    def __init__(self, msg: str, pos: list | None = None):
         self.msg = msg
         
         self.pos = pos
@@ -36,9 +36,9 @@ class Parser:
         try:
             self.pg.production(rule.value)(handler)
         except IndexError:
-            vm.error(SParserError('Invalid rule syntax, expected rule name :', vm.loose_pos))
+            vm.error(SParserError('Invalid rule syntax, expected rule name :'))
         
-        return Nil(rule.line, rule.column)
+        return Nil()
     
     @call_decorator(req_vm=False)
     def _parse(self) -> any:
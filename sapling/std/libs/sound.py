@@ -20,22 +20,22 @@ class Player:
     @call_decorator()
     def _play(self, vm):
         self.pb.play()
-        return Nil(*vm.loose_pos)
+        return Nil()
     
     @call_decorator()
     def _pause(self, vm):
         self.pb.pause()
-        return Nil(*vm.loose_pos)
+        return Nil()
     
     @call_decorator()
     def _stop(self, vm):
         self.pb.stop()
-        return Nil(*vm.loose_pos)
+        return Nil()
     
     @call_decorator()
     def _resume(self, vm):
         self.pb.resume()
-        return Nil(*vm.loose_pos)
+        return Nil()
 
     @call_decorator({'vol': {'type': ('int', 'float')}})
     def _volume(self, vm, v: Float):
@@ -43,15 +43,15 @@ class Player:
             vm.error(STypeError('Volume must be between 0 and 1', v.pos))
 
         self.pb.set_volume(v.value)
-        return Nil(*vm.loose_pos)
+        return Nil()
     
     @call_decorator()
     def _get_volume(self, vm):
-        return Float(*vm.loose_pos, self.pb.volume)
+        return Float(self.pb.volume)
     
     @call_decorator()
     def _get_duration(self, vm):
-        return Float(*vm.loose_pos, self.pb.duration)
+        return Float(self.pb.duration)
 
 
 class sound:
@@ -59,4 +59,4 @@ class sound:
     
     @call_decorator({'file': {'type': 'string'}}, req_vm=False)
     def _player(self, file: String) -> Class:
-        return Class.from_py_cls(Player(file), file.line, file.column)
+        return Class.from_py_cls(Player(file))
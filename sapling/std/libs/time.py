@@ -11,12 +11,12 @@ class time:
     
     @call_decorator({})
     def _current_time(self, vm) -> String:
-        return String(*vm.loose_pos, ctime())
+        return String(ctime())
     
     @call_decorator({'seconds': {'type': ('int', 'float')}}, req_vm=False)
     def _pause(self, seconds: Int | Float) -> Nil:
         sleep(seconds.value)
-        return Nil(seconds.line, seconds.column)
+        return Nil()
 
     @call_decorator({'delay_seconds': {'type': 'int'}, 'func': {'type': 'func'},
                      'args': {'type': 'array', 'default': (Array, [])}})
@@ -24,7 +24,7 @@ class time:
         s = scheduler(timef, sleep)
         s.enter(delay.value, 1, lambda: func(vm, args.value))
         s.run()
-        return Nil(func.line, func.column)
+        return Nil()
     
     @call_decorator({
         'func': {'type': 'func'},
@@ -37,4 +37,4 @@ class time:
         func(vm, args)
         
         end = perf_counter()
-        return Float(*vm.loose_pos, end - start)
+        return Float(end - start)
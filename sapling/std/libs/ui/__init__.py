@@ -9,29 +9,28 @@ from .font import Font
 class ui:
     type = 'ui'
     
-    _RED = String(-1, -1, 'red')
-    _GREEN = String(-1, -1, 'green')
-    _BLUE = String(-1, -1, 'blue')
-    _YELLOW = String(-1, -1, 'yellow')
-    _CYAN = String(-1, -1, 'cyan')
-    _MAGENTA = String(-1, -1, 'magenta')
-    _BLACK = String(-1, -1, 'black')
-    _WHITE = String(-1, -1, 'white')
-    _GRAY = String(-1, -1, 'gray')
-    _LIGHT_GRAY = String(-1, -1, 'light gray')
-    _DARK_GRAY = String(-1, -1, 'dark gray')
-    _PINK = String(-1, -1, 'pink')
-    _ORANGE = String(-1, -1, 'orange')
-    _BROWN = String(-1, -1, 'brown')
-    _GOLD = String(-1, -1, 'gold')
-    _SILVER = String(-1, -1, 'silver')
+    _RED = String('red')
+    _GREEN = String('green')
+    _BLUE = String('blue')
+    _YELLOW = String('yellow')
+    _CYAN = String('cyan')
+    _MAGENTA = String('magenta')
+    _BLACK = String('black')
+    _WHITE = String('white')
+    _GRAY = String('gray')
+    _LIGHT_GRAY = String('light gray')
+    _DARK_GRAY = String('dark gray')
+    _PINK = String('pink')
+    _ORANGE = String('orange')
+    _BROWN = String('brown')
+    _GOLD = String('gold')
+    _SILVER = String('silver')
     
     
     @call_decorator({'family': {'type': 'string'}, 'size': {'type': 'int'}}, req_vm=False)
     def _font(self, family: String, size: Int) -> Class:
         return Class.from_py_cls(
-            Font(family=family.value, size=size.value),
-            family.line, family.column
+            Font(family=family.value, size=size.value)
         )
     
     @call_decorator({
@@ -42,8 +41,7 @@ class ui:
     })
     def _window(self, vm, title: String, width: Int, height: Int, bg: String) -> Class:
         return Class.from_py_cls(
-            Window(title=title.value, width=width.value, height=height.value, bg=bg.value),
-            *vm.loose_pos
+            Window(title=title.value, width=width.value, height=height.value, bg=bg.value)
         )
     
     @call_decorator({
@@ -56,12 +54,10 @@ class ui:
         'hover_fg': {'type': 'string', 'default': (String, '#262626')},
         'text_colour': {'type': 'string', 'default': (String, '#ffffff')},
         'text': {'type': 'string', 'default': (String, '')},
-        'font': {'type': 'Font', 'default': lambda ln, col: Class.from_py_cls(Font(
-            'Arial', 10
-        ), ln, col)},
+        'font': {'type': 'Font', 'default': lambda: Class.from_py_cls(Font('Arial', 10))},
         'compound': {'type': 'string', 'default': (String, 'center')},
         'anchor': {'type': 'string', 'default': (String, 'center')},
-        'on_click': {'type': 'func', 'default': lambda ln, col: Func(ln, col, 'on_click', [])}
+        'on_click': {'type': 'func', 'default': lambda: Func('on_click', [])}
     })
     def _button(
         self,
@@ -87,7 +83,7 @@ class ui:
                 text_color=text_colour.value, text=text.value, font=f.python_class.as_font(),
                 compound=compound.value, anchor=anchor.value, command=lambda: on_click(vm, []),
                 hover_color=hover_fg.value
-            ), *vm.loose_pos
+            )
         )
     
     @call_decorator({
@@ -99,9 +95,7 @@ class ui:
         'fg': {'type': 'string', 'default': (String, '#262626')},
         'text_colour': {'type': 'string', 'default': (String, '#ffffff')},
         'text': {'type': 'string', 'default': (String, '')},
-        'font': {'type': 'Font', 'default': lambda ln, col: Class.from_py_cls(Font(
-            'Arial', 10
-        ), ln, col)},
+        'font': {'type': 'Font', 'default': lambda: Class.from_py_cls(Font('Arial', 10))},
         'compound': {'type': 'string', 'default': (String, 'center')},
         'anchor': {'type': 'string', 'default': (String, 'center')}
     })
@@ -126,5 +120,5 @@ class ui:
                 corner_radius=corner_radius.value, bg_color=bg.value, fg_color=fg.value,
                 text_color=text_colour.value, text=text.value, font=f.python_class.as_font(),
                 compound=compound.value, anchor=anchor.value
-            ), *vm.loose_pos
+            )
         )
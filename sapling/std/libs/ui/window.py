@@ -33,19 +33,19 @@ class Window:
             relwidth=relwidth.value, relheight=relheight.value
         )
         
-        return Nil(*vm.loose_pos)
+        return Nil()
 
     @call_decorator({'new': {'type': 'string'}}, req_vm=False)
     def _set_title(self, new: String) -> Nil:
         self.w.title(new.value)
-        return Nil(new.line, new.column)
+        return Nil()
     
     @call_decorator({'new_width': {'type': 'int'}, 'new_height': {'type': 'int'}}, req_vm=False)
     def _set_size(self, new_width: Int, new_height: Int) -> Nil:
         self.w.geometry(f'{new_width.value}x{new_height.value}')
-        return Nil(new_width.line, new_width.column)
+        return Nil()
 
     @call_decorator()
     def _run(self, vm) -> Nil:
         self.w.mainloop()
-        return Nil(*vm.loose_pos)
+        return Nil()
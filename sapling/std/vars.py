@@ -4,12 +4,12 @@
 
 
 variables = {
-    # 'REFLAG_IGNORECASE': Int(-1, -1, IGNORECASE),
-    # 'REFLAG_DOTALL': Int(-1, -1, DOTALL),
-    # 'REFLAG_MULTILINE': Int(-1, -1, MULTILINE),
-    # 'REFLAG_VERBOSE': Int(-1, -1, VERBOSE),
-    # 'REFLAG_I': Int(-1, -1, I),
-    # 'REFLAG_UNICODE': Int(-1, -1, UNICODE),
-    # 'REFLAG_M': Int(-1, -1, M),
-    # 'REFLAG_S': Int(-1, -1, S),
+    # 'REFLAG_IGNORECASE': Int(IGNORECASE),
+    # 'REFLAG_DOTALL': Int(DOTALL),
+    # 'REFLAG_MULTILINE': Int(MULTILINE),
+    # 'REFLAG_VERBOSE': Int(VERBOSE),
+    # 'REFLAG_I': Int(I),
+    # 'REFLAG_UNICODE': Int(UNICODE),
+    # 'REFLAG_M': Int(M),
+    # 'REFLAG_S': Int(S),
 }
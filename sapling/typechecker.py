@@ -0,0 +1,255 @@
+"""
+typechecker.py
+--------------
+
+Checks the type annotations of a file before it is run. The types of expressions are inferred
+where the code makes them certain: literals, operators applied to operands of known types and
+names bound in a single place, which can only hold the value bound there. An annotation that an
+expression is certain to violate is reported as an error. An annotated assignment whose value is
+certain to have the annotated type has its check dropped, so it runs like an assignment without
+an annotation and compiled code can keep the variable in a slot.
+
+"""
+
+import sapling.codes as codes
+from sapling.error import STypeError
+from sapling.optimizer import count_bindings
+from sapling.resolver import builtins
+
+
+literal_types = {
+    codes.Int: 'int',
+    codes.Float: 'float',
+    codes.String: 'string',
+    codes.Bool: 'bool',
+    codes.Nil: 'nil',
+    codes.Hex: 'hex',
+    codes.Regex: 'regex',
+    codes.Array: 'array',
+    codes.Dictionary: 'dictionary',
+    codes.ArrayComp: 'array',
+}
+
+comparisons = {'==', '!=', '>', '<', '>=', '<='}
+
+# The types operators give for operands of types other than two numbers, see operator_type
+operator_types = {
+    ('+', 'string', 'string'): 'string',
+    ('-', 'string', 'int'): 'string',
+    ('*', 'string', 'int'): 'string',
+    ('-', 'int', 'string'): 'string',
+
+    ('+', 'array', 'array'): 'array',
+    ('-', 'array', 'int'): 'array',
+    ('*', 'array', 'int'): 'array',
+    ('-', 'int', 'array'): 'array',
+    ('==', 'array', 'array'): 'bool',
+    ('!=', 'array', 'array'): 'bool',
+
+    ('==', 'bool', 'bool'): 'bool',
+    ('!=', 'bool', 'bool'): 'bool',
+    ('AND', 'bool', 'bool'): 'bool',
+    ('OR', 'bool', 'bool'): 'bool',
+} | {(op, 'string', 'string'): 'bool' for op in comparisons}
+
+
+def operator_type(op: str, left: str | None, right: str | None) -> str | None:
+    """Gets the type an operator gives for operands of the given types
+
+    Args:
+        op (str): The operator
+        left (str | None): The type of the left operand, None if it isn't known
+        right (str | None): The type of the right operand, None if it isn't known
+
+    Returns:
+        str | None: The type, None if it isn't certain
+    """
+
+    if left in {'int', 'float'} and right in {'int', 'float'}:
+        if op in comparisons:
+            return 'bool'
+        elif op == '/':
+            return 'float'
+        elif op in {'+', '-', '*', '%'}:
+            return 'float' if 'float' in {left, right} else 'int'
+
+        return None
+
+    return operator_types.get((op, left, right))
+
+
+# The nodes whose bodies run in a scope of their own
+functions = (codes.FuncDef, codes.AttrFuncDef, codes.FuncExpr)
+
+
+def find_binders(node, counts: dict[str, int], binders: dict, scope: tuple = ()) -> dict:
+    """Maps each name bound in a single place to the node binding it and the scope it's bound
+    in, the functions the node is in"""
+
+    name = None
+    match node:
+        case codes.Assign() | codes.Param() | codes.Struct() | codes.Enum():
+            name = node.name
+        case codes.FuncDef():
+            name = node.name.value
+
+    if name is not None and counts.get(name) == 1:
+        binders[name] = node, scope
+
+    if isinstance(node, functions):
+        scope += (id(node),)
+
+    if isinstance(node, (tuple, list)):
+        for item in node:
+            find_binders(item, counts, binders, scope)
+    elif isinstance(node, dict):
+        for key, value in node.items():
+            find_binders(key, counts, binders, scope)
+            find_binders(value, counts, binders, scope)
+
+    return binders
+
+
+class TypeChecker:
+    """Checks the annotations of the statements of a file"""
+
+    def __init__(self, stmts):
+        self.binders = find_binders(stmts, count_bindings(stmts, {}), {})
+
+        # The functions the node being checked is in
+        self.scope = ()
+
+        # The types of the names already inferred, None where it isn't certain
+        self.types = {}
+        self.inferring = set()
+
+    def binder(self, name: str):
+        """Gets the node binding a name bound in a single place, if a read of the name in the
+        current scope reads it. A name bound in a function isn't the same name outside of it."""
+
+        node, scope = self.binders.get(name, (None, ()))
+        if node is None or self.scope[:len(scope)] != scope:
+            return None
+
+        return node
+
+    def type_of(self, name: str) -> str | None:
+        """Gets the type of the value a name holds, None if it isn't certain"""
+
+        # A builtin (or the class of a method) can be read before the name is bound over it
+        node = self.binder(name)
+        if node is None or name in builtins or name == 'self' or name in self.inferring:
+            return None
+
+        if name in self.types:
+            return self.types[name]
+
+        # The value of the binder is inferred in the scope it's bound in
+        outer, self.scope = self.scope, self.binders[name][1]
+        self.inferring.add(name)
+        match node:
+            case codes.Assign(operation='') if node.type != 'any':
+                name_type = node.type
+            case codes.Assign(operation=''):
+                name_type = self.infer(node.value)
+            case codes.Param(default=None) if node.annotation != 'any':
+                # A default isn't checked against the annotation
+                name_type = node.annotation
+            case codes.FuncDef():
+                name_type = 'func'
+            case _:
+                name_type = None
+
+        self.inferring.discard(name)
+        self.scope = outer
+        self.types[name] = name_type
+        return name_type
+
+    def infer(self, expr) -> str | None:
+        """Infers the type of the value of an expression, None if it isn't certain"""
+
+        match expr:
+            case codes.Id(value=name):
+                return self.type_of(name)
+            case codes.BinaryOp():
+                return operator_type(expr.op, self.infer(expr.left), self.infer(expr.right))
+
+        return literal_types.get(type(expr))
+
+    def check_call(self, call: codes.Call) -> None:
+        """Checks the arguments of a call of a function defined in the file against the
+        annotations of its parameters"""
+
+        func = self.binder(call.func.value)
+        if not isinstance(func, codes.FuncDef) or call.func.value in builtins or not call.args:
+            return
+
+        params = func.params.params if func.params else []
+        for arg, param in zip(call.args.args, params):
+            if arg.name is not None:
+                return
+
+            arg_type = self.infer(arg.value)
+            if param.annotation != 'any' and arg_type is not None and arg_type != param.annotation:
+                raise STypeError(
+                    f'Expected \'{param.annotation}\' but got \'{arg_type}\'',
+                    [call.line, call.column]
+                )
+
+    def check(self, node):
+        """Checks the annotations in a node
+
+        Args:
+            node: The node
+
+        Returns:
+            The node, with the checks of the annotated assignments that are certain to pass
+            dropped
+        """
+
+        match node:
+            case codes.FuncDef() | codes.AttrFuncDef() | codes.FuncExpr():
+                outer, self.scope = self.scope, self.scope + (id(node),)
+                node = node._make(self.check(item) for item in node)
+                self.scope = outer
+                return node
+            case codes.Assign(operation='') if node.type != 'any':
+                node = node._replace(value=self.check(node.value))
+                value_type = self.infer(node.value)
+                if value_type is None:
+                    return node
+
+                if value_type != node.type:
+                    raise STypeError(
+                        f'Assignment does not match annotated type \'{node.type}\'',
+                        [node.line, node.column]
+                    )
+
+                return node._replace(type='any')
+            case codes.Call(func=codes.Id()):
+                self.check_call(node)
+                return node._make(self.check(item) for item in node)
+            case tuple() if hasattr(node, '_fields'):
+                return node._make(self.check(item) for item in node)
+            case list() | tuple():
+                return type(node)(self.check(item) for item in node)
+            case dict():
+                return {self.check(key): self.check(value) for key, value in node.items()}
+            case _:
+                return node
+
+
+def check_types(code: codes.Code) -> codes.Code:
+    """Checks the type annotations of the parsed code of a file
+
+    Args:
+        code (codes.Code): The parsed code
+
+    Raises:
+        STypeError: If an annotation is certain to be violated
+
+    Returns:
+        codes.Code: The code, without the checks that are certain to pass
+    """
+
+    return code._replace(stmts=TypeChecker(code.stmts).check(code.stmts))
@@ -5,52 +5,74 @@ vm.py
 The main VM class for executing Sapling bytecode
 """
 
-from operator import add, sub, mul, truediv, mod, eq, ne, gt, lt, ge, le, and_, or_
 from sys import exit as sys_exit
 from contextlib import suppress
 from collections import deque
-from typing import NoReturn
+from typing import Callable, NoReturn
 from types import NoneType
 from pickle import loads
 from pathlib import Path
+from copy import copy
 
 import sapling.codes as codes
 from sapling.error import (
     STypeError, SRuntimeError, SImportError, SNameError, SError, SIndexError
 )
 from sapling.std import public_funcs, public_classes, public_libs, variables
-from sapling.vmutils import Caller, get_bytecode, operator_error
+from sapling.vmutils import Caller, Frame, Returned, operator_error, type_check
+from sapling.compiler import CodeObject, QUICKEN_AFTER, compile_code, compile_function
+from sapling.typechecker import check_types
+from sapling.cache import get_code
+from sapling.optimizer import temporary_name
+from sapling.closure_compiler import ClosureBody
+import sapling.closure_compiler as closure_compiler
+from sapling.py_compiler import PythonCode
+import sapling.py_compiler as py_compiler
 from sapling.objects import *
+from sapling.opcodes import *
 
 
 class VM:
     """The Virtual Machine for interpreting Sapling bytecode"""
 
-    operators: dict[str: Callable] = {
-        '+': add,
-        '-': sub,
-        '*': mul,
-        '/': truediv,
-        '%': mod,
-        '==': eq,
-        '!=': ne,
-        '>': gt,
-        '<': lt,
-        '>=': ge,
-        '<=': le,
-        'AND': and_,
-        'OR': or_
+    # Maps the name of an engine to its functions for compiling a file and a function body
+    engines = {
+        'tree': (lambda code: code, lambda _, body: body),
+        'bytecode': (compile_code, compile_function),
+        'closure': (closure_compiler.compile_code, closure_compiler.compile_function),
+        'python': (py_compiler.compile_code, py_compiler.compile_function),
     }
 
     call_stack: deque[Caller] = deque([])
-    loose_pos: list[int, int] = []
 
-    def __init__(self, src: str | None, parent_env: dict = None):
+    def __init__(self, src: str | None, parent_env: dict = None, engine: str = 'bytecode',
+                 cache: bool = True, inline: bool = True):
         self.env = public_funcs | public_classes | variables
         if parent_env is not None:
             self.env |= parent_env
 
+        # The env holds the variables of the running frame, which are the globals at the top level
+        self.globals = self.env
+        self.frame: Frame | None = None
+
         self.src = src
+        self.engine = engine
+        # Whether imported files are loaded from and stored in the cache, see sapling.cache, and
+        # whether calls of small functions are inlined in them
+        self.cache = cache
+        self.inline = inline
+
+    def fork(self) -> 'VM':
+        """Makes a VM sharing the globals of this one with its own running frame, for running
+        functions on another thread without replacing the frames of this one
+
+        Returns:
+            VM: The new VM, running at the top level
+        """
+
+        vm = copy(self)
+        vm.frame, vm.env = None, self.globals
+        return vm
 
     def import_names(self, attrs: dict, names: list) -> None:
         """Function for the import_module function. Imports all the names into the env."""
@@ -71,37 +93,36 @@ class VM:
 
         s = name[1:-1]
         if Path(f'{s}.sap').exists():
-            src = Path(f'{s}.sap').read_text()
-            s = Path(f'{s}.sap').stem.replace('-', '_')
-            bc = get_bytecode(src)
+            fp = Path(f'{s}.sap')
+            src = fp.read_text()
+            s = fp.stem.replace('-', '_')
+            bc = get_code(fp, src, self.inline, self.cache)
 
-            file_vm = VM(src, self.env)
+            file_vm = VM(src, self.env, self.engine, self.cache, self.inline)
             file_vm.run(bc)
 
-            attrs = {f'_{k}': v.value if isinstance(v, Var) else v for k, v in file_vm.env.items()}
+            attrs = {
+                f'_{k}': v.value if isinstance(v, Var) else v for k, v in file_vm.env.items()
+                if not temporary_name.fullmatch(k)
+            }
             if from_:
                 self.import_names(attrs, name)
             else:
-                self.env[s] = Lib(
-                    *self.loose_pos,
-                    s,
-                    attrs
-                )
+                self.env[s] = Lib(s, attrs)
 
             return
         elif Path(f'{s}.sapped').exists():
-            file_vm = VM(None, self.env)
+            file_vm = VM(None, self.env, self.engine, self.cache, self.inline)
             file_vm.run(loads(Path(f'{s}.sapped').read_bytes()))
 
-            attrs = {f'_{k}': v.value if isinstance(v, Var) else v for k, v in file_vm.env.items()}
+            attrs = {
+                f'_{k}': v.value if isinstance(v, Var) else v for k, v in file_vm.env.items()
+                if not temporary_name.fullmatch(k)
+            }
             if from_:
                 self.import_names(attrs, name)
             else:
-                self.env[s] = Lib(
-                    *self.loose_pos,
-                    s,
-                    attrs
-                )
+                self.env[s] = Lib(s, attrs)
 
             return
 
@@ -113,12 +134,59 @@ class VM:
             if from_:
                 self.import_names(lib.__dict__, name)
             else:
-                self.env[s] = Lib.from_py(lib, *self.loose_pos)
+                self.env[s] = Lib.from_py(lib)
         else:
-            self.error(SImportError(s, self.loose_pos))
+            self.error(SImportError(s))
+
+    def scope_of(self, name: str) -> dict | None:
+        """Finds the variables the name is bound in, looking through the running frame, the
+        frames it was defined in and then the globals
+
+        Args:
+            name (str): The name
+
+        Returns:
+            dict | None: The variables, None if the name isn't bound
+        """
+
+        if name in self.env:
+            return self.env
+
+        frame = self.frame
+        while frame is not None:
+            frame = frame.parent
+            variables = self.globals if frame is None else frame.locals
+            if name in variables:
+                return variables
+
+    def lookup(self, name: str):
+        """Gets the value bound to the name, None if it isn't bound"""
+
+        variables = self.scope_of(name)
+        return variables[name] if variables is not None else None
+
+    def execute_frame(self, frame: Frame, body):
+        """Runs the body of a function in its frame, then goes back to the running frame
+
+        Args:
+            frame (Frame): The frame of the call, holding the arguments
+            body: The body of the function
+
+        Returns: The returned value, None if the body didn't return
+        """
+
+        previous = self.frame, self.env
+        self.frame, self.env = frame, frame.locals
+        try:
+            return self.execute(body)
+        except Returned as returned:
+            return returned.value
+        finally:
+            self.frame, self.env = previous
 
     def error(self, error: SError | str) -> NoReturn:
-        """Raises an error
+        """Raises an error, it's reported by the VM running the code. An error without a
+        position gets the position of the code that raised it.
 
         Args:
             error (SError | str): The error to raise, must be a subclass of SError or a string
@@ -129,15 +197,24 @@ class VM:
         #     print(f' - {call.name.name}')
 
         if issubclass(type(error), SError):
-            if self.src is not None:
-                with suppress(IndexError):
-                    print(self.src.splitlines()[error.pos[0] - 1])
-                    print(' ' * (error.pos[1] - 1) + '^')
+            raise error
 
-            error.report()
-        else:
-            print(error)
-            sys_exit(1)
+        print(error)
+        sys_exit(1)
+
+    def report(self, error: SError) -> NoReturn:
+        """Reports an error raised while running the code and exits
+
+        Args:
+            error (SError): The error
+        """
+
+        if self.src is not None and error.pos is not None:
+            with suppress(IndexError):
+                print(self.src.splitlines()[error.pos[0] - 1])
+                print(' ' * (error.pos[1] - 1) + '^')
+
+        error.report()
 
     def run(self, code: codes.Code):
         """Runs the given bytecode
@@ -146,29 +223,421 @@ class VM:
             code (codes.Code): The bytecode to run
         """
 
-        bytecode = code.stmts
-        has_main_function = tuple(filter(
-            lambda x: isinstance(x, codes.FuncDef) and x.name.value == 'main', bytecode
-        ))
-        
-        if has_main_function:
-            f = has_main_function[0]
-            self.loose_pos = [f.line, f.column]
-            self.execute_func(f)
-            self.execute_call(codes.Call(f.line, f.column, f.name, codes.Args(
-                *self.loose_pos,
-                []
-            )))
-        
-        for instruction in bytecode:
-            self.loose_pos = [instruction.line, instruction.column]
-            self.execute(instruction)
+        compile_file, compile_func = self.engines[self.engine]
+
+        try:
+            code = check_types(code)
+
+            bytecode = code.stmts
+            has_main_function = tuple(filter(
+                lambda x: isinstance(x, codes.FuncDef) and x.name.value == 'main', bytecode
+            ))
+
+            if has_main_function:
+                f = has_main_function[0]
+                self.execute_func(f._replace(body=compile_func('main', f.body)))
+                self.execute_call(codes.Call(f.line, f.column, f.name, codes.Args(
+                    f.line, f.column, []
+                )))
+
+            self.execute(compile_file(code))
+        except SError as error:
+            self.report(error)
+
+    def execute_code(self, instruction: codes.Code):
+        # A return outside of a function ends the module
+        try:
+            for stmt in instruction.stmts:
+                self.execute(stmt)
+        except Returned as returned:
+            return returned.value
+
+    def execute_code_object(self, code: CodeObject):
+        """Runs compiled bytecode in a single dispatch loop, without recursing per node
+
+        Args:
+            code (CodeObject): The compiled bytecode
+
+        Returns: The returned value, None if the code didn't return
+        """
+
+        instructions = code.instructions
+        positions = code.positions
+        consts = code.consts
+        names = code.names
+        varnames = code.varnames
+        caches = code.caches
+        env = self.env
+        globals_ = self.globals
+
+        # The arguments stored in slots are moved out of the locals of the frame, raw like the
+        # values the code stores in them
+        if varnames:
+            fast = self.frame.fast = [unbox(env.pop(name, None)) for name in varnames]
+
+        # The stack and the slots hold raw values, they are boxed when they leave the code object.
+        # Names hold objects, which are unboxed when they are loaded so instructions can be
+        # specialised for the raw values.
+        stack = []
+        push = stack.append
+        pop = stack.pop
+
+        pc = 0
+        end = len(instructions)
+        try:
+            while pc < end:
+                op, arg = instructions[pc]
+                pc += 1
+
+                if op == LOAD_FAST:
+                    value = fast[arg]
+                    if value is None:
+                        # Not assigned yet, so the name may still be bound in an enclosing scope
+                        value = self.lookup(varnames[arg])
+                        if value is None:
+                            self.error(SNameError(varnames[arg]))
+
+                        value = value.value if value.__class__ is Var else value
+
+                    push(value)
+                elif op == LOAD_NAME:
+                    value = env.get(names[arg])
+                    if value is None:
+                        value = self.lookup(names[arg])
+                        if value is None:
+                            self.error(SNameError(names[arg]))
+
+                    value = value.value if value.__class__ is Var else value
+                    push(value.value if value.__class__ in unboxed else value)
+                elif op == LOAD_CONST:
+                    push(consts[arg])
+                elif op == BINARY_ADD_INT:
+                    right = stack[-1]
+                    left = stack[-2]
+                    if left.__class__ is int and right.__class__ is int:
+                        del stack[-1]
+                        stack[-1] = left + right
+                    else:
+                        pc -= 1
+                        self.deoptimise(code, pc)
+                elif op == BINARY_SUB_INT:
+                    right = stack[-1]
+                    left = stack[-2]
+                    if left.__class__ is int and right.__class__ is int:
+                        del stack[-1]
+                        stack[-1] = left - right
+                    else:
+                        pc -= 1
+                        self.deoptimise(code, pc)
+                elif op == BINARY_OP_INT:
+                    right = stack[-1]
+                    left = stack[-2]
+                    if left.__class__ is int and right.__class__ is int:
+                        del stack[-1]
+                        stack[-1] = caches[pc - 1][3](left, right)
+                    else:
+                        pc -= 1
+                        self.deoptimise(code, pc)
+                elif op == BINARY_OP_FLOAT:
+                    right = stack[-1]
+                    left = stack[-2]
+                    if left.__class__ is float and right.__class__ is float:
+                        del stack[-1]
+                        stack[-1] = caches[pc - 1][3](left, right)
+                    else:
+                        pc -= 1
+                        self.deoptimise(code, pc)
+                elif op == BINARY_OP:
+                    right = pop()
+                    left = pop()
+
+                    # The operator is only resolved again when the classes of the operands change
+                    cache = caches[pc - 1]
+                    if left.__class__ is not cache[1] or right.__class__ is not cache[2]:
+                        cache[1:] = left.__class__, right.__class__, resolve_operator(
+                            binary_operators[arg], left.__class__, right.__class__
+                        )
+
+                    try:
+                        out = cache[3](left, right)
+                    except TypeError:
+                        out = None
+                    except ZeroDivisionError:
+                        self.error(STypeError('Cannot divide by zero'))
+
+                    if out is None:
+                        operator_error(self, left, binary_operators[arg], right)
+
+                    push(out)
+
+                    cache[0] -= 1
+                    if not cache[0]:
+                        self.specialise(code, pc - 1, left, right)
+                elif op == STORE_FAST:
+                    fast[arg] = pop()
+                elif op == STORE_NAME:
+                    self.assign(consts[arg], box(pop()))
+                elif op == POP_JUMP_IF_FALSE:
+                    value = pop()
+                    if value is False or value is not True and not truthy(value):
+                        pc = arg
+                elif op == JUMP:
+                    pc = arg
+                elif op == FOR_ITER:
+                    value = next(stack[-1], None)
+                    if value is None:
+                        del stack[-1]
+                        pc = arg
+                    else:
+                        push(value.value if value.__class__ in unboxed else value)
+                elif op == POP_TOP:
+                    pop()
+                elif op == CALL_FUNC:
+                    # The arguments are bound to the parameters by position. The annotations of
+                    # the parameters are checked by the guards on the classes of the arguments.
+                    cache = caches[pc - 1]
+                    start = len(stack) - len(cache[2])
+                    func = stack[start - 1]
+                    guards = cache[3]
+                    if func.__class__ is Func and func.body is cache[1] and (not guards or all(
+                        stack[start + i].__class__ is cls for i, cls in guards
+                    )):
+                        frame = Frame(dict(zip(cache[2], map(box, stack[start:]))), func.frame)
+                        del stack[start - 1:]
+
+                        self.call_stack.appendleft(Caller(func))
+                        if instructions[pc][0] != RETURN_VALUE or self.frame is None:
+                            out = self.execute_frame(frame, func.body)
+                            push(out if out is not None else NIL)
+                            continue
+
+                        # A call the function returns runs in this loop, in place of the
+                        # function's own frame, as nothing of it is used after the call.
+                        # execute_frame puts the frame of the caller back once it returns.
+                        code = func.body
+                        instructions = code.instructions
+                        positions = code.positions
+                        consts = code.consts
+                        names = code.names
+                        varnames = code.varnames
+                        caches = code.caches
+                        self.frame, self.env = frame, frame.locals
+                        env = self.env
+                        if varnames:
+                            fast = frame.fast = [unbox(env.pop(name, None)) for name in varnames]
+
+                        stack.clear()
+                        pc = 0
+                        end = len(instructions)
+                    else:
+                        pc -= 1
+                        self.deoptimise(code, pc)
+                elif op == CALL:
+                    arg_names = consts[arg]
+                    if arg_names:
+                        args = [Arg(box(value), name) for value, name in zip(
+                            stack[-len(arg_names):], arg_names
+                        )]
+                        del stack[-len(arg_names):]
+                    else:
+                        args = []
+
+                    func = box(pop())
+
+                    # Counted before the call, so the calls a recursive one makes can already
+                    # run specialised
+                    cache = caches[pc - 1]
+                    cache[0] -= 1
+                    if not cache[0]:
+                        self.specialise(code, pc - 1, func, args)
+
+                    push(self.call(func, args))
+                elif op == LOAD_GLOBAL:
+                    value = globals_.get(names[arg])
+                    if value is None:
+                        value = self.lookup(names[arg])
+                        if value is None:
+                            self.error(SNameError(names[arg]))
+
+                    value = value.value if value.__class__ is Var else value
+                    push(value.value if value.__class__ in unboxed else value)
+                elif op == LOAD_ATTR_CLASS:
+                    base = stack[-1]
+                    cache = caches[pc - 1]
+                    if (base.__class__ is Class or base.__class__ is Lib) and \
+                            base.version == cache[1]:
+                        stack[-1] = cache[2]
+                    else:
+                        pc -= 1
+                        self.deoptimise(code, pc)
+                elif op == LOAD_ATTR_BUILTIN:
+                    base = stack[-1]
+                    cache = caches[pc - 1]
+                    if base.__class__ is cache[1]:
+                        stack[-1] = cache[2](base)
+                    else:
+                        pc -= 1
+                        self.deoptimise(code, pc)
+                elif op == LOAD_ATTR:
+                    base = pop()
+                    value = self.get_attribute(box(base), names[arg], False)
+                    push(value)
+
+                    cache = caches[pc - 1]
+                    cache[0] -= 1
+                    if not cache[0]:
+                        self.specialise(code, pc - 1, base, value)
+                elif op == INDEX_ARRAY_INT:
+                    item = stack[-1]
+                    base = stack[-2]
+                    if base.__class__ is Array and item.__class__ is int:
+                        del stack[-1]
+                        try:
+                            stack[-1] = base.value[item]
+                        except IndexError:
+                            self.error(SIndexError(f'Index out of range \'{item}\''))
+                    else:
+                        pc -= 1
+                        self.deoptimise(code, pc)
+                elif op == INDEX:
+                    item = pop()
+                    base = pop()
+                    push(self.index(box(base), box(item)))
+
+                    cache = caches[pc - 1]
+                    cache[0] -= 1
+                    if not cache[0]:
+                        self.specialise(code, pc - 1, base, item)
+                elif op == POP_JUMP_IF_TRUE:
+                    value = pop()
+                    if value is True or value is not False and truthy(value):
+                        pc = arg
+                elif op == BINARY_ADD_STRING:
+                    right = stack[-1]
+                    left = stack[-2]
+                    if left.__class__ is str and right.__class__ is str:
+                        del stack[-1]
+                        stack[-1] = left + right
+                    else:
+                        pc -= 1
+                        self.deoptimise(code, pc)
+                elif op == RETURN_VALUE:
+                    return box(pop())
+                elif op == BUILD_ARRAY:
+                    if arg:
+                        values = stack[-arg:]
+                        del stack[-arg:]
+                    else:
+                        values = []
+
+                    push(Array(map(box, values)))
+                elif op == BUILD_DICT:
+                    items = stack[-2 * arg:] if arg else []
+                    if arg:
+                        del stack[-2 * arg:]
+
+                    push(Dictionary(dict(zip(map(box, items[::2]), map(box, items[1::2])))))
+                elif op == EXEC_NODE:
+                    self.execute(consts[arg])
+                elif op == EVAL_NODE:
+                    push(self.execute(consts[arg]))
+                elif op == LOAD_ATTR_NULL_SAFE:
+                    push(self.get_attribute(box(pop()), names[arg], True))
+                elif op == GET_ITER:
+                    stack[-1] = iter(iterate(self, stack[-1]))
+        except SError as error:
+            # The position of an error is only looked up from the line table when one is raised
+            if error.pos is None:
+                error.pos = positions[pc - 1]
+
+            raise
+
+    def specialise(self, code: CodeObject, index: int, *operands) -> None:
+        """Rewrites a generic instruction into the specialised instruction for the kind of
+        operands it was just run with. If there isn't one it tries again after a while.
+
+        Args:
+            code (CodeObject): The code the instruction is in
+            index (int): The index of the instruction
+            *operands: The operands the instruction was run with
+        """
+
+        op, arg = code.instructions[index]
+        cache = code.caches[index]
+        specialised = None
+
+        if op == BINARY_OP:
+            left, right = operands
+            operator = binary_operators[arg]
+            if left.__class__ is int and right.__class__ is int and operator in numeric_operators:
+                specialised = {'+': BINARY_ADD_INT, '-': BINARY_SUB_INT}.get(
+                    operator, BINARY_OP_INT
+                )
+            elif left.__class__ is float and right.__class__ is float and \
+                    operator in numeric_operators:
+                specialised = BINARY_OP_FLOAT
+            elif left.__class__ is str and right.__class__ is str and operator == '+':
+                specialised = BINARY_ADD_STRING
+        elif op == INDEX:
+            base, item = operands
+            if base.__class__ is Array and item.__class__ is int:
+                specialised = INDEX_ARRAY_INT
+        elif op == LOAD_ATTR:
+            base, value = operands
+            if base.__class__ is Class or base.__class__ is Lib:
+                cache[1:] = base.version, value
+                specialised = LOAD_ATTR_CLASS
+            elif (bind := attribute_binder(base.__class__, code.names[arg])) is not None:
+                cache[1:] = base.__class__, bind
+                specialised = LOAD_ATTR_BUILTIN
+        elif op == CALL:
+            func, args = operands
+            if func.__class__ is Func and func.body.__class__ is CodeObject \
+                    and all(arg.name is None for arg in args) and len(args) == len(func.params):
+                # An annotated parameter is guarded on the class of the argument it was given,
+                # if that's a raw value of the annotated type
+                guards = []
+                for i, (param, given) in enumerate(zip(func.params, args)):
+                    check = type_check(param)
+                    if check is None:
+                        continue
+
+                    cls = unbox(given.value).__class__
+                    if raw_types.get(cls) not in check[0]:
+                        guards = None
+                        break
+
+                    guards.append((i, cls))
+
+                if guards is not None:
+                    names = tuple(param.name for param in func.params)
+                    cache[1:] = func.body, names, tuple(guards)
+                    specialised = CALL_FUNC
+
+        if specialised is not None:
+            code.instructions[index] = specialised, arg
+        else:
+            cache[0] = QUICKEN_AFTER
+
+    def deoptimise(self, code: CodeObject, index: int) -> None:
+        """Turns a specialised instruction whose operands didn't match back into the generic one
+
+        Args:
+            code (CodeObject): The code the instruction is in
+            index (int): The index of the instruction
+        """
+
+        op, arg = code.instructions[index]
+        code.instructions[index] = generic_ops[op], arg
+        code.caches[index][0] = QUICKEN_AFTER
+
+    execute_closure_body = lambda self, instruction: instruction(self)
+    execute_python_code = lambda self, instruction: instruction(self)
 
     def execute_body(self, instruction: codes.Body):
+        # A return ends the function the body is in, see execute_return
         for stmt in instruction.stmts:
-            out = self.execute(stmt)
-            if isinstance(stmt, codes.Return):
-                return out
+            self.execute(stmt)
 
     execute_args = lambda self, instruction: [self.execute_arg(arg) for arg in instruction.args]
     execute_arg = lambda self, instruction: Arg(self.execute(instruction.value), instruction.name)
@@ -180,33 +649,19 @@ class VM:
         self.execute(instruction.default)
     )
     
-    execute_nil = lambda _, instruction: Nil(instruction.line, instruction.column)
-    execute_bool = lambda _, instruction: Bool(
-        instruction.line, instruction.column, instruction.value
-    )
-    execute_string = lambda _, instruction: String(
-        instruction.line, instruction.column, instruction.value
-    )
-    execute_regex = lambda _, instruction: Regex(
-        instruction.line, instruction.column, re_compile(instruction.value)
-    )
-    execute_hex = lambda _, instruction: Hex(
-        instruction.line, instruction.column, instruction.value
-    )
-    execute_int = lambda _, instruction: Int(
-        instruction.line, instruction.column, instruction.value
-    )
-    execute_float = lambda _, instruction: Float(
-        instruction.line, instruction.column, instruction.value
-    )
+    execute_nil = lambda _, instruction: NIL
+    execute_bool = lambda _, instruction: to_bool(instruction.value)
+    execute_string = lambda _, instruction: String(instruction.value)
+    execute_regex = lambda _, instruction: Regex(re_compile(instruction.value))
+    execute_hex = lambda _, instruction: Hex(instruction.value)
+    execute_int = lambda _, instruction: Int(instruction.value)
+    execute_float = lambda _, instruction: Float(instruction.value)
     execute_array = lambda self, instruction: Array(
-        instruction.line, instruction.column,
         [self.execute(value).value for value in instruction.value]
     )
     
     def execute_dictionary(self, instruction: codes.Dictionary):
         return Dictionary(
-            instruction.line, instruction.column,
             {self.execute(key): self.execute(value)
             for key, value in instruction.value.items()}
         )
@@ -216,92 +671,83 @@ class VM:
         expr = instruction.expr
         
         if arr.type != 'array':
-            return self.error(STypeError('Expected \'array\' for array comprehension',
-                [arr.line, arr.column]
-            ))
+            return self.error(STypeError('Expected \'array\' for array comprehension'))
 
-        f = Func(instruction.line, instruction.column, '_arrcomp',
-            [Param(instruction.ident)], codes.Body(expr.line, expr.column, [
-                codes.Return(expr.line, expr.column, expr)
-            ])
-        )
+        f = Func('_arrcomp', [Param(instruction.ident)], codes.Body(expr.line, expr.column, [
+            codes.Return(expr.line, expr.column, expr)
+        ]), frame=self.frame)
 
         return Array.from_py_iter(map(
             lambda val: f(self, [Arg(val)]), arr.value
-        ), arr.line, arr.column)
+        ))
 
     def execute_call(self, instruction: codes.Call):
         func = self.execute(instruction.func)
+        return self.call(func, self.execute_args(instruction.args) if instruction.args else [])
+
+    def call(self, func, args: list):
         if not callable(func):
-            return self.error(STypeError(f'\'{func.type}\' is not callable',
-                                         [func.line, func.column]))
-        
-        args = self.execute_args(instruction.args) if instruction.args else []
+            return self.error(STypeError(f'\'{func.type}\' is not callable'))
+
         self.call_stack.appendleft(Caller(func))
 
         return func(self, args)
 
     def execute_id(self, instruction: codes.Id):
-        if self.env.get(instruction.value) is not None:
-            v = self.env[instruction.value]
-            if isinstance(self.env[instruction.value], Var):
-                v = v.value
-            
-            with suppress(AttributeError):
-                self.env[instruction.value].line = instruction.line
-                self.env[instruction.value].column = instruction.column
-            
-            return v
-
-        self.error(SNameError(instruction.value, [instruction.line, instruction.column]))
-
-    def execute_assign(self, instruction: codes.Assign):
-        value = self.execute(instruction.value)
+        v = self.lookup(instruction.value)
+        if v is None:
+            self.error(SNameError(instruction.value, [instruction.line, instruction.column]))
+
+        return v.value if isinstance(v, Var) else v
+
+    execute_assign = lambda self, instruction: self.assign(
+        instruction, self.execute(instruction.value)
+    )
+
+    def assign(self, instruction: codes.Assign, value):
+        """Assigns the value to the name of the assignment
+
+        Args:
+            instruction (codes.Assign): The assignment (its value is already evaluated)
+            value (Node): The value to assign
+        """
+
         name = instruction.name
+        current = self.lookup(name)
+
+        if isinstance(current, Var) and current.constant:
+            self.error(SRuntimeError(f'Cannot assign to constant \'{name}\'',
+                [instruction.line, instruction.column]
+            ))
 
         if instruction.operation != '':
-            if self.env.get(name) is None:
+            if current is None:
                 self.error(SNameError(name, [instruction.line, instruction.column]))
 
-            current_value = self.env[name]
-            if current_value.constant:
-                self.error(SRuntimeError(f'Cannot assign to constant \'{name}\'',
-                    [instruction.line, instruction.column]
-                ))
-
-            current_value = current_value.value
-            value = self.operators[instruction.operation](current_value, value)
-
-        if self.env.get(name) is not None:
-            v = self.env.get(name)
-            if isinstance(v, Var) and v.constant:
-                self.error(SRuntimeError(f'Cannot assign to constant \'{name}\'',
-                    [instruction.line, instruction.column]
-                ))
-            else:
-                self.env[name].value = value
+            current_value = current.value if isinstance(current, Var) else current
+            value = self.binary_op(instruction.operation, current_value, value)
 
         if instruction.type not in {value.type, 'any'}:
             self.error(STypeError(
                 f'Assignment does not match annotated type \'{instruction.type}\'',
                 [instruction.line, instruction.column]
             ))
+
+        # An existing variable is updated in the frame it's in, a new one is local
+        if isinstance(current, Var) and not instruction.constant:
+            current.value = value
+            return
         
-        self.env[name] = Var(
-            instruction.line, instruction.column, name, value,
-            instruction.constant
-        )
+        self.env[name] = Var(name, value, instruction.constant)
 
     def execute_func(self, instruction: codes.FuncDef):
         params = self.execute_params(instruction.params) if instruction.params else []
         name = instruction.name.value
 
-        self.env[name] = Func(instruction.line, instruction.column, name, params, instruction.body)
+        self.env[name] = Func(name, params, instruction.body, frame=self.frame)
     
     def execute_enum(self, instruction: codes.Enum):
         enum = Class(
-            instruction.line,
-            instruction.column,
             instruction.name,
             {f'_{obj.name}': self.execute(obj.value) for obj in instruction.properties},
         )
@@ -311,8 +757,6 @@ class VM:
     def execute_struct(self, instruction: codes.Struct):
         ln, col = instruction.line, instruction.column
         init = Func(
-            ln,
-            col,
             '_init',
             [Param(prop.name, prop.type) for prop in instruction.fields],
             codes.Body(ln, col, tuple(
@@ -320,12 +764,11 @@ class VM:
                     prop.line, prop.column, prop.name
                 ), instruction.name)
                 for prop in instruction.fields
-            ))
+            )),
+            frame=self.frame
         )
         
         struct = Class(
-            ln,
-            col,
             instruction.name,
             {'_init': init},
             lambda _: f'Struct \'{instruction.name}\'',
@@ -339,11 +782,14 @@ class VM:
         if c is None:
             self.error(SNameError(instruction.name, [instruction.line, instruction.column]))
         
+        return self.instantiate(c, self.execute_args(instruction.args) if instruction.args else [])
+
+    def instantiate(self, c, args: list):
         if not isinstance(c, Class):
-            self.error(STypeError(f'Cannot instantiate type \'{c.type}\'', [c.line, c.column]))
+            self.error(STypeError(f'Cannot instantiate type \'{c.type}\''))
         
         if '_init' in c.objects:
-            c.objects['_init'](self, self.execute_args(instruction.args) if instruction.args else [])
+            c.objects['_init'](self, args)
         
         return c
 
@@ -356,95 +802,124 @@ class VM:
                     self.execute_body(body)
                     break
             else:
-                self.execute_body(instruction.otherwise)
+                if instruction.otherwise is not None:
+                    self.execute_body(instruction.otherwise)
         elif instruction.otherwise is not None:
             self.execute_body(instruction.otherwise)
 
     def execute_while(self, instruction: codes.While):
         while self.execute(instruction.condition):
             self.execute_body(instruction.body)
+
+    def execute_for(self, instruction: codes.For):
+        binding = codes.Assign(
+            instruction.line, instruction.column, instruction.ident, None, False, '', 'any'
+        )
+
+        for value in iterate(self, self.execute(instruction.iterable)):
+            self.assign(binding, value)
+            self.execute_body(instruction.body)
     
     execute_import = lambda self, instruction: self.import_module(instruction.name, instruction.from_)
     
-    execute_return = lambda self, instruction: self.execute(instruction.value)
+    def execute_return(self, instruction: codes.Return) -> NoReturn:
+        raise Returned(self.execute(instruction.value))
 
     def execute_repeat(self, instruction: codes.Repeat):
         while not self.execute(instruction.condition):
             self.execute_body(instruction.body)
 
-    def execute_binaryop(self, instruction: codes.BinaryOp):
-        left = self.execute(instruction.left)
-        right = self.execute(instruction.right)
+    execute_binaryop = lambda self, instruction: self.binary_op(
+        instruction.op,
+        self.execute(instruction.left),
+        self.execute(instruction.right)
+    )
 
+    def binary_op(self, op: str, left, right):
         try:
-            out = self.operators[instruction.op](left, right)
+            out = resolve_operator(op, left.__class__, right.__class__)(left, right)
         except TypeError:
-            return operator_error(self, left, instruction.op, right, [left.line, left.column])
+            return operator_error(self, left, op, right)
         except ZeroDivisionError:
-            return self.error(STypeError('Cannot divide by zero', self.loose_pos))
+            return self.error(STypeError('Cannot divide by zero'))
 
         if out is None:
-            operator_error(self, left, instruction.op, right, [left.line, left.column])
+            operator_error(self, left, op, right)
 
-        return out
+        return box(out)
 
-    def execute_attribute(self, instruction: codes.Attribute):
-        base = self.execute(instruction.base)
-        attr = instruction.attr
+    execute_attribute = lambda self, instruction: self.get_attribute(
+        self.execute(instruction.base),
+        instruction.attr,
+        instruction.null_safe
+    )
 
-        if instruction.null_safe and base.type == 'nil':
-            return Nil(base.line, base.column)
+    def get_attribute(self, base, attr: str, null_safe: bool):
+        if null_safe and base.type == 'nil':
+            return NIL
 
         try:
             return getattr(base, attr)
         except (AttributeError, KeyError):
-            self.error(SAttributeError(base.type, attr[1:], [base.line, base.column]))
+            self.error(SAttributeError(base.type, attr[1:]))
     
     def execute_setself(self, instruction: codes.SetSelf):
-        c = self.env.get(instruction.class_name)
+        c = self.lookup(instruction.class_name)
         if c is None:
             self.error(SNameError(instruction.class_name, [instruction.line, instruction.column]))
         
         if not isinstance(c, Class):
-            self.error(STypeError(f'Cannot set \'{c.type}\' as self', [c.line, c.column]))
+            self.error(STypeError(f'Cannot set \'{c.type}\' as self'))
 
-        c.objects[f'_{instruction.name}'] = self.execute(instruction.value)
+        c.set_object(f'_{instruction.name}', self.execute(instruction.value))
     
-    def execute_index(self, instruction: codes.Index):
-        expr = self.execute(instruction.expr)
-        item = self.execute(instruction.item)
-        
+    execute_index = lambda self, instruction: self.index(
+        self.execute(instruction.expr),
+        self.execute(instruction.item)
+    )
+
+    def index(self, expr, item):
         try:
             return expr[item]
         except TypeError:
-            self.error(STypeError(f'Cannot index \'{expr.type}\'', [expr.line, expr.column]))
+            self.error(STypeError(f'Cannot index \'{expr.type}\''))
         except KeyError:
-            self.error(SIndexError(f'Key not found \'{item}\'', [expr.line, expr.column]))
+            self.error(SIndexError(f'Key not found \'{item}\''))
         except IndexError:
-            self.error(SIndexError(f'Index out of range \'{item}\'', [expr.line, expr.column]))
+            self.error(SIndexError(f'Index out of range \'{item}\''))
     
-    def execute_attr_func(self, instruction: codes.AttrFuncDef):
-        c = self.env.get(instruction.obj)
+    def execute_attr_func(self, instruction: codes.AttrFuncDef, params: list | None = None,
+                          func: Callable | None = None):
+        """Sets a function defined on a class
+
+        Args:
+            instruction (codes.AttrFuncDef): The definition
+            params (list | None, optional): The parameters, given with func. Defaults to None.
+            func (Callable | None, optional): The function running the body, for code translated
+                to Python. Defaults to None, so the body is run.
+        """
+
+        c = self.lookup(instruction.obj)
         if c is None:
             self.error(SNameError(instruction.obj, [instruction.line, instruction.column]))
         
         if not isinstance(c, Class):
-            self.error(STypeError(
-                f'Cannot set function \'{c.name}\' on \'{c.type}\'',
-                [c.line, c.column]
-            ))
+            self.error(STypeError(f'Cannot set function \'{c.name}\' on \'{c.type}\''))
         
         name = instruction.name
+        if func is None:
+            params = self.execute_params(instruction.params) if instruction.params else []
+
         f = Method(
-            instruction.line,
-            instruction.column,
             name,
-            self.execute_params(instruction.params) if instruction.params else [],
-            instruction.body,
+            params,
+            instruction.body if func is None else None,
+            func,
+            frame=self.frame,
             parent_cls=c
         )
 
-        self.env[c.name].objects[f'_{f.name}'] = f
+        c.set_object(f'_{f.name}', f)
     
     no_handler = lambda _, instruction: None
 
@@ -458,7 +933,14 @@ class VM:
         """
 
         handler = self.instruction_handlers.get(type(instruction))
-        return handler(self, instruction)
+        try:
+            return handler(self, instruction)
+        except SError as error:
+            # An error is shown at the innermost node being run when it was raised
+            if error.pos is None and getattr(instruction, 'line', 0) > 0:
+                error.pos = [instruction.line, instruction.column]
+
+            raise
 
 
     instruction_handlers = {
@@ -478,6 +960,7 @@ class VM:
         codes.Array: execute_array,
         codes.Attribute: execute_attribute,
         codes.While: execute_while,
+        codes.For: execute_for,
         codes.FuncDef: execute_func,
         codes.Param: execute_param,
         codes.Params: execute_params,
@@ -494,5 +977,9 @@ class VM:
         codes.Index: execute_index,
         codes.Dictionary: execute_dictionary,
         codes.AttrFuncDef: execute_attr_func,
-        codes.Repeat: execute_repeat
+        codes.Repeat: execute_repeat,
+        codes.Code: execute_code,
+        CodeObject: execute_code_object,
+        ClosureBody: execute_closure_body,
+        PythonCode: execute_python_code
     }
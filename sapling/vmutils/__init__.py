@@ -8,7 +8,7 @@ Contains utility functions used while the VM is running
 
 from dataclasses import dataclass, field
 from collections import namedtuple
-from typing import Iterable, Any
+from typing import Callable, Iterable
 
 from sapling.error import STypeError
 from sapling.parser import parse
@@ -17,7 +17,9 @@ from sapling.lexer import lex
 
 
 def get_bytecode(src: str) -> Code:
-    return parse(lex(src))
+    from sapling.optimizer import optimize
+
+    return optimize(parse(lex(src)))
 
 
 @dataclass(unsafe_hash=True)
@@ -37,86 +39,143 @@ class Arg:
     name: str = field(default='')
 
 
+@dataclass(slots=True, eq=False)
+class Frame:
+    """Holds the local variables of a running function"""
+
+    locals: dict = field(default_factory=dict)
+    parent: 'Frame | None' = field(default=None)  # The frame the function was defined in
+    fast: list | None = field(default=None)  # The local variables stored in slots
+
+
+class Returned(Exception):
+    """Raised by a return in the body of an if or a loop, it ends the function (or the module)
+    the body is in"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        super().__init__()
+
+        self.value = value
+
+
 def invalid_cast_type(vm, t: str):
-    vm.error(STypeError(f'Invalid cast type \'{t}\'', vm.loose_pos))
+    vm.error(STypeError(f'Invalid cast type \'{t}\''))
 
-def operator_error(vm, left, op: str, right, pos: list):
+def operator_error(vm, left, op: str, right, pos: list | None = None):
+    from sapling.objects import box
+
+    left, right = box(left), box(right)
     vm.error(
         STypeError(f'Operator \'{op}\' cannot be applied to \'{left.type}\' and \'{right.type}\'',
                    pos)
     )
 
 
-def check_param_type(vm, param: Param, value: Any) -> None:
+def type_check(param: Param) -> tuple[frozenset, str] | None:
+    """Gets the types the argument of a parameter may have and how they're shown in the error,
+    None if it takes any type"""
+
     param_type = param.type
-    value_type = value.type
+    if isinstance(param_type, str):
+        return (frozenset({param_type}), param_type) if param_type != 'any' else None
+
+    if isinstance(param_type, Iterable) and 'any' not in param_type:
+        return frozenset(param_type), param_type
+
+
+def default_factory(param: Param) -> Callable | None:
+    """Gets the function making the value of a parameter left out of a call, None if it has no
+    default. A default is either (class, value), a function, or the value itself."""
+
+    default = param.default
+    if default is None:
+        return None
+
+    if isinstance(default, Iterable):
+        return lambda: default[0](default[1])
+
+    if callable(default):
+        return default
+
+    return lambda: default
 
-    if isinstance(param_type, str) and param_type != 'any' and value_type != param_type:
-        vm.error(STypeError(
-            f'Expected \'{param_type}\' but got \'{value_type}\'',
-            [value.line, value.column]
-        ))
-    elif isinstance(param_type, Iterable) and 'any' not in param_type and value_type not in param_type:
-        vm.error(STypeError(
-            f'Expected \'{param_type}\' but got \'{value_type}\'',
-            [value.line, value.column]
-        ))
+
+def param_binder(params: list[Param]) -> Callable:
+    """Works out how the arguments of a call are bound to parameters once, so a call doesn't
+    have to do it again from the parameters. Arguments are given by position or by name, more
+    positional arguments than parameters are ignored and parameters that aren't given one take
+    their defaults.
+
+    Args:
+        params (list[Param]): The parameters
+
+    Returns:
+        Callable: Binds the arguments of a call (vm, args), giving the values of the parameters
+    """
+
+    count = len(params)
+    indexes = {}
+    for i, param in enumerate(params):
+        indexes.setdefault(param.name, i)
+
+    checks = [type_check(param) for param in params]
+    defaults = [default_factory(param) for param in params]
+
+    def bind(vm, args: list[Arg]) -> list:
+        values = []
+        named = None
+        for arg, check in zip(args, checks):
+            value = arg.value
+
+            # A named argument of an unknown name is taken as a positional one
+            if arg.name is not None and arg.name in indexes:
+                check = checks[indexes[arg.name]]
+                if named is None:
+                    named = {}
+
+                named[indexes[arg.name]] = value
+            else:
+                values.append(value)
+
+            if check is not None and value.type not in check[0]:
+                vm.error(STypeError(f'Expected \'{check[1]}\' but got \'{value.type}\''))
+
+        given = len(values)
+        for i in range(given, count):
+            if named is not None and i in named:
+                values.append(named[i])
+            elif defaults[i] is not None:
+                values.append(defaults[i]())
+            else:
+                # Counted as every parameter given by name or with a default being bound
+                given += sum(named is not None and j in named or defaults[j] is not None
+                             for j in range(count))
+                vm.error(STypeError(f'Expected {count} arguments, got {given}'))
+
+        return values
+
+    return bind
 
 
 def verify_params(vm, args: list[Arg], params: list[Param]) -> list:
-    z = zip(args, params)
-    
-    kwargs = {}
-    new_args = []
-    for arg, param in z:
-        arg_value = arg.value
-        
-        if arg.name is not None and arg.name in {p.name for p in params}:
-            names = [p.name for p in params]
-            check_param_type(vm, params[names.index(arg.name)], arg_value)
-            kwargs[arg.name] = arg_value
-            continue
-        
-        check_param_type(vm, param, arg_value)
-        new_args.append(arg_value)
-
-    if len(new_args) < len(params):
-        for param in params:
-            default = param.default
-            if param.name in kwargs:
-                new_args.append(kwargs[param.name])
-                continue
-            
-            if default is not None:
-                if isinstance(default, Iterable):
-                    new_args.append(default[0](*vm.loose_pos, default[1]))
-                elif callable(default):
-                    new_args.append(default(*vm.loose_pos))
-                else:
-                    new_args.append(default)
-
-    if len(new_args) != len(params):
-        vm.error(STypeError(f'Expected {len(params)} arguments, got {len(new_args)}', [
-            args[0].value.line,
-            args[0].value.column
-        ]))
-
-    return new_args
-
-
-def py_to_sap(value, line: int, column: int, **kwargs):
+    """Binds the arguments of a call to parameters that don't have a binder of their own"""
+
+    return param_binder(params)(vm, args)
+
+
+def py_to_sap(value, **kwargs):
     """Converts a python object to a Sapling Node/object
 
     Args:
         value (Any): The python object
-        line (int): The line of execution
-        column (int): The column of execution
 
     Returns:
         Node/object: The Sapling Node/object equivalent of the python object
     """
 
-    from sapling.objects import Nil, Array, Regex, String, Int, Float, Bool, Func, Method, Dictionary
+    from sapling.objects import NIL, Array, Regex, String, Int, Float, Bool, Func, Method, Dictionary
     py_to_sap_map = {
         'str': String,
         'bool': Bool,
@@ -126,20 +185,20 @@ def py_to_sap(value, line: int, column: int, **kwargs):
     }
 
     if value is None:
-        return Nil(line, column)
+        return NIL
 
     if value.__class__.__name__ in py_to_sap_map:
-        return py_to_sap_map[value.__class__.__name__](line, column, value)
+        return py_to_sap_map[value.__class__.__name__](value)
 
     match value.__class__.__name__:
         case 'list':
-            return Array.from_py_iter(value, line, column)
+            return Array.from_py_iter(value)
         case 'dict':
-            return Dictionary.from_py_dict(value, line, column)
+            return Dictionary.from_py_dict(value)
         case 'function':
-            return Func(line, column, value.__name__, value.params, func=value, **kwargs)
+            return Func(value.__name__, value.params, func=value, **kwargs)
         case 'method':
-            return Method(line, column, value.__name__[1:], value.params, func=value, **kwargs)
+            return Method(value.__name__[1:], value.params, func=value, **kwargs)
         case _:
             return value
 